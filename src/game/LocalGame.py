@@ -14,13 +14,13 @@ import json
 import copy
 import random
 import time
+from itertools import islice
 
 # Fix import paths to use direct imports since we're in the game directory
 from characters.LocalCharacter import (
-    LocalMario, LocalLuigi, LocalYoshi, 
-    LocalPopo, LocalNana, LocalLink,
-    SHIELD_COLORS, SHIELD_ALPHA, SHIELD_SIZE
+    LocalCharacter, SHIELD_COLORS, SHIELD_ALPHA, SHIELD_SIZE
 )
+from characters.registry import character_registry
 
 # menus
 from menus.Intro import Intro
@@ -32,12 +32,15 @@ from objects.Platform import Platform
 from settings import *
 from images import *
 from platform_layouts import get_layout  # Import the platform layouts
-from config import PRO_CONTROLLER, DEFAULT_SETTINGS  # Import Pro Controller config
-from input_handler import input_handler, INTENTS  # Import unified input handler
+from config import PRO_CONTROLLER, DEFAULT_SETTINGS, RESERVED_KEYS  # Import Pro Controller config and reserved keys
+from input_handler import input_handler, input_sampler, INTENTS  # Import unified input handler
 from player_controller import PlayerController  # Import the player controller
 from entities.entities import EntitySystem  # Import our entity system
 from sound_player import SoundPlayer  # Import sound player
 from sound_manager import sound_manager  # Import sound manager
+from frame_profiler import frame_profiler  # Import frame/input latency profiler
+from assets import assets  # Import asset manager (display-format surfaces)
+from game_state import GameState, MenuScene, CharacterSelectScene, MatchScene  # Import scene manager
 
 # Add missing color
 YELLOW = (255, 255, 0)
@@ -81,6 +84,7 @@ class LocalGame:
 
         # game variables
         self.screen = pg.display.set_mode(BG_SIZE)
+        assets.convert_all()  # images loaded at import time get the display format now
         self.clock = pg.time.Clock()
         self.status = INTRO
         self.running = True  # game is running
@@ -131,8 +135,8 @@ class LocalGame:
         self.character_options = [MARIO, LUIGI, YOSHI, POPO, NANA, LINK]
 
         # converted background images for optimized game loop
-        self.arena_bg = ARENA_BG.convert()
-        self.chat_bg = CHAT_BG.convert()
+        self.arena_bg = assets.converted(ARENA_BG)
+        self.chat_bg = assets.converted(CHAT_BG)
 
         # chat-like message system (no actual networking)
         self.chat_text = ''
@@ -152,6 +156,7 @@ class LocalGame:
         # Game settings
         self.settings = DEFAULT_SETTINGS.copy()
         self.auto_player2 = self.settings['auto_player2']  # Flag to enable/disable auto-setup of player 2
+        self.auto_player2_character = None  # Picked along with player 1's character so it can preload
         
         # Setup controllers
         self.controllers = {}
@@ -174,6 +179,14 @@ class LocalGame:
                 print("No controllers found. Using keyboard controls only.")
                 self.settings['use_controller'] = False
         
+        # Scenes for each game status (see game_state.py)
+        self.game_state = GameState(self)
+        self.game_state.add_scene(MenuScene(self, INTRO, Intro))
+        self.game_state.add_scene(CharacterSelectScene(self, START, Start))
+        self.game_state.add_scene(MenuScene(self, GUIDE, Other, GUIDE, GUIDE_BG))
+        self.game_state.add_scene(MenuScene(self, ABOUT, Other, ABOUT, ABOUT_BG))
+        self.game_state.add_scene(MatchScene(self, GAME))
+        
         # Start menu background music
         sound_manager.play_background_music('menu')
 
@@ -249,31 +262,9 @@ class LocalGame:
         print("Controllers setup complete\n")
 
     def run(self):
-        # check for the current menu depending on the status
-        while True:
-            if self.status == INTRO:
-                Intro(self)
-
-            elif self.status == START:
-                Start(self)
-
-            elif self.status == GUIDE:
-                Other(self, GUIDE, GUIDE_BG)
-
-            elif self.status == ABOUT:
-                Other(self, ABOUT, ABOUT_BG)
-
-            elif self.status == GAME:
-                self.winner = ''
-
-                if self.initialized and self.playing:
-                    self.checkWinner()
-                    
-                self.clock.tick(FPS)
-                self.current_frame += 1
-                self.events()
-                self.update()
-                self.draw()
+        # the scene for the current status runs until the status changes
+        # (menus) or for one frame (the match) - see game_state.py
+        self.game_state.run()
             
     def new(self):
         # the players will be added after starting the game
@@ -406,17 +397,18 @@ class LocalGame:
                         print(f"Player 1 analog values: horizontal={h_val:.2f}, vertical={v_val:.2f}")
                     print("-----------------------")
 
-            # Collect all events
-            events = pg.event.get()
+            # Collect all events sampled since the last frame, with their times
+            stamped_events = input_sampler.drain()
+            events = [event for _, event in stamped_events]
             
             # Process inputs through the intent-based input handler
             # Let the input handler gather keyboard state internally
-            input_handler.update(events)
+            input_handler.update(events, stamped_events)
             
             # Process each event directly (for quit events and debug toggle)
             for event in events:
                 # Handle P key to spawn bob-omb
-                if event.type == pg.KEYDOWN and event.key == pg.K_p and self.initialized and self.playing:
+                if event.type == pg.KEYDOWN and event.key == RESERVED_KEYS['spawn_bobomb'] and self.initialized and self.playing:
                     # Only allow spawning bob-ombs during play
                     self.spawn_bobomb()
                 
@@ -437,7 +429,7 @@ class LocalGame:
                     quit()
 
                 # Toggle controller debug mode with F1 key
-                if event.type == pg.KEYDOWN and event.key == pg.K_F1:
+                if event.type == pg.KEYDOWN and event.key == RESERVED_KEYS['controller_debug']:
                     self.controller_debug = not self.controller_debug
                     input_handler.set_debug(self.controller_debug)
                     print(f"Controller debug mode: {'ON' if self.controller_debug else 'OFF'}")
@@ -486,7 +478,10 @@ class LocalGame:
             self.current_frame += 1
             
             # Update entity system timers
-            self.entity_system.update_timers(1/60)  # assuming 60 FPS
+            self.entity_system.update_timers()  # one fixed 60 Hz step
+            
+            # Run EveryFrame entity behaviors (only entities that define one are visited)
+            self.entity_system.process_event("EveryFrame")
             
             # IMPORTANT: Process player controller input BEFORE sprite updates
             # This ensures that jump intents and other inputs are processed first
@@ -497,6 +492,9 @@ class LocalGame:
             for sprite in self.all_sprites:
                 if not any(sprite == player_data.get('sprite') for player_data in self.players.values() if 'sprite' in player_data):
                     sprite.update()
+            
+            # Update data-only entities (hazards, projectiles, effects) in bulk
+            self.entity_system.update_world(self.platforms)
                     
             # Then update sprite physics and state for all player sprites
             for name, player_data in self.players.items():
@@ -566,6 +564,10 @@ class LocalGame:
                         # Mark character as checked
                         sprite.initialized_platform_check = True
                     
+            # Entity contacts (OnCollision behaviors) once everything has moved
+            self.entity_system.update_collisions(
+                [player_data['sprite'] for player_data in self.players.values() if 'sprite' in player_data])
+                    
             # Check winner after all updates
             if self.initialized and self.playing:
                 self.checkWinner()
@@ -596,6 +598,9 @@ class LocalGame:
                 temp_group.add(sprite)
             temp_group.draw(self.screen)
             
+            # Data-only entities are drawn in one batched pass
+            self.entity_system.draw_world(self.screen)
+            
             # Then manually call draw for each player sprite to ensure custom draw methods are used
             player_sprites_drawn = 0
             for name, player_data in self.players.items():
@@ -804,11 +809,10 @@ class LocalGame:
         if player2_name == self.player_names[0]:
             player2_name = "Player Two"
             
-        # Choose a random character that's different from Player 1's character
-        available_chars = [char for char in self.character_options if char != self.player_characters[0]]
-        if not available_chars:  # Just in case
-            available_chars = self.character_options
-        player2_char = random.choice(available_chars)
+        # Use the character picked (and preloaded) when Player 1 chose theirs
+        player2_char = self.auto_player2_character
+        if player2_char is None or player2_char == self.player_characters[0]:
+            player2_char = self._pickPlayer2Character()
         
         # Connect player 2
         self.player_names[1] = player2_name
@@ -839,6 +843,13 @@ class LocalGame:
         # Return so the startGame can be called
         return True
     
+    def _pickPlayer2Character(self):
+        # Choose a random character that's different from Player 1's character
+        available_chars = [char for char in self.character_options if char != self.player_characters[0]]
+        if not available_chars:  # Just in case
+            available_chars = self.character_options
+        return random.choice(available_chars)
+    
     # Menu interface compatibility methods
     def connectPlayer(self, name):
         if self.current_player_index < 2:
@@ -896,8 +907,14 @@ class LocalGame:
             # For tracking in our local player state
             if name == self.player_names[0]:
                 self.player_characters[0] = character
+                # Pick the automatic Player 2 now so its fighter preloads with Player 1's
+                if self.auto_player2:
+                    self.auto_player2_character = self._pickPlayer2Character()
             elif name == self.player_names[1]:
                 self.player_characters[1] = character
+            
+            # Prepare the match sounds and fighter frames while the players are still in the menu
+            self.game_state.preload_next()
     
     def editPlayerStatus(self, name, status):
         # Update status in players dict
@@ -939,15 +956,20 @@ class LocalGame:
             "message": "Match started!"
         })
         
+        # Latency and frame time samples are per match
+        frame_profiler.reset()
+        
         # Play start sound
         sound_manager.play_ui_sound('start')
         
         # Stop menu music and start battle music
-        # Select a random stage name for music variety
-        stage_names = list(sound_manager.STAGE_MUSIC.keys())
-        selected_stage = random.choice(stage_names)
+        # The stage was picked (and its music preloaded) during character select
+        selected_stage = sound_manager.take_next_stage()
         sound_manager.play_background_music('battle', stage=selected_stage)
         
+        # Matches are one stock, so decode the victory themes right away
+        sound_manager.preload_victory_music(self.player_characters)
+        
         print(f"====== Started Game! Playing {selected_stage} stage music ======")
         
         # Position players
@@ -965,6 +987,8 @@ class LocalGame:
         self.init_players = copy.deepcopy(self.players)
         
         # Create the actual character sprites
+        # Fighter frames were flipped and scaled in the background during character select;
+        # any the preloader hasn't finished yet are built here instead of waiting on it
         self.createCharacterSprites()
         
         # Set up controllers with character sprites AFTER sprites are created
@@ -986,15 +1010,8 @@ class LocalGame:
             # Create a dictionary to store the sprites by player name for easier reference
             player_sprites = {}
             
-            # Character factory dictionary
-            character_classes = {
-                MARIO: LocalMario,
-                LUIGI: LocalLuigi,
-                YOSHI: LocalYoshi,
-                POPO: LocalPopo,
-                NANA: LocalNana,
-                LINK: LocalLink
-            }
+            # Fighter definitions (characters.json), Mario for unknown characters
+            default_definition = character_registry.get(MARIO)
             
             print(f"Creating characters with GIANT_MODE = {GIANT_MODE_ENABLED}")
             
@@ -1019,11 +1036,11 @@ class LocalGame:
                 player = None
                 # Create the appropriate character using our local character classes
                 try:
-                    # Use factory pattern to get the right character class
-                    character_class = character_classes.get(char, LocalMario)
+                    # Look up the fighter's definition
+                    definition = character_registry.get(char, default_definition)
                     
                     # Create the player with the appropriate parameters
-                    player = character_class(self, name, 'alive', damage_percent, pos, d, w, m)
+                    player = LocalCharacter(self, name, 'alive', damage_percent, pos, d, w, m, definition)
                     
                     # Initialize specific physics properties to ensure proper starting state
                     player.vel = pg.math.Vector2(0, 0)  # Start with no velocity
@@ -1069,14 +1086,14 @@ class LocalGame:
                     print(f"Created {char} for {name} at position {pos[0]}, {player.pos.y}")
                     print(f"Character rect: {player.rect}, midbottom: {player.rect.midbottom}")
                     
-                    if char not in character_classes:
+                    if char not in character_registry:
                         print(f"Character {char} not found, defaulting to Mario")
                 
                 except Exception as char_error:
                     print(f"Error creating character {char}: {char_error}")
                     print("Defaulting to Mario")
                     # If creating a specific character fails, default to Mario
-                    player = LocalMario(self, name, 'alive', damage_percent, pos, d, w, m)
+                    player = LocalCharacter(self, name, 'alive', damage_percent, pos, d, w, m, default_definition)
                 
                 if player:
                     # Store the sprite reference
@@ -1297,10 +1314,12 @@ class LocalGame:
         for name, player_data in self.players.items():
             player_data['damage_percent'] = '0'  # Explicitly set to 0%
         
-        # Reset sprite groups
+        # Reset sprite groups and spawned entities
         self.enemy_sprites = pg.sprite.Group()
         self.all_sprites = pg.sprite.Group()
         self.platforms = pg.sprite.Group()
+        self.entity_system.clear_instances()
+        frame_profiler.reset()
         self.loadPlatforms()
         
         # Reset controllers
@@ -1339,10 +1358,10 @@ class LocalGame:
         # Reset winner
         self.winner = ""
         
-        # Play the battle music again - choose a different stage for variety
-        stage_names = list(sound_manager.STAGE_MUSIC.keys())
-        selected_stage = random.choice(stage_names)
+        # Play the battle music again - a new stage was preloaded during the victory theme
+        selected_stage = sound_manager.take_next_stage()
         sound_manager.play_background_music('battle', stage=selected_stage)
+        sound_manager.preload_victory_music(self.player_characters)
         
         print(f"====== Restarted Game! Playing {selected_stage} stage music ======")
         
@@ -1382,10 +1401,11 @@ class LocalGame:
         self.players = {}
         self.init_players = {}
         
-        # Reset sprite groups
+        # Reset sprite groups and spawned entities
         self.enemy_sprites = pg.sprite.Group()
         self.all_sprites = pg.sprite.Group()
         self.platforms = pg.sprite.Group()
+        self.entity_system.clear_instances()
         self.loadPlatforms()
         
         # Reset winner
@@ -1504,27 +1524,41 @@ class LocalGame:
             return
             
         # Define display parameters
-        font = pg.font.SysFont('Arial', 14)
+        max_display = 5  # Maximum sounds to display
+        
+        # Newest first; the history is already time-ordered
+        shown = list(islice(reversed(recent_sounds), max_display))
+        
+        # Entries under a second old are highlighted, so the panel only
+        # changes when the history does or a highlight expires
+        current_time = time.time()
+        highlighted = sum(1 for sound in shown if current_time - sound[0] < 1.0)
+        cache_key = (sound_manager.recent_sounds_version, highlighted)
+        
+        cached = getattr(self, '_recent_sounds_panel', None)
+        if cached is None or cached[0] != cache_key:
+            cached = self._recent_sounds_panel = (cache_key, self._renderRecentSounds(shown, highlighted))
+        
+        # Position in top right corner with margin
+        self.screen.blit(cached[1], (BG_SIZE[0] - 220, 30))
+    
+    def _renderRecentSounds(self, shown, highlighted):
+        """Render the recent sound effects panel (newest sounds first)"""
+        if not hasattr(self, '_recent_sounds_fonts'):
+            self._recent_sounds_fonts = (pg.font.SysFont('Arial', 14),
+                                         pg.font.SysFont('Arial', 14, bold=True))
+        font, title_font = self._recent_sounds_fonts
         bg_color = (0, 0, 0, 180)  # Semi-transparent black
         text_color = (255, 255, 255)  # White text
         highlight_color = (255, 255, 0)  # Yellow for newest sounds
         border_color = (100, 100, 100)  # Grey border
         
-        # Position in top right corner with margin
-        x = BG_SIZE[0] - 220
-        y = 30
-        
         # Create background surface with transparency
         padding = 10
         line_height = 20
-        max_display = 5  # Maximum sounds to display
-        display_count = min(max_display, len(recent_sounds))
-        
-        # Sort by timestamp (newest first)
-        sorted_sounds = sorted(recent_sounds, key=lambda x: x[0], reverse=True)[:max_display]
         
         # Calculate background height
-        bg_height = (display_count * line_height) + (padding * 2)
+        bg_height = (len(shown) * line_height) + (padding * 2)
         
         # Create semi-transparent background
         bg_surface = pg.Surface((200, bg_height), pg.SRCALPHA)
@@ -1532,29 +1566,22 @@ class LocalGame:
         pg.draw.rect(bg_surface, border_color, (0, 0, 200, bg_height), 1)  # Add border
         
         # Draw title
-        title_font = pg.font.SysFont('Arial', 14, bold=True)
         title_text = title_font.render("Recent Sound Effects", True, highlight_color)
         bg_surface.blit(title_text, (padding, padding))
         
         # Draw each sound
-        current_time = time.time()
-        for i, (timestamp, sound_type, sound_name, description) in enumerate(sorted_sounds):
+        for i, (timestamp, sound_type, sound_name, description) in enumerate(shown):
             # Calculate position (offset for title)
             text_y = (i * line_height) + padding + 20
             
-            # Determine text color based on age (highlight newest sounds)
-            age = current_time - timestamp
-            if age < 1.0:  # Less than 1 second old
-                color = highlight_color
-            else:
-                color = text_color
+            # Highlight the newest sounds (less than 1 second old)
+            color = highlight_color if i < highlighted else text_color
             
             # Render text with description
             text = font.render(description, True, color)
             bg_surface.blit(text, (padding, text_y))
         
-        # Draw the surface
-        self.screen.blit(bg_surface, (x, y))
+        return bg_surface
 
     # Add the bob-omb spawning method
     def spawn_bobomb(self):
@@ -1656,7 +1683,8 @@ class LocalGame:
             "players": self.player_names,
             "characters": player_characters,
             "winner": self.winner,
-            "events": self.match_events
+            "events": self.match_events,
+            "profile": frame_profiler.summary()
         }
         
         # Save to file
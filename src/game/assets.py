@@ -0,0 +1,80 @@
+'''
+Asset Manager for Super Smash Bros
+
+Every surface that gets blitted should come from here. Surfaces are
+converted to the display pixel format exactly once: on load when the
+display mode is already set, otherwise by convert_all() right after
+pg.display.set_mode() (images.py and the button modules load at import
+time, before there is a display). Blitting an unconverted surface makes
+pygame convert its pixels on every blit.
+'''
+
+import pygame as pg
+
+class AssetManager:
+    """Loads images once per path and hands out display-format copies"""
+
+    def __init__(self):
+        self.loaded = {}  # path -> (surface as loaded, alpha)
+        self.converted_surfaces = {}  # id(source) -> (source, converted)
+
+    def display_ready(self):
+        """True once pg.display.set_mode() has been called"""
+        return pg.display.get_surface() is not None
+
+    def load(self, path, alpha=None, convert=True):
+        """
+        Load an image (once per path)
+
+        Args:
+            path: Image file path
+            alpha: True for convert_alpha(), False for convert(), None to
+                pick from the image (per-pixel alpha -> convert_alpha)
+            convert: False to get the surface as loaded, e.g. on a worker
+                thread (only the main thread may convert)
+
+        Returns:
+            pg.Surface: The display-format surface if the display is set,
+            otherwise the surface as loaded (see convert_all)
+        """
+        entry = self.loaded.get(path)
+        if entry is None:
+            entry = self.loaded[path] = (pg.image.load(path), alpha)
+        if not convert:
+            return entry[0]
+        return self.converted(entry[0], entry[1])
+
+    def converted(self, surface, alpha=None):
+        """
+        Get the display-format copy of a surface (converted once, then cached)
+
+        Args:
+            surface: Surface to convert
+            alpha: True for convert_alpha(), False for convert(), None to
+                keep per-pixel alpha only if the surface has it
+
+        Returns:
+            pg.Surface: The converted surface, or surface itself if there is
+            no display yet
+        """
+        entry = self.converted_surfaces.get(id(surface))
+        if entry is not None:
+            return entry[1]
+        if not self.display_ready():
+            return surface
+        if alpha is None:
+            alpha = bool(surface.get_flags() & pg.SRCALPHA)
+        result = surface.convert_alpha() if alpha else surface.convert()
+        # Keep the source alive so its id can't be reused by another surface
+        self.converted_surfaces[id(surface)] = (surface, result)
+        self.converted_surfaces[id(result)] = (result, result)
+        return result
+
+    def convert_all(self):
+        """Convert everything loaded before the display mode was set"""
+        for surface, alpha in self.loaded.values():
+            self.converted(surface, alpha)
+        print(f"Converted {len(self.loaded)} images to the display format")
+
+# Create a global instance
+assets = AssetManager()
@@ -10,6 +10,8 @@ from characters.MeleePhysics import MeleePhysicsMixin  # Import the mixin
 from melee_physics import KNOCKBACK_EXAMPLES, calculate_knockback, calculate_hitstun, knockback_to_velocity  # Import needed constants
 # Import sound manager
 from sound_manager import sound_manager
+from assets import assets
+from characters.registry import character_registry
 
 # Add new animation state
 LANDING = 'landing'
@@ -33,19 +35,21 @@ BASE_KNOCKBACK_Y = 2.0  # Base vertical knockback
 
 # Shield properties
 SHIELD_ALPHA = 190  # Transparency of shield
-# Default shield colors by character
-SHIELD_COLORS = {
-    'Mario': (255, 0, 0),       # Red
-    'Luigi': (0, 255, 0),       # Green
-    'Yoshi': (0, 255, 0),       # Green
-    'Popo': (0, 0, 255),        # Blue
-    'Nana': (255, 0, 255),      # Pink
-    'Link': (0, 255, 255),      # Cyan
-    'default': (255, 255, 255)  # White for any other character
-}
+# Default shield colors by character (set per fighter in characters.json)
+SHIELD_COLORS = {definition.name: definition.shield_color
+                 for definition in character_registry.definitions()}
+SHIELD_COLORS['default'] = (255, 255, 255)  # White for any other character
 SHIELD_SIZE = 80                 # Base shield size
 SHIELD_DURATION = 300           # Max shield frames before breaking (5 seconds at 60 FPS)
 
+# Frame data entry (characters.json) of each timed state
+FRAME_DATA_KEYS = {
+    WEAK_ATTACK: 'weak_attack',
+    HEAVY_ATTACK: 'heavy_attack',
+    LANDING: 'landing',
+    DAMAGED: 'damaged'
+}
+
 # Get shield size accounting for GIANT MODE scaling
 def get_shield_size():
     """Get shield size based on GIANT MODE settings"""
@@ -58,27 +62,94 @@ def get_shield_size():
         
     return shield_size
 
+# Flipped and scaled frames, built once per source image and shared by every
+# sprite of that fighter (and filled ahead of time by preload_character_frames)
+_flipped_frames = {}  # id(source) -> (source, flipped)
+_scaled_frames = {}  # (id(source), scale) -> (source, scaled)
+# Pixel masks of displayed (scaled) frames, built once per frame and shared the same way
+_frame_shapes = {}  # id(frame) -> (frame, mask, bounding rect of the opaque pixels)
+_hitbox_masks = {}  # (id(frame), hitbox) -> (frame, mask)
+
+def flip_frame(image):
+    """Get the horizontally flipped copy of a frame (cached)"""
+    entry = _flipped_frames.get(id(image))
+    if entry is None:
+        entry = _flipped_frames[id(image)] = (image, pg.transform.flip(image, True, False))
+    return entry[1]
+
+def scale_frame(image):
+    """Scale a frame to the character size, accounting for GIANT MODE (cached)"""
+    # Default scale is 2.0 if not specified in settings
+    scale_factor = getattr(sys.modules['settings'], 'CHARACTER_SCALE', 2.0)
+    
+    # Apply GIANT MODE scaling if enabled in settings
+    if getattr(sys.modules['settings'], 'GIANT_MODE_ENABLED', False):
+        scale_factor *= getattr(sys.modules['settings'], 'GIANT_MODE_SCALE_FACTOR', 1.75)
+    
+    key = (id(image), scale_factor)
+    entry = _scaled_frames.get(key)
+    if entry is None:
+        new_width = int(image.get_width() * scale_factor)
+        new_height = int(image.get_height() * scale_factor)
+        entry = _scaled_frames[key] = (image, pg.transform.scale(image, (new_width, new_height)))
+    return entry[1]
+
+def frame_shape(image):
+    """
+    Get the hurtbox shape of a frame: its pixel mask and the bounding rect of
+    its opaque pixels, both in frame space (cached)
+    """
+    entry = _frame_shapes.get(id(image))
+    if entry is None:
+        mask = pg.mask.from_surface(image)
+        rects = mask.get_bounding_rects()
+        bounds = rects[0].unionall(rects[1:]) if rects else image.get_rect()
+        entry = _frame_shapes[id(image)] = (image, mask, bounds)
+    return entry[1], entry[2]
+
+def hitbox_mask(image, hitbox):
+    """
+    Get the hitbox shape of an attack frame: the frame's opaque pixels inside
+    the hitbox rect, as a mask the size of the rect (cached)
+    """
+    key = (id(image), tuple(hitbox))
+    entry = _hitbox_masks.get(key)
+    if entry is None:
+        mask = pg.mask.Mask(hitbox.size)
+        mask.draw(frame_shape(image)[0], (-hitbox.x, -hitbox.y))
+        # A hitbox reaching past the drawn pixels still hits with its whole rect
+        if not mask.count():
+            mask.fill()
+        entry = _hitbox_masks[key] = (image, mask)
+    return entry[1]
+
+def preload_character_frames(definition):
+    """
+    Load and build the flipped and scaled frames of a fighter ahead of time
+    (safe to call from a worker thread - no display conversion happens here)
+    """
+    for frames in definition.frame_sources():
+        for image in (frames if isinstance(frames, list) else (frames,)):
+            scale_frame(image)
+
 vec = pg.math.Vector2
 
 # This is a modified base character class that doesn't rely on hardcoded keyboard input
 class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
-    def __init__(self, game, name, status, health, pos, direc, walk_c, move, 
-                 images_walk_r, images_walk_l, image_stand_r, image_stand_l,
-                 image_weak_r, image_weak_l, image_heavy_r, image_heavy_l,
-                 image_damaged_r, image_damaged_l, image_dead,
-                 weak_damage, heavy_damage, acceleration):
+    def __init__(self, game, name, status, health, pos, direc, walk_c, move, definition):
         pg.sprite.Sprite.__init__(self)
 
         # Identity
         self.name = name
         self.status = status
+        self.definition = definition  # CharacterDefinition from characters.json
         
         # Stats - convert health to damage percentage (starting at 0%)
         self.damage_percent = 0.0  # Damage percentage (Smash Bros style)
-        self.weak = weak_damage
-        self.heavy = heavy_damage
+        self.weak = definition.weak_damage
+        self.heavy = definition.heavy_damage
         # Keep the original acceleration value
-        self.acce = acceleration
+        self.acce = definition.acceleration
         
         # Store original position
         self.original_pos = vec(pos[0], pos[1])
@@ -115,29 +186,35 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
         self.dropping_through_platforms = set()  # Set of platforms being dropped through
         self.is_dropping_through = False  # State flag to track a drop-through in progress
         
+        # Frame data by state - startup/active/recovery frames and hitboxes
+        self.frame_data = {state: definition.frame_data[key] for state, key in FRAME_DATA_KEYS.items()}
+        
         # Attack recovery timers (in frames)
-        self.weak_attack_recovery = 20
-        self.heavy_attack_recovery = 35
-        self.landing_recovery = 10  # Base landing recovery
-        self.damage_stun = 15  # Base stun from taking damage
-        
-        # Get character type for shield color
-        character_type = 'default'
-        for char_name in SHIELD_COLORS.keys():
-            if char_name in self.__class__.__name__:
-                character_type = char_name
-                break
+        self.weak_attack_recovery = self.frame_data[WEAK_ATTACK].total
+        self.heavy_attack_recovery = self.frame_data[HEAVY_ATTACK].total
+        self.landing_recovery = self.frame_data[LANDING].total  # Base landing recovery
+        self.damage_stun = self.frame_data[DAMAGED].total  # Base stun from taking damage
+        
+        # Enemies already hit by the current attack, and its hitbox this frame
+        self.attack_hits = set()
+        self.active_hitbox = None
+        
+        # Sound table key for this fighter, resolved once
+        self.sound_character = sound_manager.resolve_character(definition.name)
         
         # Shield properties
         self.shield_active = False
         self.shield_health = SHIELD_DURATION
         self.shield_surface = None
-        self.shield_color = SHIELD_COLORS.get(character_type, SHIELD_COLORS['default'])
+        self.shield_color = definition.shield_color
         self.shield_radius = SHIELD_SIZE // 2
         self.shield_broken = False
         self.shield_cooldown = 0  # Cooldown after shield break
         
         # Graphics - scale all images to appropriate size
+        (images_walk_r, images_walk_l, image_stand_r, image_stand_l,
+         image_weak_r, image_weak_l, image_heavy_r, image_heavy_l,
+         image_damaged_r, image_damaged_l, image_dead) = definition.frame_sources()
         self.walkR = [self.scale_image(img) for img in images_walk_r]
         self.walkL = [self.scale_image(img) for img in images_walk_l]
         self.standR = self.scale_image(image_stand_r)
@@ -150,6 +227,9 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
         self.damagedL = self.scale_image(image_damaged_l)
         self.dead_image = self.scale_image(image_dead)
         
+        # Animation and hitbox lookups by (state, direction, frame)
+        self.compile_clips()
+        
         # Physics
         self.game = game
         
@@ -185,41 +265,80 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
         # Input flag - whether this character should be controlled by keyboard
         self.process_input = False
         
-        # Initialize Melee physics based on character name
-        character_type = 'generic'
-        if 'mario' in name.lower():
-            character_type = 'mario'
-        elif 'luigi' in name.lower():
-            character_type = 'luigi'
-        
-        self.init_melee_physics(character_type)
+        # Initialize Melee physics from the fighter's definition
+        self.init_melee_physics(definition.physics, weight=definition.weight)
         
         # Create shield surface
         self.create_shield_surface()
     
     def scale_image(self, image):
         """Scale an image to the desired size (accounting for GIANT MODE)"""
-        current_width = image.get_width()
-        current_height = image.get_height()
-        
-        # Calculate the effective scale based on whether GIANT MODE is enabled
-        # Default scale is 2.0 if not specified in settings
-        scale_factor = getattr(sys.modules['settings'], 'CHARACTER_SCALE', 2.0)
-        
-        # Apply GIANT MODE scaling if enabled in settings
-        if getattr(sys.modules['settings'], 'GIANT_MODE_ENABLED', False):
-            giant_scale = getattr(sys.modules['settings'], 'GIANT_MODE_SCALE_FACTOR', 1.75)
-            scale_factor *= giant_scale
-            print(f"GIANT MODE scale factor: {scale_factor}")
-        
-        new_width = int(current_width * scale_factor)
-        new_height = int(current_height * scale_factor)
+        scaled = scale_frame(image)
         
         # Debug output for scaling
         if getattr(sys.modules['settings'], 'GIANT_MODE_ENABLED', False):
-            print(f"Scaling image from {current_width}x{current_height} to {new_width}x{new_height}")
+            print(f"Scaling image from {image.get_width()}x{image.get_height()} to {scaled.get_width()}x{scaled.get_height()}")
             
-        return pg.transform.scale(image, (new_width, new_height))
+        # Converted here rather than in scale_frame, which may run on the preloader thread
+        return assets.converted(scaled)
+
+    def compile_clips(self):
+        """
+        Build the animation and hitbox lookups from the scaled frames and frame data:
+        clips[state][facing_left][frame] is the surface to show and
+        hitboxes[state][facing_left][frame] the attack hitbox (sprite space) or None.
+        Attack clips are indexed by animation_lock_timer, walk by walk_c.
+        With PIXEL_PERFECT_HITS, hit_masks[state][facing_left][frame] holds the
+        matching hitbox masks and every frame's hurtbox mask is built here too.
+        """
+        stand = ((self.standR,), (self.standL,))
+        self.clips = {
+            WALK: (tuple(self.walkR), tuple(self.walkL)),
+            STAND: stand,
+            LANDING: stand,
+            SHIELD: stand,
+            DAMAGED: ((self.damagedR,), (self.damagedL,))
+        }
+        self.hitboxes = {}
+        
+        for state, image_r, image_l in ((WEAK_ATTACK, self.weakR, self.weakL),
+                                        (HEAVY_ATTACK, self.heavyR, self.heavyL)):
+            frame_data = self.frame_data[state]
+            # Frame 0 is the frame the attack starts on, then one entry per frame of the move
+            length = frame_data.total + 1
+            self.clips[state] = ((image_r,) * length, (image_l,) * length)
+            
+            width, height = image_r.get_size()
+            boxes_r = []
+            boxes_l = []
+            for frame in range(length):
+                box = frame_data.hitbox_at(frame)
+                if box is None:
+                    boxes_r.append(None)
+                    boxes_l.append(None)
+                    continue
+                x, y, w, h = box
+                # Fractions are measured from the back edge, so mirror them when facing left
+                boxes_r.append(pg.Rect(round(x * width), round(y * height), round(w * width), round(h * height)))
+                boxes_l.append(pg.Rect(round((1 - x - w) * width), round(y * height), round(w * width), round(h * height)))
+            self.hitboxes[state] = (tuple(boxes_r), tuple(boxes_l))
+        
+        self.hit_masks = None
+        if getattr(sys.modules['settings'], 'PIXEL_PERFECT_HITS', True):
+            # Hurtbox masks for every frame that can be shown
+            for clip in self.clips.values():
+                for frames in clip:
+                    for image in frames:
+                        frame_shape(image)
+            frame_shape(self.dead_image)
+            
+            # Hitbox masks for every active attack frame
+            self.hit_masks = {}
+            for state, hitboxes in self.hitboxes.items():
+                self.hit_masks[state] = tuple(
+                    tuple(None if box is None else hitbox_mask(image, box)
+                          for image, box in zip(frames, boxes))
+                    for frames, boxes in zip(self.clips[state], hitboxes))
 
     def create_shield_surface(self):
         """Create the shield surface with the character's color"""
@@ -261,27 +380,24 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
             print(f"{self.name} can't jump because already in air")
             return False
         
-        # Character type detection for playing the right sound
-        character_type = self.__class__.__name__.replace('Local', '')
-        
         # Apply different upward impulse based on jump type
         if is_short_hop:
             self.vel.y = -10  # Reduced velocity for short hop
             print(f"{self.name} short hopped with velocity {self.vel.y}")
             
             # Play short hop sound
-            sound_manager.play_jump_sound(character=character_type, jump_type='short_hop')
+            sound_manager.play_jump_sound(character=self.sound_character, jump_type='short_hop')
         else:
             self.vel.y = -16  # Full jump velocity
             print(f"{self.name} full jumped with velocity {self.vel.y}")
             
             # Play jump sound based on character type
-            if 'Samus' in self.__class__.__name__:
+            if self.sound_character == 'Samus':
                 # Samus has a special high jump sound
                 sound_manager.play_jump_sound(character='Samus', jump_type='high_jump')
             else:
                 # Standard jump sound
-                sound_manager.play_jump_sound(character=character_type, jump_type='standard')
+                sound_manager.play_jump_sound(character=self.sound_character, jump_type='standard')
             
         self.in_air = True
         self.is_jumping = True
@@ -381,22 +497,14 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
             self.animation_lock_duration = self.weak_attack_recovery
             self.move = WEAK_ATTACK
             
-            # Get character type for sound effects
-            character_type = self.__class__.__name__.replace('Local', '')
-            
             # Play weak attack sound with character voice
-            sound_manager.play_attack_sound('weak', character_type)
+            sound_manager.play_attack_sound('weak', self.sound_character)
             
             # Try to play character-specific attack sound if available
-            sound_manager.play_character_sound(character_type, 'attack_weak')
-            
-            # Check collision with enemies
-            enemy_group = getattr(self, 'enemy_sprites', self.game.enemy_sprites)
-            collided_enemies = pg.sprite.spritecollide(self, enemy_group, False)
-            for enemy in collided_enemies:
-                # Apply damage using percentage system
-                enemy.take_damage(self.weak, self.pos.x)
-                self.game.attackPlayer(enemy.name, self.weak, DAMAGED, self.pos.x)
+            sound_manager.play_character_sound(self.sound_character, 'attack_weak')
+            
+            # Enemies are hit during the attack's active frames (see check_attack_hits)
+            self.attack_hits.clear()
 
     def heavyAttack(self):
         # Only allow attack if not already in an attack animation or damaged
@@ -410,22 +518,14 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
             self.animation_lock_duration = self.heavy_attack_recovery
             self.move = HEAVY_ATTACK
             
-            # Get character type for sound effects
-            character_type = self.__class__.__name__.replace('Local', '')
-            
             # Play heavy attack sound with character voice
-            sound_manager.play_attack_sound('heavy', character_type)
+            sound_manager.play_attack_sound('heavy', self.sound_character)
             
             # Try to play character-specific attack sound if available
-            sound_manager.play_character_sound(character_type, 'attack_heavy')
-            
-            # Check collision with enemies
-            enemy_group = getattr(self, 'enemy_sprites', self.game.enemy_sprites)
-            collided_enemies = pg.sprite.spritecollide(self, enemy_group, False)
-            for enemy in collided_enemies:
-                # Apply damage using percentage system
-                enemy.take_damage(self.heavy, self.pos.x)
-                self.game.attackPlayer(enemy.name, self.heavy, DAMAGED, self.pos.x)
+            sound_manager.play_character_sound(self.sound_character, 'attack_heavy')
+            
+            # Enemies are hit during the attack's active frames (see check_attack_hits)
+            self.attack_hits.clear()
     
     def update(self):
         # Disable emergency reset - we have a better solution now
@@ -729,6 +829,48 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
         # Final update to collision rectangle
         self.rect = self.image.get_rect()
         self.rect.midbottom = self.pos
+        
+        # Hit enemies if this is an active frame of an attack
+        self.check_attack_hits()
+    
+    def check_attack_hits(self):
+        """
+        Hit enemies overlapping the current attack frame's hitbox (each enemy once per attack).
+        Rects are tested first; with PIXEL_PERFECT_HITS the cached masks then confirm the hit.
+        """
+        self.active_hitbox = None
+        hitboxes = self.hitboxes.get(self.move)
+        if hitboxes is None:
+            return
+        facing_left = self.direc == LEFT
+        frame = min(self.animation_lock_timer, len(hitboxes[facing_left]) - 1)
+        box = hitboxes[facing_left][frame]
+        if box is None:
+            return
+        
+        self.active_hitbox = hitbox = box.move(self.rect.topleft)
+        hit_mask = self.hit_masks[self.move][facing_left][frame] if self.hit_masks is not None else None
+        damage = self.weak if self.move == WEAK_ATTACK else self.heavy
+        enemy_group = getattr(self, 'enemy_sprites', self.game.enemy_sprites)
+        for enemy in enemy_group:
+            if enemy in self.attack_hits:
+                continue
+            if hit_mask is None:
+                # Hitbox against the enemy's sprite rect
+                if not hitbox.colliderect(enemy.rect):
+                    continue
+            else:
+                # Broadphase: hitbox against the bounds of the enemy frame's opaque pixels
+                hurt_mask, hurt_bounds = frame_shape(enemy.image)
+                if not hitbox.colliderect(hurt_bounds.move(enemy.rect.topleft)):
+                    continue
+                # Narrowphase: attack pixels against the enemy frame's pixels
+                if not hit_mask.overlap(hurt_mask, (enemy.rect.x - hitbox.x, enemy.rect.y - hitbox.y)):
+                    continue
+            self.attack_hits.add(enemy)
+            # Apply damage using percentage system
+            enemy.take_damage(damage, self.pos.x)
+            self.game.attackPlayer(enemy.name, damage, DAMAGED, self.pos.x)
     
     def check_ground_beneath(self):
         """Check if there's actually ground beneath us when we think we're grounded"""
@@ -791,53 +933,18 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
         # Animation frame counter for controlling animation speed
         self.animation_frame_counter += 1
         
-        # Update walk animations at a normal speed (every 5 frames - same as other animations)
-        should_update = self.animation_frame_counter % 5 == 0
-        
         if self.damage_percent >= 999:
             self.image = self.dead_image
             return
-
-        # First check shield state
-        if self.shield_active:
-            # Use standing sprite when shielding
-            if self.direc == LEFT:
-                self.image = self.standL
-            else:
-                self.image = self.standR
-        elif self.move == WALK:
-            # Handle normal animation states
-            walk_frame = min(self.walk_c, len(self.walkL) - 1)  # Prevents index errors
-            if self.direc == LEFT:
-                self.image = self.walkL[walk_frame]
-            else:
-                self.image = self.walkR[walk_frame]
-        elif self.move == STAND:
-            if self.direc == LEFT:
-                self.image = self.standL
-            else:
-                self.image = self.standR
-        elif self.move == WEAK_ATTACK:
-            if self.direc == LEFT:
-                self.image = self.weakL
-            else:
-                self.image = self.weakR
-        elif self.move == HEAVY_ATTACK:
-            if self.direc == LEFT:
-                self.image = self.heavyL
-            else:
-                self.image = self.heavyR
-        elif self.move == DAMAGED:
-            if self.direc == LEFT:
-                self.image = self.damagedL
-            else:
-                self.image = self.damagedR
-        elif self.move == LANDING:
-            # Use standing sprite for landing
-            if self.direc == LEFT:
-                self.image = self.standL
-            else:
-                self.image = self.standR
+        
+        # Shielding shows the standing frame whatever the move
+        state = SHIELD if self.shield_active else self.move
+        clip = self.clips.get(state)
+        if clip is None:
+            return
+        frames = clip[self.direc == LEFT]
+        frame = self.walk_c if state == WALK else self.animation_lock_timer
+        self.image = frames[min(frame, len(frames) - 1)]  # Prevents index errors
                 
     def draw(self, surface):
         """Draw the character and shield"""
@@ -892,6 +999,10 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
             # Draw position dot
             pg.draw.circle(surface, (0, 255, 0), (int(self.pos.x), int(self.pos.y)), 3)
             
+            # Draw the attack hitbox on active frames
+            if self.active_hitbox is not None:
+                pg.draw.rect(surface, (255, 255, 0), self.active_hitbox, 1)
+            
             # Draw damage percentage
             font = pg.font.SysFont('Arial', 14)
             damage_text = font.render(f"{self.damage_percent:.1f}%", True, (255, 0, 0))
@@ -1022,11 +1133,8 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
             # Increase damage percentage
             self.damage_percent += damage
             
-            # Get character type for sound effects
-            character_type = self.__class__.__name__.replace('Local', '')
-            
             # Play damage sound with character voice
-            sound_manager.play_damage_sound(damage, character_type)
+            sound_manager.play_damage_sound(damage, self.sound_character)
             
             # Calculate knockback
             if 'calculate_knockback' in globals():
@@ -1088,11 +1196,7 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
                 self.hitstun_frames = int(knockback * 0.4)  # Same factor as in calculate_hitstun
             
             # Set tumble state if knockback exceeds threshold
-            if 'LAUNCH_AND_STUN' in globals():
-                self.tumble_state = knockback >= LAUNCH_AND_STUN['tumble_threshold']
-            else:
-                # Default threshold if not defined
-                self.tumble_state = knockback >= 80
+            self.tumble_state = knockback >= self.physics.tumble_threshold
             
             # Enter damage state
             self.move = DAMAGED
@@ -1166,16 +1270,10 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
     def apply_landing_lag_with_melee_physics(self, was_aerial_attack=False):
         """Apply landing lag with Melee physics rules"""
         try:
-            # Make sure melee settings are available
-            if 'LANDING_LAG' not in globals():
-                print("Warning: LANDING_LAG settings not found, using defaults")
-                normal_landing_lag = 4
-                aerial_landing_lag = 12 if was_aerial_attack else 4
-                l_cancel_factor = 0.5
-            else:
-                normal_landing_lag = LANDING_LAG['normal_landing_lag_frames']
-                aerial_landing_lag = was_aerial_attack and 12 or normal_landing_lag
-                l_cancel_factor = LANDING_LAG['l_cancel_factor']
+            # Landing lag values from the compiled physics profile
+            normal_landing_lag = self.physics.normal_landing_lag_frames
+            aerial_landing_lag = 12 if was_aerial_attack else normal_landing_lag
+            l_cancel_factor = self.physics.l_cancel_factor
                 
             # Determine base landing lag
             landing_lag_frames = normal_landing_lag
@@ -1209,147 +1307,3 @@ class LocalCharacter(pg.sprite.Sprite, MeleePhysicsMixin):
             import traceback
             traceback.print_exc()
             return 4  # Default fallback
-
-# Create local character versions of each character
-
-# Mario - has maM1 through maM7
-class LocalMario(LocalCharacter):
-    def __init__(self, game, name, status, health, pos, direc, walk_c, move):
-        # Remove standing sprite from walk animation
-        walkR = [maM1, maM2, maM3, maM4, maM5, maM6, maM7]
-        walkL = [pg.transform.flip(image, True, False) for image in walkR]
-        standR = maS1
-        standL = pg.transform.flip(standR, True, False)
-        weakR = maW1
-        weakL = pg.transform.flip(weakR, True, False)
-        heavyR = maH1
-        heavyL = pg.transform.flip(heavyR, True, False)
-        damagedR = maD1
-        damagedL = pg.transform.flip(damagedR, True, False)
-        
-        super().__init__(
-            game, name, status, health, pos, direc, walk_c, move,
-            walkR, walkL, standR, standL, 
-            weakR, weakL, heavyR, heavyL,
-            damagedR, damagedL, dead,
-            3, 6, 0.5  # weak damage, heavy damage, acceleration
-        )
-        # Ensure Mario uses mario physics
-        self.init_melee_physics('mario')
-
-# Luigi - has luM1 through luM8
-class LocalLuigi(LocalCharacter):
-    def __init__(self, game, name, status, health, pos, direc, walk_c, move):
-        # Remove standing sprite from walk animation
-        walkR = [luM1, luM2, luM3, luM4, luM5, luM6, luM7, luM8]
-        walkL = [pg.transform.flip(image, True, False) for image in walkR]
-        standR = luS1
-        standL = pg.transform.flip(standR, True, False)
-        weakR = luW1
-        weakL = pg.transform.flip(weakR, True, False)
-        heavyR = luH1
-        heavyL = pg.transform.flip(heavyR, True, False)
-        damagedR = luD1
-        damagedL = pg.transform.flip(damagedR, True, False)
-        
-        super().__init__(
-            game, name, status, health, pos, direc, walk_c, move,
-            walkR, walkL, standR, standL, 
-            weakR, weakL, heavyR, heavyL,
-            damagedR, damagedL, dead,
-            4, 8, 0.4  # weak damage, heavy damage, acceleration
-        )
-        # Ensure Luigi uses luigi physics
-        self.init_melee_physics('luigi')
-
-# Yoshi - has yoM1 through yoM8
-class LocalYoshi(LocalCharacter):
-    def __init__(self, game, name, status, health, pos, direc, walk_c, move):
-        # Remove standing sprite from walk animation
-        walkR = [yoM1, yoM2, yoM3, yoM4, yoM5, yoM6, yoM7, yoM8]
-        walkL = [pg.transform.flip(image, True, False) for image in walkR]
-        standR = yoS1
-        standL = pg.transform.flip(standR, True, False)
-        weakR = yoW1
-        weakL = pg.transform.flip(weakR, True, False)
-        heavyR = yoH1
-        heavyL = pg.transform.flip(heavyR, True, False)
-        damagedR = yoD1
-        damagedL = pg.transform.flip(damagedR, True, False)
-        
-        super().__init__(
-            game, name, status, health, pos, direc, walk_c, move,
-            walkR, walkL, standR, standL, 
-            weakR, weakL, heavyR, heavyL,
-            damagedR, damagedL, dead,
-            5, 10, 0.3  # weak damage, heavy damage, acceleration
-        )
-
-# Popo
-class LocalPopo(LocalCharacter):
-    def __init__(self, game, name, status, health, pos, direc, walk_c, move):
-        # Popo only has 3 movement sprites - remove standing sprite
-        walkL = [poM1, poM2, poM3]
-        walkR = [pg.transform.flip(image, True, False) for image in walkL]
-        standL = poS1
-        standR = pg.transform.flip(standL, True, False)
-        weakL = poW1
-        weakR = pg.transform.flip(weakL, True, False)
-        heavyL = poH1
-        heavyR = pg.transform.flip(heavyL, True, False)
-        damagedL = poD1
-        damagedR = pg.transform.flip(damagedL, True, False)
-        
-        super().__init__(
-            game, name, status, health, pos, direc, walk_c, move,
-            walkR, walkL, standR, standL, 
-            weakR, weakL, heavyR, heavyL,
-            damagedR, damagedL, dead,
-            5.5, 11, 0.25  # weak damage, heavy damage, acceleration
-        )
-
-# Nana
-class LocalNana(LocalCharacter):
-    def __init__(self, game, name, status, health, pos, direc, walk_c, move):
-        # Nana only has 3 movement sprites - remove standing sprite
-        walkL = [naM1, naM2, naM3]
-        walkR = [pg.transform.flip(image, True, False) for image in walkL]
-        standL = naS1
-        standR = pg.transform.flip(standL, True, False)
-        weakL = naW1
-        weakR = pg.transform.flip(weakL, True, False)
-        heavyL = naH1
-        heavyR = pg.transform.flip(heavyL, True, False)
-        damagedL = naD1
-        damagedR = pg.transform.flip(damagedL, True, False)
-        
-        super().__init__(
-            game, name, status, health, pos, direc, walk_c, move,
-            walkR, walkL, standR, standL, 
-            weakR, weakL, heavyR, heavyL,
-            damagedR, damagedL, dead,
-            5, 10, 0.3  # weak damage, heavy damage, acceleration
-        )
-
-# Link
-class LocalLink(LocalCharacter):
-    def __init__(self, game, name, status, health, pos, direc, walk_c, move):
-        # Remove standing sprite from walk animation
-        walkR = [liM1, liM2, liM3, liM4, liM5, liM6, liM7, liM8]
-        walkL = [pg.transform.flip(image, True, False) for image in walkR]
-        standR = liS1
-        standL = pg.transform.flip(standR, True, False)
-        weakR = liW1
-        weakL = pg.transform.flip(weakR, True, False)
-        heavyR = liH1
-        heavyL = pg.transform.flip(heavyR, True, False)
-        damagedR = liD1
-        damagedL = pg.transform.flip(damagedR, True, False)
-        
-        super().__init__(
-            game, name, status, health, pos, direc, walk_c, move,
-            walkR, walkL, standR, standL, 
-            weakR, weakL, heavyR, heavyL,
-            damagedR, damagedL, dead,
-            5, 10, 0.3  # weak damage, heavy damage, acceleration
-        ) 
\ No newline at end of file
@@ -27,8 +27,16 @@ class MeleePhysicsMixin:
     This is designed to work with the LocalCharacter class.
     """
     
-    def init_melee_physics(self, character_type='generic'):
-        """Initialize Melee physics values"""
+    def init_melee_physics(self, character_type='generic', weight=None):
+        """
+        Initialize Melee physics values
+
+        Args:
+            character_type: Physics table key ('mario', 'luigi', 'generic')
+            weight: Knockback weight override (None uses the table's weight)
+
+        Per-frame code reads self.physics, the character's shared PhysicsProfile.
+        """
         self.character_type = character_type.lower()
         
         # Set character dimensions - adjust for GIANT MODE if enabled
@@ -55,28 +63,27 @@ class MeleePhysicsMixin:
         self.l_cancel_window = 0
         self.l_cancel_successful = False
         
-        # Get physics values for the character type, defaulting to generic if not found
-        self.ground_physics = GROUND_MOVEMENT.get(self.character_type, GROUND_MOVEMENT['generic'])
-        self.air_physics = AIR_MOVEMENT.get(self.character_type, AIR_MOVEMENT['generic'])
-        self.weight = KNOCKBACK['weight'].get(self.character_type, KNOCKBACK['weight']['generic'])
+        # Compiled physics values for the character type (see melee_physics.physics_profile)
+        self.physics = physics_profile(self.character_type, weight)
         
         # Adjust physics values for GIANT MODE if enabled
         if getattr(sys.modules['settings'], 'GIANT_MODE_ENABLED', False):
             # Giant characters are typically slower but have more powerful attacks
-            self.weight *= 1.5  # Make giant characters heavier (more resistant to knockback)
+            # Make giant characters heavier (more resistant to knockback)
+            self.physics = physics_profile(self.character_type, self.physics.weight * 1.5)
             
             # Modify ground acceleration for GIANT MODE
-            base_accel = self.ground_physics['ground_accel_base'] + self.ground_physics['ground_accel_additional']
-            self.acce = base_accel * 0.85  # Slightly reduce acceleration for giants
+            self.acce = self.physics.ground_accel * 0.85  # Slightly reduce acceleration for giants
         else:
             # Override acceleration with standard Melee values
-            self.acce = self.ground_physics['ground_accel_base'] + self.ground_physics['ground_accel_additional']
+            self.acce = self.physics.ground_accel
+        self.weight = self.physics.weight
         
         # Print debug info
         print(f"Initialized Melee physics for {self.name} as {character_type}")
-        print(f"  Ground Speed: {self.ground_physics['walk_speed']}")
-        print(f"  Air Speed: {self.air_physics['air_speed']}")
-        print(f"  Gravity: {self.air_physics['gravity']}")
+        print(f"  Ground Speed: {self.physics.walk_speed}")
+        print(f"  Air Speed: {self.physics.air_speed}")
+        print(f"  Gravity: {self.physics.gravity}")
         print(f"  Weight: {self.weight}")
         if getattr(sys.modules['settings'], 'GIANT_MODE_ENABLED', False):
             giant_scale = getattr(sys.modules['settings'], 'GIANT_MODE_SCALE_FACTOR', 1.75)
@@ -103,7 +110,7 @@ class MeleePhysicsMixin:
             # In dash state
             if self.is_dashing:
                 self.dash_frame_counter += 1
-                if self.dash_frame_counter >= self.ground_physics['dash_to_run_transition_frames']:
+                if self.dash_frame_counter >= self.physics.dash_to_run_transition_frames:
                     # Transition to run after dash frames
                     self.is_dashing = False
                     self.is_running = True
@@ -141,11 +148,11 @@ class MeleePhysicsMixin:
             
         if is_short_hop:
             # Short hop with lower Melee velocity
-            self.vel.y = -self.air_physics['fall_speed'] * 0.8  # Lower multiplier for short hop
+            self.vel.y = -self.physics.fall_speed * 0.8  # Lower multiplier for short hop
             print(f"{self.name} Melee short hop with velocity {self.vel.y}")
         else:
             # Regular jump with Melee velocity
-            self.vel.y = -self.air_physics['fall_speed'] * 1.5
+            self.vel.y = -self.physics.fall_speed * 1.5
             print(f"{self.name} Melee full jump with velocity {self.vel.y}")
             
         self.in_air = True
@@ -235,13 +242,8 @@ class MeleePhysicsMixin:
                 self.hitstun_frames = int(knockback * 0.4)  # Same factor as in calculate_hitstun
             
             # Set tumble state if knockback exceeds threshold
-            if 'LAUNCH_AND_STUN' in globals():
-                self.tumble_state = knockback >= LAUNCH_AND_STUN['tumble_threshold']
-                tumble_threshold = LAUNCH_AND_STUN['tumble_threshold']
-            else:
-                # Default threshold if not defined
-                tumble_threshold = 80
-                self.tumble_state = knockback >= tumble_threshold
+            tumble_threshold = self.physics.tumble_threshold
+            self.tumble_state = knockback >= tumble_threshold
             
             # Record tumble event if threshold exceeded
             if self.tumble_state and hasattr(self, 'game') and hasattr(self.game, 'record_event'):
@@ -322,7 +324,7 @@ class MeleePhysicsMixin:
             # Determine base landing lag frames
             if was_aerial_attack:
                 # Use aerial landing lag range
-                min_lag, max_lag = LANDING_LAG['aerial_lag_frames_range']
+                min_lag, max_lag = self.physics.aerial_lag_min_frames, self.physics.aerial_lag_max_frames
                 
                 # Scale base lag based on move strength (example implementation)
                 # In a real game this would be move-specific
@@ -331,7 +333,7 @@ class MeleePhysicsMixin:
                 
                 # Apply L-cancel if within window
                 if self.l_cancel_window > 0:
-                    base_lag_frames *= LANDING_LAG['l_cancel_factor']
+                    base_lag_frames *= self.physics.l_cancel_factor
                     self.l_cancel_successful = True
                     print(f"{self.name} successfully L-canceled!")
                     
@@ -342,7 +344,7 @@ class MeleePhysicsMixin:
                     self.l_cancel_successful = False
             else:
                 # Normal landing
-                base_lag_frames = LANDING_LAG['normal_landing_lag_frames']
+                base_lag_frames = self.physics.normal_landing_lag_frames
                 self.l_cancel_successful = False
             
             # Set landing lag and animation lock
@@ -401,7 +403,7 @@ class MeleePhysicsMixin:
         Should be called when shield button is pressed while in air
         """
         if self.in_air:
-            self.l_cancel_window = LANDING_LAG['l_cancel_window_frames']
+            self.l_cancel_window = self.physics.l_cancel_window_frames
             print(f"{self.name} attempting L-cancel")
     
     def try_dash_dance(self, new_direction):
@@ -0,0 +1,159 @@
+'''
+Character Registry
+
+Every fighter is described by an entry in characters.json: its frames,
+weak/heavy damage, acceleration, weight, physics profile, frame data and
+shield color.
+Only the numbers are read up front; a fighter's frames are loaded from
+disk (and flipped) the first time it is picked, so fighters nobody picks
+cost no load time or memory.
+
+Adding a character means adding its images under images/characters/<folder>
+and an entry in characters.json - no new class.
+'''
+
+import os
+import json
+import threading
+from collections import OrderedDict
+from assets import assets
+
+# Fighter definitions, in character select order
+DEFINITIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'characters.json')
+
+# Frame images live in images/characters/<folder>/<frame>.png
+IMAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'images', 'characters')
+DEAD_PATH = os.path.join(IMAGE_DIR, 'dead.png')
+
+# Frame data shared by every fighter. A fighter's "frame_data" entry in
+# characters.json only lists the values that differ, per move
+DEFAULT_FRAME_DATA = {
+    'weak_attack': {'startup': 3, 'active': 4, 'recovery': 13,
+                    'hitboxes': [[0.45, 0.15, 0.55, 0.6]]},
+    'heavy_attack': {'startup': 8, 'active': 5, 'recovery': 22,
+                     'hitboxes': [[0.4, 0.2, 0.6, 0.6], [0.4, 0.1, 0.6, 0.8]]},
+    'landing': {'recovery': 10},
+    'damaged': {'recovery': 15},
+}
+
+class MoveFrameData:
+    """
+    Frame data of one move: startup, active and recovery frames, and the
+    hitbox of each active frame.
+
+    Hitboxes are [x, y, w, h] fractions of the move's frame image, measured
+    from the fighter's back edge and top (so they mirror with the fighter).
+    A move with fewer hitboxes than active frames repeats the last one.
+    """
+    __slots__ = ('startup', 'active', 'recovery', 'total', 'hitboxes')
+
+    def __init__(self, data):
+        self.startup = data.get('startup', 0)
+        self.active = data.get('active', 0)
+        self.recovery = data.get('recovery', 0)
+        self.total = self.startup + self.active + self.recovery
+        self.hitboxes = tuple(tuple(box) for box in data.get('hitboxes', ()))
+
+    def hitbox_at(self, frame):
+        """Hitbox fractions on a frame of the move (1-based), or None outside the active frames"""
+        index = frame - self.startup - 1
+        if not self.hitboxes or index < 0 or index >= self.active:
+            return None
+        return self.hitboxes[min(index, len(self.hitboxes) - 1)]
+
+class CharacterDefinition:
+    """One fighter from characters.json; frame_sources() loads its frames on first use"""
+
+    def __init__(self, name, data):
+        self.name = name
+        self.folder = data.get('folder', name.lower())
+        self.facing = data.get('facing', 'right')  # direction the source images face
+        self.frame_names = data['frames']
+        self.weak_damage = data['weak_damage']
+        self.heavy_damage = data['heavy_damage']
+        self.acceleration = data['acceleration']
+        self.weight = data.get('weight')  # None -> the physics profile's weight
+        self.physics = data.get('physics', 'generic')
+        self.shield_color = tuple(data.get('shield_color', (255, 255, 255)))
+        overrides = data.get('frame_data', {})
+        self.frame_data = {move: MoveFrameData(dict(DEFAULT_FRAME_DATA.get(move, {}), **overrides.get(move, {})))
+                           for move in set(DEFAULT_FRAME_DATA) | set(overrides)}
+        self._sources = None
+        self._lock = threading.Lock()
+
+    def _load(self, path):
+        # Not converted here - this may run on the scene preloader thread
+        return assets.load(path, convert=False)
+
+    def _frame(self, frame):
+        return self._load(os.path.join(IMAGE_DIR, self.folder, frame + '.png'))
+
+    def frame_sources(self):
+        """
+        Get the fighter's unscaled frames, loading them on first use
+
+        Returns:
+            tuple: (walkR, walkL, standR, standL, weakR, weakL, heavyR, heavyL,
+                    damagedR, damagedL, dead) - walk entries are lists
+        """
+        with self._lock:
+            if self._sources is None:
+                # Imported here to avoid a circular import (LocalCharacter uses the registry)
+                from characters.LocalCharacter import flip_frame
+                
+                names = self.frame_names
+                walk = [self._frame(frame) for frame in names['walk']]
+                singles = [self._frame(names[move]) for move in ('stand', 'weak_attack', 'heavy_attack', 'damaged')]
+                
+                # Sources face one way; the other direction is flipped
+                if self.facing == 'left':
+                    walk_pair = ([flip_frame(image) for image in walk], walk)
+                    pairs = [(flip_frame(image), image) for image in singles]
+                else:
+                    walk_pair = (walk, [flip_frame(image) for image in walk])
+                    pairs = [(image, flip_frame(image)) for image in singles]
+                
+                sources = list(walk_pair)
+                for pair in pairs:
+                    sources.extend(pair)
+                sources.append(self._load(DEAD_PATH))
+                self._sources = tuple(sources)
+        return self._sources
+
+    def stats(self):
+        """Weak damage, heavy damage and speed as shown on the character select screen"""
+        return (f"{self.weak_damage:g}", f"{self.heavy_damage:g}", f"{round(self.acceleration * 100):g}")
+
+class CharacterRegistry:
+    """All fighter definitions by character name (settings.MARIO, ...)"""
+
+    def __init__(self, path=DEFINITIONS_PATH):
+        self.path = path
+        self._definitions = None
+
+    def _load(self):
+        if self._definitions is None:
+            with open(self.path, 'r') as f:
+                data = json.load(f, object_pairs_hook=OrderedDict)
+            self._definitions = OrderedDict(
+                (name, CharacterDefinition(name, entry)) for name, entry in data.items())
+            print(f"Loaded {len(self._definitions)} character definitions from {os.path.basename(self.path)}")
+        return self._definitions
+
+    def get(self, name, default=None):
+        """Get the definition for a character name, or default"""
+        return self._load().get(name, default)
+
+    def names(self):
+        """Character names in character select order"""
+        return list(self._load())
+
+    def definitions(self):
+        """Definitions in character select order"""
+        return list(self._load().values())
+
+    def __contains__(self, name):
+        return name in self._load()
+
+# Create a global instance
+character_registry = CharacterRegistry()
@@ -9,8 +9,10 @@ PLAYER1_CONTROLS = {
     'up': pg.K_UP,
     'left': pg.K_LEFT,
     'right': pg.K_RIGHT,
+    'down': pg.K_DOWN,
     'weak_attack': pg.K_z,
-    'heavy_attack': pg.K_x
+    'heavy_attack': pg.K_x,
+    'shield': pg.K_LSHIFT
 }
 
 # Player 2 controls
@@ -18,17 +20,50 @@ PLAYER2_CONTROLS = {
     'up': pg.K_w,
     'left': pg.K_a,
     'right': pg.K_d,
+    'down': pg.K_s,
     'weak_attack': pg.K_g,
-    'heavy_attack': pg.K_h
+    'heavy_attack': pg.K_h,
+    'shield': pg.K_e
 }
 
-# Controls for game management
+# Player 3 controls
+PLAYER3_CONTROLS = {
+    'up': pg.K_i,
+    'left': pg.K_j,
+    'right': pg.K_l,
+    'down': pg.K_k,
+    'weak_attack': pg.K_o,
+    'heavy_attack': pg.K_y,
+    'shield': pg.K_u
+}
+
+# Player 4 controls
+PLAYER4_CONTROLS = {
+    'up': pg.K_KP8,
+    'left': pg.K_KP4,
+    'right': pg.K_KP6,
+    'down': pg.K_KP5,
+    'weak_attack': pg.K_KP1,
+    'heavy_attack': pg.K_KP2,
+    'shield': pg.K_KP0
+}
+
+# Keyboard layouts in player order; players beyond this list need a controller
+KEYBOARD_LAYOUTS = [PLAYER1_CONTROLS, PLAYER2_CONTROLS, PLAYER3_CONTROLS, PLAYER4_CONTROLS]
+
+# Controls for game management (shared by every keyboard player)
 GAME_CONTROLS = {
     'restart': pg.K_r,
-    'menu': pg.K_m,
+    'menu': pg.K_ESCAPE,
     'quit': pg.K_q
 }
 
+# Keys LocalGame.events handles itself - no player layout may bind them
+RESERVED_KEYS = {
+    'spawn_bobomb': pg.K_p,
+    'controller_debug': pg.K_F1
+}
+
 # Switch Pro Controller button mapping
 # These are default values that can be changed based on user preferences
 # Button indices may vary between controllers and systems
@@ -84,10 +119,10 @@ PLAYER2_DIRECTION = 'left'
 DEFAULT_HEALTH = 100.0
 
 def get_player_controls(player_index):
-    """Get the control scheme for a specific player"""
-    if player_index == 0:
-        return PLAYER1_CONTROLS
-    return PLAYER2_CONTROLS
+    """Get the keyboard layout for a specific player (None if there isn't one)"""
+    if player_index < len(KEYBOARD_LAYOUTS):
+        return KEYBOARD_LAYOUTS[player_index]
+    return None
 
 def get_player_initial_position(player_index):
     """Get the initial position for a specific player"""
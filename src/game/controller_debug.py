@@ -99,7 +99,7 @@ def main():
     # Create a test player
     test_player = "TestPlayer"
     input_handler.add_player(test_player, is_player_one=True)
-    print(f"Test player added: {test_player in input_handler.player_intents}")
+    print(f"Test player added: {test_player in input_handler.intent_masks}")
     
     # Check if controller was initialized for the test player
     if test_player in input_handler.controllers:
@@ -148,7 +148,8 @@ def main():
     
     while running:
         # Event handling
-        for event in pg.event.get():
+        events = pg.event.get()
+        for event in events:
             if event.type == pg.QUIT:
                 running = False
             elif event.type == pg.KEYDOWN:
@@ -174,10 +175,10 @@ def main():
                 print(f"Hat {event.hat} motion: {event.value}")
         
         # Process inputs in input handler (similar to game loop)
-        input_handler.update(pg.event.get(), pg.key.get_pressed())
+        input_handler.update(events)
         
         # Test intent processing
-        if test_stage >= 3 and test_player in input_handler.player_intents:
+        if test_stage >= 3 and test_player in input_handler.intent_masks:
             # Check which intents are active
             active_intents = []
             
@@ -0,0 +1,62 @@
+# ================================================================
+#  collisions.py  (broadphase + contact tracking for entity events)
+# ================================================================
+#  Each frame the entity system hands over axis-aligned boxes for
+#  every entity and fighter.  A sweep-and-prune pass along x finds
+#  the overlapping pairs in O(n log n + k) instead of testing every
+#  pair, and ContactTracker diffs them against last frame so only
+#  contacts that begin, persist or end are reported.
+# ================================================================
+from __future__ import annotations
+from operator import itemgetter
+from typing import Any, Hashable, List, Set, Tuple
+
+# Box layout: (left, right, top, bottom, key, group)
+#   key   - the object reported in contacts (sprite or ECS handle)
+#   group - boxes sharing a non-None group never collide with each
+#           other (fighters vs fighters is handled by the attack code)
+Box = Tuple[float, float, float, float, Hashable, Any]
+
+_by_left = itemgetter(0)
+
+def rect_box(rect, key, group=None) -> Box:
+    return (rect.left, rect.right, rect.top, rect.bottom, key, group)
+
+def sweep_and_prune(boxes:List[Box]) -> Set[Tuple[Hashable,Hashable]]:
+    """
+    Return the overlapping pairs among boxes (same strict-overlap rule as
+    Rect.colliderect).  Pairs are ordered by their position in the sorted
+    sweep, so callers should treat (a, b) and (b, a) as the same contact.
+    """
+    boxes.sort(key=_by_left)
+    pairs = set()
+    active:List[Box] = []
+    for box in boxes:
+        left, right, top, bottom, key, group = box
+        # Drop boxes that end before this one starts
+        if active:
+            active = [a for a in active if a[1] > left]
+        for a in active:
+            if a[2] < bottom and top < a[3] and (group is None or a[5] != group):
+                pairs.add((a[4], key) if id(a[4]) < id(key) else (key, a[4]))
+        active.append(box)
+    return pairs
+
+class ContactTracker:
+    """Remembers last frame's contacts to classify this frame's pairs."""
+    def __init__(self):
+        self.contacts:Set[Tuple[Hashable,Hashable]] = set()
+
+    def update(self, boxes:List[Box]):
+        """Returns (began, persisted, ended) lists of (a, b) pairs."""
+        current = sweep_and_prune(boxes)
+        previous = self.contacts
+        self.contacts = current
+        if not current and not previous:
+            return (), (), ()
+        return (list(current - previous),
+                list(current & previous),
+                list(previous - current))
+
+    def reset(self):
+        self.contacts = set()
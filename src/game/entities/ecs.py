@@ -0,0 +1,324 @@
+# ================================================================
+#  ecs.py  (archetype storage + bulk systems for data-only prefabs)
+# ================================================================
+#  Entities whose JSON components use the COMPONENTS vocabulary
+#  ("Transform", "RigidBody", ...) don't get a hand-written Sprite
+#  subclass.  Their data lives in per-archetype columns (one column
+#  per component field, one row per entity) and the systems at the
+#  bottom of this file update every row of an archetype in one pass.
+#
+#  Example prefab:
+#     {"id": "smoke", "prefab": "smoke",
+#      "components": {"Transform": {},
+#                     "RigidBody": {"vy": -1.5, "gravity": 0.02},
+#                     "Sprite": {"color": [90, 90, 90], "w": 14, "h": 14,
+#                                "shape": "circle"},
+#                     "Lifespan": {"frames": 45}}}
+# ================================================================
+from __future__ import annotations
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+import pygame
+from assets import assets
+
+# ----------------------------------------------------------------
+#  COMPONENT SCHEMAS  (numeric fields -> array('d') columns)
+# ----------------------------------------------------------------
+COMPONENT_FIELDS:Dict[str,Dict[str,float]] = {
+    "Transform": {"x":0.0, "y":0.0},                 # midbottom, like sprites
+    "RigidBody": {"vx":0.0, "vy":0.0, "gravity":0.5,
+                  "bounce":0.0, "friction":0.0, "max_speed":20.0},
+    "Collider":  {"w":32.0, "h":32.0},
+    "Lifespan":  {"frames":60.0},
+    "Health":    {"hp":100.0},
+    "Damage":    {"amount":0.0, "knockback":0.0},
+}
+# Components stored as one object column (the Surface for Sprite,
+# the raw dict for anything without a schema, e.g. CustomVar)
+OBJECT_COMPONENTS = {"Sprite"}
+
+def column_name(component:str, field:str) -> str:
+    return f"{component}.{field}"
+
+# ----------------------------------------------------------------
+#  ARCHETYPE  (one table per distinct set of components)
+# ----------------------------------------------------------------
+class Archetype:
+    def __init__(self, components:frozenset):
+        self.components = components
+        self.ids:List[str] = []
+        self.rows:Dict[str,int] = {}
+        self.columns:Dict[str,Any] = {}
+        for comp in sorted(components):
+            if comp in COMPONENT_FIELDS and comp not in OBJECT_COMPONENTS:
+                for f in COMPONENT_FIELDS[comp]:
+                    self.columns[column_name(comp, f)] = array('d')
+            else:
+                self.columns[comp] = []
+
+    def __len__(self):
+        return len(self.ids)
+
+    def append(self, entity_id:str, values:Dict[str,Any]) -> int:
+        row = len(self.ids)
+        self.ids.append(entity_id)
+        self.rows[entity_id] = row
+        for name, col in self.columns.items():
+            col.append(values[name])
+        return row
+
+    def remove(self, entity_id:str):
+        """Swap-remove: the last row moves into the freed slot."""
+        row = self.rows.pop(entity_id)
+        last = len(self.ids) - 1
+        if row != last:
+            moved = self.ids[last]
+            self.ids[row] = moved
+            self.rows[moved] = row
+            for col in self.columns.values():
+                col[row] = col[last]
+        self.ids.pop()
+        for col in self.columns.values():
+            col.pop()
+
+# ----------------------------------------------------------------
+#  HANDLE  (stands in for engine_obj so actions/expressions work)
+# ----------------------------------------------------------------
+class EcsHandle:
+    __slots__ = ("world", "id")
+
+    def __init__(self, world:'World', entity_id:str):
+        self.world = world
+        self.id = entity_id
+
+    def _column(self, name):
+        arch = self.world.locations.get(self.id)
+        if arch is None or name not in arch.columns:
+            return None, None
+        return arch.columns[name], arch.rows[self.id]
+
+    def get(self, name, default=0.0):
+        col, row = self._column(name)
+        return default if col is None else col[row]
+
+    def set(self, name, value):
+        col, row = self._column(name)
+        if col is not None:
+            col[row] = value
+
+    @property
+    def pos(self):
+        return pygame.math.Vector2(self.get("Transform.x"), self.get("Transform.y"))
+
+    @property
+    def vel(self):
+        return pygame.math.Vector2(self.get("RigidBody.vx"), self.get("RigidBody.vy"))
+
+    @property
+    def rect(self):
+        w, h = self.world.size_of(self.id)
+        r = pygame.Rect(0, 0, int(w), int(h))
+        r.midbottom = (int(self.get("Transform.x")), int(self.get("Transform.y")))
+        return r
+
+    def apply_force(self, force_x, force_y):
+        col, row = self._column("RigidBody.vx")
+        if col is None:
+            return
+        arch = self.world.locations[self.id]
+        limit = arch.columns["RigidBody.max_speed"][row]
+        vx, vy = arch.columns["RigidBody.vx"], arch.columns["RigidBody.vy"]
+        vx[row] = max(-limit, min(limit, vx[row] + force_x))
+        vy[row] = max(-limit, min(limit, vy[row] + force_y))
+
+    def alive(self):
+        return self.id in self.world.locations
+
+    def kill(self):
+        self.world.despawn(self.id)
+
+    def __getattr__(self, name):
+        # Plain field names (self.hp, self.frames, ...) for DSL expressions
+        arch = self.world.locations.get(self.id) if name != "world" else None
+        if arch is not None:
+            for col_name, col in arch.columns.items():
+                if col_name.endswith("." + name):
+                    return col[arch.rows[self.id]]
+        raise AttributeError(name)
+
+# ----------------------------------------------------------------
+#  WORLD
+# ----------------------------------------------------------------
+def is_data_prefab(components:Dict[str,Any]) -> bool:
+    """True when a prefab is described by COMPONENTS data alone."""
+    return "Transform" in components
+
+class World:
+    def __init__(self, resource_finder:Callable[...,Any]|None=None):
+        self.archetypes:Dict[frozenset,Archetype] = {}
+        self.locations:Dict[str,Archetype] = {}    # entity id -> archetype
+        self.handles:Dict[str,EcsHandle] = {}
+        self.resource_finder = resource_finder
+        self._queries:Dict[Tuple[str,...],List[Archetype]] = {}
+        self._surfaces:Dict[Any,pygame.Surface] = {}
+
+    def __len__(self):
+        return len(self.locations)
+
+    def spawn(self, entity_id:str, components:Dict[str,Any]) -> EcsHandle:
+        """Add an entity built from component dicts; returns its handle."""
+        kinds = frozenset(name for name in components if not name[:1].islower())
+        arch = self.archetypes.get(kinds)
+        if arch is None:
+            arch = self.archetypes[kinds] = Archetype(kinds)
+            self._queries.clear()
+        values = {}
+        for comp in kinds:
+            data = components[comp] if isinstance(components[comp], dict) else {}
+            if comp == "Sprite":
+                values[comp] = self.surface_for(data)
+            elif comp in COMPONENT_FIELDS:
+                for f, default in COMPONENT_FIELDS[comp].items():
+                    values[column_name(comp, f)] = float(data.get(f, default))
+            else:
+                values[comp] = dict(data)
+        arch.append(entity_id, values)
+        self.locations[entity_id] = arch
+        handle = self.handles[entity_id] = EcsHandle(self, entity_id)
+        return handle
+
+    def despawn(self, entity_id:str):
+        arch = self.locations.pop(entity_id, None)
+        if arch is not None:
+            arch.remove(entity_id)
+            self.handles.pop(entity_id, None)
+
+    def clear(self):
+        self.archetypes.clear()
+        self.locations.clear()
+        self.handles.clear()
+        self._queries.clear()
+
+    def query(self, *components:str) -> List[Archetype]:
+        """Archetypes that have all the given components (cached)."""
+        key = tuple(sorted(components))
+        found = self._queries.get(key)
+        if found is None:
+            wanted = set(key)
+            found = self._queries[key] = [a for a in self.archetypes.values()
+                                          if wanted <= a.components]
+        return found
+
+    def collider_boxes(self, group=None) -> List[tuple]:
+        """(left, right, top, bottom, handle, group) for every Collider row,
+           read straight from the columns for the broadphase."""
+        boxes = []
+        handles = self.handles
+        for arch in self.query("Transform", "Collider"):
+            cols = arch.columns
+            xs, ys = cols["Transform.x"], cols["Transform.y"]
+            ws, hs = cols["Collider.w"], cols["Collider.h"]
+            for i, entity_id in enumerate(arch.ids):
+                half = ws[i] / 2
+                boxes.append((xs[i] - half, xs[i] + half, ys[i] - hs[i], ys[i],
+                              handles[entity_id], group))
+        return boxes
+
+    def size_of(self, entity_id:str) -> Tuple[float,float]:
+        arch = self.locations[entity_id]
+        row = arch.rows[entity_id]
+        if "Collider.w" in arch.columns:
+            return arch.columns["Collider.w"][row], arch.columns["Collider.h"][row]
+        if "Sprite" in arch.columns:
+            return arch.columns["Sprite"][row].get_size()
+        return 0.0, 0.0
+
+    def surface_for(self, spec:Dict[str,Any]) -> pygame.Surface:
+        """Build (once per distinct spec) the surface a Sprite component draws."""
+        w, h = int(spec.get("w", 16)), int(spec.get("h", 16))
+        key = (spec.get("image"), spec.get("folder"), tuple(spec.get("color", (255, 255, 255))),
+               spec.get("shape", "rect"), w, h)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            return surface
+        path = None
+        if spec.get("image") and self.resource_finder:
+            path = self.resource_finder(spec["image"], spec.get("folder"))
+        if path:
+            surface = pygame.transform.scale(assets.load(path), (w, h))
+        else:
+            surface = pygame.Surface((w, h), pygame.SRCALPHA)
+            if key[3] == "circle":
+                pygame.draw.ellipse(surface, key[2], surface.get_rect())
+            else:
+                surface.fill(key[2])
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self._surfaces[key] = surface
+        return surface
+
+# ----------------------------------------------------------------
+#  SYSTEMS  (each one is a single pass over the matching archetypes)
+# ----------------------------------------------------------------
+def physics_system(world:World):
+    """Gravity, friction and integration for Transform + RigidBody."""
+    for arch in world.query("Transform", "RigidBody"):
+        cols = arch.columns
+        xs, ys = cols["Transform.x"], cols["Transform.y"]
+        vxs, vys = cols["RigidBody.vx"], cols["RigidBody.vy"]
+        gs, fr, caps = cols["RigidBody.gravity"], cols["RigidBody.friction"], cols["RigidBody.max_speed"]
+        for i in range(len(arch)):
+            cap = caps[i]
+            vy = vys[i] + gs[i]
+            vx = vxs[i] * (1.0 - fr[i])
+            vys[i] = cap if vy > cap else -cap if vy < -cap else vy
+            vxs[i] = vx
+            xs[i] += vx
+            ys[i] += vys[i]
+
+def platform_system(world:World, platform_rects:Iterable[pygame.Rect]):
+    """Land falling bodies on platform tops (with optional bounce)."""
+    rects = [(r.left, r.right, r.top) for r in platform_rects]
+    if not rects:
+        return
+    for arch in world.query("Transform", "RigidBody", "Collider"):
+        cols = arch.columns
+        xs, ys = cols["Transform.x"], cols["Transform.y"]
+        vxs, vys = cols["RigidBody.vx"], cols["RigidBody.vy"]
+        bounce, ws = cols["RigidBody.bounce"], cols["Collider.w"]
+        for i in range(len(arch)):
+            vy = vys[i]
+            if vy <= 0:
+                continue
+            x, y, half = xs[i], ys[i], ws[i] / 2
+            prev_y = y - vy
+            for left, right, top in rects:
+                if prev_y <= top <= y and x + half > left and x - half < right:
+                    ys[i] = top
+                    vy = -vy * bounce[i]
+                    vys[i] = vy if vy < -1 else 0.0
+                    break
+
+def lifespan_system(world:World) -> List[str]:
+    """Count Lifespan down; returns ids whose time ran out this frame."""
+    expired = []
+    for arch in world.query("Lifespan"):
+        frames, ids = arch.columns["Lifespan.frames"], arch.ids
+        for i in range(len(arch)):
+            frames[i] -= 1
+            if frames[i] <= 0:
+                expired.append(ids[i])
+    return expired
+
+def render_system(world:World, screen:pygame.Surface):
+    """Blit every Transform + Sprite row with one Surface.blits call."""
+    batch = []
+    for arch in world.query("Transform", "Sprite"):
+        cols = arch.columns
+        xs, ys, surfaces = cols["Transform.x"], cols["Transform.y"], cols["Sprite"]
+        for i in range(len(arch)):
+            surface = surfaces[i]
+            w, h = surface.get_size()
+            batch.append((surface, (int(xs[i]) - w // 2, int(ys[i]) - h)))
+    if batch:
+        screen.blits(batch, doreturn=False)
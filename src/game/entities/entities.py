@@ -7,12 +7,25 @@ from typing import Any, Callable, Dict, List, Sequence
 import pygame
 import random
 import os
+import ast
+import copy
+import heapq
+import itertools
+import operator
+from entities.ecs import (World, EcsHandle, is_data_prefab, physics_system,
+                          platform_system, lifespan_system, render_system)
+from entities.collisions import ContactTracker, rect_box
+from sound_manager import sound_manager
+from assets import assets
 
 # ----------------------------------------------------------------
 #  ENUMS (expressed as str literals to avoid importing Enum class)
 # ----------------------------------------------------------------
 EVENTS        = {"OnStart","EveryFrame","OnTimer","OnCollision",
+                 "OnCollisionStay","OnCollisionEnd",
                  "OnVoiceCommand","OnHealthBelow","OnDestroyed"}
+# Contact phase -> event fired on each entity in the contact
+COLLISION_EVENTS = ("OnCollision", "OnCollisionStay", "OnCollisionEnd")
 ENTITY_TYPES  = {"character","projectile","hazard","powerup","effect"}
 COMPONENTS    = {"Transform","Sprite","Collider","RigidBody","Health",
                  "Damage","AI_Brain","Lifespan","ParticleEmitter",
@@ -68,6 +81,7 @@ ACTION_MAP:Dict[str,type[Action]] = {
 class Behavior:
     event:str                       # must be in EVENTS
     actions:Sequence[Action]
+    compiled:List[Callable] = field(default_factory=list, repr=False, compare=False)
 
 # ----------------------------------------------------------------
 #  ENTITY (engine‑agnostic)
@@ -89,12 +103,96 @@ class Entity:
 # ----------------------------------------------------------------
 #  TIMER
 # ----------------------------------------------------------------
+FRAME_RATE = 60                     # timers run on the fixed 60 Hz game step
+
+def seconds_to_frames(seconds:float) -> int:
+    """Convert a DSL duration in seconds to a whole number of frames (>= 1)."""
+    return max(1, int(round(float(seconds) * FRAME_RATE)))
+
 @dataclass
 class Timer:
     id:str
-    duration:float
-    repeat:int
+    duration:float                  # seconds
+    repeat:int                      # extra firings; < 0 repeats forever
     on_complete:Sequence[Action]
+    compiled:List[Callable] = field(default_factory=list, repr=False, compare=False)
+    # Scheduler bookkeeping (set by FrameScheduler.schedule)
+    owner:Any = field(default=None, repr=False, compare=False)   # Entity or None
+    period:int = field(default=0, repr=False, compare=False)     # frames
+    due:int = field(default=0, repr=False, compare=False)        # absolute frame
+    repeats_left:int = field(default=0, repr=False, compare=False)
+    cancelled:bool = field(default=False, repr=False, compare=False)
+
+class FrameScheduler:
+    """
+    Min-heap of timers keyed on integer frame numbers.
+    
+    advance() only touches timers that are due, so the per-frame cost is
+    O(expired * log n) instead of a walk over every timer, and durations
+    are exact frame counts rather than accumulated float seconds.
+    Cancellation is lazy: cancelled timers are skipped when they surface.
+    """
+    def __init__(self):
+        self.frame = 0
+        self._heap = []                 # (due frame, seq, Timer)
+        self._seq = itertools.count()   # FIFO order for timers due together
+        self._active = {}               # (owner id, timer id) -> Timer
+        self._by_owner = {}             # owner id -> {timer id, ...}
+
+    def __len__(self):
+        return len(self._active)
+
+    def schedule(self, timer:Timer, owner:Any=None) -> Timer:
+        """Arm a timer; re-arming an id for the same owner replaces it."""
+        owner_id = owner.id if owner is not None else None
+        self.cancel(timer.id, owner)
+        timer.owner = owner
+        timer.period = seconds_to_frames(timer.duration)
+        timer.due = self.frame + timer.period
+        timer.repeats_left = timer.repeat
+        timer.cancelled = False
+        self._active[(owner_id, timer.id)] = timer
+        self._by_owner.setdefault(owner_id, set()).add(timer.id)
+        heapq.heappush(self._heap, (timer.due, next(self._seq), timer))
+        return timer
+
+    def cancel(self, timer_id:str, owner:Any=None):
+        owner_id = owner.id if owner is not None else None
+        timer = self._active.pop((owner_id, timer_id), None)
+        if timer is not None:
+            timer.cancelled = True
+            self._by_owner[owner_id].discard(timer_id)
+
+    def cancel_owner(self, owner:Any):
+        """Cancel every timer belonging to an entity (e.g. when it despawns)."""
+        for timer_id in list(self._by_owner.pop(owner.id, ())):
+            timer = self._active.pop((owner.id, timer_id), None)
+            if timer is not None:
+                timer.cancelled = True
+
+    def get(self, timer_id:str, owner:Any=None) -> Timer|None:
+        return self._active.get((owner.id if owner is not None else None, timer_id))
+
+    def advance(self, frames:int=1) -> List[Timer]:
+        """Step the clock and return the timers that fired, in due order."""
+        self.frame += frames
+        fired = []
+        heap = self._heap
+        while heap and heap[0][0] <= self.frame:
+            due, _, timer = heapq.heappop(heap)
+            if timer.cancelled or timer.due != due:
+                continue
+            fired.append(timer)
+            if timer.repeats_left != 0:
+                if timer.repeats_left > 0:
+                    timer.repeats_left -= 1
+                timer.due = due + timer.period
+                heapq.heappush(heap, (timer.due, next(self._seq), timer))
+            else:
+                owner_id = timer.owner.id if timer.owner is not None else None
+                self._active.pop((owner_id, timer.id), None)
+                self._by_owner.get(owner_id, set()).discard(timer.id)
+        return fired
 
 # ----------------------------------------------------------------
 #  PACKET  (the top‑level MOD packet)
@@ -124,6 +222,178 @@ class ModPacket:
                                 repeat=t.get("repeat",0), on_complete=acts))
         return cls(entities=ents, timers=timers)
     
+def merge_components(base:Dict[str,Any], overrides:Dict[str,Any]) -> Dict[str,Any]:
+    """Apply per-spawn overrides; component dicts are merged field by field."""
+    for name, value in overrides.items():
+        if isinstance(value, dict) and isinstance(base.get(name), dict):
+            base[name].update(value)
+        else:
+            base[name] = value
+    return base
+
+# ----------------------------------------------------------------
+#  EXPRESSION COMPILER  (sandboxed: parsed with ast, never eval'd)
+# ----------------------------------------------------------------
+#  Grammar:  numbers, + - * / // % **, unary -/+, comparisons,
+#            "a if cond else b", references rooted at self/target
+#            (self.x, target.y, self.vel.x, self.fuse_time ...) and
+#            the whitelisted calls in EXPR_FUNCTIONS, e.g. rand(-5, 5).
+#  A compiled expression is a callable fn(self_ent, target).
+
+def _safe_div(a, b):
+    return a / b if b else 0.0
+
+def _safe_floordiv(a, b):
+    return a // b if b else 0.0
+
+def _safe_mod(a, b):
+    return a % b if b else 0.0
+
+def _safe_pow(a, b):
+    # Bound the exponent so a mod can't stall the frame with 9**9**9
+    return a ** b if abs(b) <= 64 else 0.0
+
+_BIN_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: _safe_div, ast.FloorDiv: _safe_floordiv, ast.Mod: _safe_mod,
+    ast.Pow: _safe_pow,
+}
+_UNARY_OPS = {ast.USub: operator.neg, ast.UAdd: operator.pos, ast.Not: operator.not_}
+_CMP_OPS = {
+    ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt,
+    ast.GtE: operator.ge, ast.Eq: operator.eq, ast.NotEq: operator.ne,
+}
+EXPR_FUNCTIONS:Dict[str,Callable[...,Any]] = {
+    "rand": random.uniform,            # rand(lo, hi) -> float in range
+    "randint": random.randint,         # randint(lo, hi) -> int in range
+    "choice": lambda *opts: random.choice(opts),
+    "min": min, "max": max, "abs": abs,
+    "clamp": lambda v, lo, hi: max(lo, min(hi, v)),
+    "sign": lambda v: (v > 0) - (v < 0),
+}
+EXPR_ROOTS = {"self", "target"}
+# Short field names resolved against the engine object
+EXPR_ALIASES = {"x": ("pos", "x"), "y": ("pos", "y"),
+                "vx": ("vel", "x"), "vy": ("vel", "y")}
+
+_EXPR_CACHE:Dict[Any,Callable[[Any,Any],Any]] = {}
+
+def _read_path(obj, path):
+    """Follow an attribute path on an Entity (components first for plain
+    fields, then its engine object) or directly on an engine object."""
+    if obj is None:
+        return 0
+    if isinstance(obj, Entity):
+        sprite = obj.engine_obj
+        if len(path) == 1 and path[0] in obj.components and not hasattr(sprite, path[0]):
+            return obj.components[path[0]]
+        obj = sprite
+    for name in EXPR_ALIASES.get(path[0], path[:1]) + path[1:]:
+        obj = getattr(obj, name, None)
+        if obj is None:
+            return 0
+    return obj
+
+def _compile_node(node, src):
+    if isinstance(node, ast.Expression):
+        return _compile_node(node.body, src)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+            and not isinstance(node.value, bool):
+        value = node.value
+        return lambda s, t: value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        op = _BIN_OPS[type(node.op)]
+        left, right = _compile_node(node.left, src), _compile_node(node.right, src)
+        return lambda s, t: op(left(s, t), right(s, t))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        op, operand = _UNARY_OPS[type(node.op)], _compile_node(node.operand, src)
+        return lambda s, t: op(operand(s, t))
+    if isinstance(node, ast.Compare) and len(node.ops) == 1 and type(node.ops[0]) in _CMP_OPS:
+        op = _CMP_OPS[type(node.ops[0])]
+        left, right = _compile_node(node.left, src), _compile_node(node.comparators[0], src)
+        return lambda s, t: op(left(s, t), right(s, t))
+    if isinstance(node, ast.IfExp):
+        test, body, orelse = (_compile_node(n, src) for n in (node.test, node.body, node.orelse))
+        return lambda s, t: body(s, t) if test(s, t) else orelse(s, t)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+            and node.func.id in EXPR_FUNCTIONS and not node.keywords:
+        fn = EXPR_FUNCTIONS[node.func.id]
+        args = [_compile_node(a, src) for a in node.args]
+        return lambda s, t: fn(*[a(s, t) for a in args])
+    if isinstance(node, ast.Attribute):
+        path = []
+        while isinstance(node, ast.Attribute):
+            if node.attr.startswith("_"):
+                break
+            path.append(node.attr)
+            node = node.value
+        else:
+            if isinstance(node, ast.Name) and node.id in EXPR_ROOTS:
+                path = tuple(reversed(path))
+                if node.id == "self":
+                    return lambda s, t: _read_path(s, path)
+                return lambda s, t: _read_path(t, path)
+    raise ValueError(f"Unsupported expression {src!r}: {type(node).__name__} not allowed")
+
+def compile_expression(expr) -> Callable[[Any,Any],Any]:
+    """Compile a DSL expression (number or string) into fn(self_ent, target).
+       Results are cached by source, so repeated expressions share a closure."""
+    if isinstance(expr, (int, float)) and not isinstance(expr, bool):
+        return lambda s, t: expr
+    if not isinstance(expr, str):
+        raise ValueError(f"Unsupported expression {expr!r}")
+    if expr in _EXPR_CACHE:
+        return _EXPR_CACHE[expr]
+    try:
+        tree = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression {expr!r}: {e.msg}") from None
+    fn = _compile_node(tree, expr)
+    _EXPR_CACHE[expr] = fn
+    return fn
+
+def compile_action(action:Action) -> Callable[...,Any]:
+    """Turn an action into a closure run(engine_ctx, self_ent, target, ctx)
+       with all of its expressions compiled up front."""
+    if isinstance(action, SpawnAction):
+        prefab, properties = action.prefab, action.properties or {}
+        x, y = compile_expression(action.x), compile_expression(action.y)
+        def run(eng, self_ent, target, ctx):
+            return eng.spawn_entity(prefab, float(x(self_ent, target)),
+                                    float(y(self_ent, target)), properties)
+        return run
+    if isinstance(action, ApplyForceAction):
+        fx = compile_expression(action.vector.get("x", 0))
+        fy = compile_expression(action.vector.get("y", 0))
+        def run(eng, self_ent, target, ctx):
+            sprite = self_ent.engine_obj if self_ent else None
+            if sprite is not None and hasattr(sprite, "apply_force"):
+                sprite.apply_force(float(fx(self_ent, target)), float(fy(self_ent, target)))
+        return run
+    if isinstance(action, ModifyStatAction):
+        stat, value, on_target = action.field, compile_expression(action.value), action.target == "target"
+        def run(eng, self_ent, target, ctx):
+            result = value(self_ent, target)
+            subject = target if on_target else self_ent
+            if isinstance(subject, Entity):
+                subject.components[stat] = result
+                subject = subject.engine_obj
+            if subject is not None and hasattr(subject, stat):
+                setattr(subject, stat, result)
+        return run
+    if isinstance(action, SetTimerAction):
+        timer_id, duration, repeat = action.id, action.duration, action.repeat
+        def run(eng, self_ent, target, ctx):
+            eng.set_timer(timer_id, duration, repeat, owner=self_ent)
+        return run
+    # Everything else has no expressions; defer to the reference runner
+    def run(eng, self_ent, target, ctx):
+        return action_runner(action, eng, self_ent, target)
+    return run
+
+def compile_actions(actions:Sequence[Action]) -> List[Callable]:
+    return [compile_action(a) for a in actions]
+
 # ----------------------------------------------------------------
 # Adapter methods for connecting the above to the rest of the codebase
 # ----------------------------------------------------------------
@@ -134,28 +404,90 @@ class EntitySystem:
         self.game = game
         self.entities = {}  # id -> Entity
         self.entity_map = {}  # engine_obj -> Entity
-        self.timers = {}  # id -> Timer
+        self.scheduler = FrameScheduler()  # packet-level and per-entity timers
+        self.prefabs = {}  # prefab name -> template Entity from a mod packet
+        self.world = World(resource_finder=find_resource)  # data-only prefabs
+        self.contacts = ContactTracker()  # entity/fighter contacts from last frame
+        # Dispatch index: event -> {entity id -> (Entity, [Behavior, ...])}
+        # Kept in sync by register_entity/unregister_entity so firing an
+        # event only touches the behaviors that listen for it.
+        self.event_index = {event: {} for event in EVENTS}
     
     def register_entity(self, entity):
         """Register an entity in the system for tracking."""
+        if entity.id in self.entities:
+            self.unregister_entity(self.entities[entity.id])
         self.entities[entity.id] = entity
         if entity.engine_obj:
             self.entity_map[entity.engine_obj] = entity
+        
+        # Index behaviors by the event they listen for
+        for behavior in entity.behaviors:
+            if not behavior.compiled:
+                behavior.compiled = compile_actions(behavior.actions)
+            bucket = self.event_index.setdefault(behavior.event, {})
+            if entity.id in bucket:
+                bucket[entity.id][1].append(behavior)
+            else:
+                bucket[entity.id] = (entity, [behavior])
+
+    def unregister_entity(self, entity):
+        """Stop tracking an entity and drop its behaviors from the dispatch index."""
+        if self.entities.get(entity.id) is entity:
+            del self.entities[entity.id]
+        if entity.engine_obj is not None and self.entity_map.get(entity.engine_obj) is entity:
+            del self.entity_map[entity.engine_obj]
+        
+        for behavior in entity.behaviors:
+            bucket = self.event_index.get(behavior.event)
+            if bucket and entity.id in bucket and bucket[entity.id][0] is entity:
+                del bucket[entity.id]
+        
+        # An entity's own timers die with it
+        self.scheduler.cancel_owner(entity)
+
+    def despawn_entity(self, entity):
+        """Fire OnDestroyed for an entity, unregister it and remove its sprite."""
+        if self.entities.get(entity.id) is entity:
+            self.process_event("OnDestroyed", entity=entity)
+            self.unregister_entity(entity)
+        if entity.engine_obj is not None:
+            entity.engine_obj.kill()
+
+    def despawn_sprite(self, sprite):
+        """Despawn the entity backing a sprite, or just kill an untracked sprite."""
+        entity = self.sprite_to_entity(sprite)
+        if entity:
+            self.despawn_entity(entity)
+        else:
+            sprite.kill()
 
     def sprite_to_entity(self, sprite):
         """Convert sprite to entity reference."""
         return self.entity_map.get(sprite)
     
-    def process_event(self, event_type, target=None, ctx=None):
-        """Process an event for all registered entities."""
+    def process_event(self, event_type, target=None, ctx=None, entity=None):
+        """
+        Process an event for the registered entities listening for it.
+        
+        If entity is given, only that entity's behaviors are run.
+        """
+        bucket = self.event_index.get(event_type)
+        if not bucket:
+            return
         if ctx is None:
             ctx = {}
         
-        for entity in self.entities.values():
-            for behavior in entity.behaviors:
-                if behavior.event == event_type:
-                    for action in behavior.actions:
-                        self.execute_action(action, entity, target, ctx)
+        if entity is not None:
+            listeners = (bucket[entity.id],) if entity.id in bucket else ()
+        else:
+            # Snapshot so actions may spawn or despawn entities mid-dispatch
+            listeners = tuple(bucket.values())
+        
+        for listener, behaviors in listeners:
+            for behavior in behaviors:
+                for run in behavior.compiled:
+                    run(self, listener, target, ctx)
     
     def execute_action(self, action, self_entity, target=None, ctx=None):
         """Execute a single action."""
@@ -163,22 +495,16 @@ class EntitySystem:
 
     def evaluate(self, expr, self_entity, target):
         """Evaluate an expression in the context of entities."""
-        if isinstance(expr, (int, float)):
-            return expr
-        if isinstance(expr, str) and expr.isdigit():
-            return float(expr)
-        if expr == "self.x" and self_entity and self_entity.engine_obj:
-            return self_entity.engine_obj.pos.x
-        if expr == "self.y" and self_entity and self_entity.engine_obj:
-            return self_entity.engine_obj.pos.y
-        if expr == "target.x" and target:
-            return target.pos.x
-        if expr == "target.y" and target:
-            return target.pos.y
-        return 0
+        return compile_expression(expr)(self_entity, target)
     
     def spawn_entity(self, prefab, x, y, properties=None):
-        """Spawn a new entity at the given position."""
+        """
+        Spawn a new entity at the given position.
+        
+        Components and behaviors come from the prefab's template (if a mod
+        packet defined one), overridden by properties. Prefabs made only of
+        COMPONENTS data live in the ECS world; others use prefab_factory.
+        """
         from uuid import uuid4
         
         if properties is None:
@@ -187,21 +513,83 @@ class EntitySystem:
         # Create a new entity with a unique ID
         entity_id = f"{prefab}_{uuid4().hex[:8]}"
         
-        # Set up position in components
-        components = {"xPos": x, "yPos": y}
-        components.update(properties)
+        # Start from the template, then position, then per-spawn overrides
+        template = self.prefabs.get(prefab)
+        components = copy.deepcopy(template.components) if template else {}
+        components.update({"xPos": x, "yPos": y})
+        merge_components(components, properties)
+        behaviors = list(template.behaviors) if template else []
         
         # Create entity
-        entity = Entity(id=entity_id, prefab=prefab, components=components)
+        entity = Entity(id=entity_id, prefab=prefab, components=components, behaviors=behaviors)
+        
+        if is_data_prefab(components):
+            transform = components["Transform"]
+            transform["x"], transform["y"] = x, y
+            entity.engine_obj = self.world.spawn(entity_id, components)
+        else:
+            # Build the entity using our factory
+            entity.build(self, prefab_factory)
         
-        # Build the entity using our factory
-        entity.build(self, prefab_factory)
+        if entity.engine_obj is None:
+            return None
         
         # Register the entity
         self.register_entity(entity)
+        self.process_event("OnStart", entity=entity)
         
         return entity.engine_obj
     
+    def update_world(self, platforms=()):
+        """Run the bulk ECS systems for data-only entities (once per frame)."""
+        if not len(self.world):
+            return
+        physics_system(self.world)
+        platform_system(self.world, [p.rect for p in platforms])
+        for entity_id in lifespan_system(self.world):
+            entity = self.entities.get(entity_id)
+            if entity:
+                self.despawn_entity(entity)
+            else:
+                self.world.despawn(entity_id)
+    
+    def update_collisions(self, fighters=()):
+        """
+        Broadphase every entity and fighter box, then fire OnCollision /
+        OnCollisionStay / OnCollisionEnd for contacts that began, persisted
+        or ended this frame. Skipped entirely when nothing listens.
+        """
+        buckets = [self.event_index.get(event) for event in COLLISION_EVENTS]
+        if not any(buckets):
+            self.contacts.reset()
+            return
+        
+        boxes = self.world.collider_boxes()
+        for obj in self.entity_map:
+            if not isinstance(obj, EcsHandle) and getattr(obj, "rect", None) is not None:
+                boxes.append(rect_box(obj.rect, obj))
+        for sprite in fighters:
+            boxes.append(rect_box(sprite.rect, sprite, group="fighter"))
+        
+        for event, pairs, bucket in zip(COLLISION_EVENTS, self.contacts.update(boxes), buckets):
+            if not bucket:
+                continue
+            for a, b in pairs:
+                on_collision(a, b, event)
+                on_collision(b, a, event)
+    
+    def draw_world(self, screen):
+        """Draw all data-only entities in one batched pass."""
+        if len(self.world):
+            render_system(self.world, screen)
+    
+    def clear_instances(self):
+        """Forget every spawned entity (templates and packet timers are kept)."""
+        for entity in list(self.entities.values()):
+            self.unregister_entity(entity)
+        self.world.clear()
+        self.contacts.reset()
+    
     def load_from_json(self, json_file):
         """Load entities and timers from a JSON file."""
         import json
@@ -211,12 +599,15 @@ class EntitySystem:
             # Make sure the path is correct relative to the game directory
             if not os.path.isabs(json_file):
                 # Try a couple of common relative paths
+                module_dir = os.path.dirname(os.path.abspath(__file__))
                 if os.path.exists(json_file):
                     pass  # Use as is
                 elif os.path.exists(f"src/game/{json_file}"):
                     json_file = f"src/game/{json_file}"
                 elif os.path.exists(f"src/game/entities/{json_file}"):
                     json_file = f"src/game/entities/{json_file}"
+                elif os.path.exists(os.path.join(module_dir, os.path.basename(json_file))):
+                    json_file = os.path.join(module_dir, os.path.basename(json_file))
             
             print(f"Loading entity definitions from {json_file}")
             with open(json_file, "r") as f:
@@ -225,27 +616,22 @@ class EntitySystem:
             # Use the ModPacket.from_dict to parse the data
             packet = ModPacket.from_dict(data)
             
-            # Process entities
+            # Compile every action (and its expressions) once, up front, so
+            # bad expressions are reported here instead of evaluating to 0
             for entity in packet.entities:
-                # Register the entity
-                self.register_entity(entity)
-                
-                # Build it if needed
-                if not entity.engine_obj:
-                    # Get position from components
-                    x = float(entity.components.get("xPos", 0))
-                    y = float(entity.components.get("yPos", 0))
-                    entity.build(self, prefab_factory)
+                for behavior in entity.behaviors:
+                    behavior.compiled = compile_actions(behavior.actions)
+            for timer in packet.timers:
+                timer.compiled = compile_actions(timer.on_complete)
+            
+            # Packet entities are prefab templates: spawn_entity copies their
+            # components and behaviors into each new instance
+            for entity in packet.entities:
+                self.prefabs[entity.prefab] = entity
             
             # Process timers
             for timer in packet.timers:
-                self.timers[timer.id] = {
-                    "duration": timer.duration,
-                    "repeat": timer.repeat,
-                    "actions": timer.on_complete,
-                    "remaining": timer.duration,
-                    "repeats_left": timer.repeat
-                }
+                self.scheduler.schedule(timer)
             
             return len(packet.entities), len(packet.timers)
             
@@ -255,31 +641,21 @@ class EntitySystem:
             traceback.print_exc()
             return 0, 0
     
-    def update_timers(self, dt=1/60):
-        """Update all timers, triggering any that have elapsed."""
-        timers_to_remove = []
-        
-        for timer_id, timer in self.timers.items():
-            # Decrement timer
-            timer["remaining"] -= dt
-            
-            # Check if timer has elapsed
-            if timer["remaining"] <= 0:
-                # Execute actions
-                for action in timer["actions"]:
-                    self.execute_action(action, None)
-                
-                # Handle repeats
-                if timer["repeats_left"] > 0:
-                    timer["repeats_left"] -= 1
-                    timer["remaining"] = timer["duration"]
-                elif timer["repeats_left"] == 0:
-                    # Remove this timer
-                    timers_to_remove.append(timer_id)
-        
-        # Remove expired timers
-        for timer_id in timers_to_remove:
-            del self.timers[timer_id]
+    def set_timer(self, timer_id, duration, repeat=0, owner=None, actions=()):
+        """Arm a timer; with an owner it is cancelled when that entity despawns."""
+        timer = Timer(id=timer_id, duration=duration, repeat=repeat, on_complete=list(actions))
+        timer.compiled = compile_actions(timer.on_complete)
+        return self.scheduler.schedule(timer, owner)
+    
+    def update_timers(self, frames=1):
+        """Advance the timer clock by whole frames, firing timers that are due."""
+        for timer in self.scheduler.advance(frames):
+            ctx = {"timer": timer.id}
+            for run in timer.compiled:
+                run(self, timer.owner, None, ctx)
+            # OnTimer goes to the owning entity, or to every listener for
+            # packet-level timers
+            self.process_event("OnTimer", ctx=ctx, entity=timer.owner)
 
 # Create a bob-omb sprite class
 class BobOmbSprite(pygame.sprite.Sprite):
@@ -296,7 +672,7 @@ class BobOmbSprite(pygame.sprite.Sprite):
             image_path = find_resource("SSF2_Bob-omb.png", "items")
             
             if image_path:
-                self.original_image = pygame.image.load(image_path).convert_alpha()
+                self.original_image = assets.load(image_path, alpha=True)
                 print(f"Successfully loaded Bob-omb image from {image_path}")
                 
                 # Scale the image to an appropriate size
@@ -536,8 +912,11 @@ class BobOmbSprite(pygame.sprite.Sprite):
                         force_y = -10 * distance_factor
                         player_sprite.apply_force(force_x, force_y)
         
-        # Remove the bob-omb
-        self.kill()
+        # Remove the bob-omb (fires its OnDestroyed behaviors if it is tracked)
+        if DSL:
+            DSL.despawn_sprite(self)
+        else:
+            self.kill()
 
 # Global entity system instance (will be initialized when game is created)
 DSL = None
@@ -581,22 +960,25 @@ def action_runner(action, engine_ctx, self_ent, target):
                 engine_ctx.evaluate(vec["y"], self_ent, target)
             )
     elif isinstance(action, PlaySoundAction):
-        # Simply log for now
-        print(f"Playing sound: {action.cue}")
+        sound_manager.play_hazard_sound(action.cue)
     elif isinstance(action, DestroyAction):
-        if self_ent and self_ent.engine_obj:
-            self_ent.engine_obj.kill()
+        if self_ent:
+            engine_ctx.despawn_entity(self_ent)
+    elif isinstance(action, SetTimerAction):
+        engine_ctx.set_timer(action.id, action.duration, action.repeat, owner=self_ent)
     
     # Add other action types as needed
     return None
 
 # 3. wire events to entity system
-def on_collision(self_sprite, other_sprite):
+def on_collision(self_sprite, other_sprite, event="OnCollision"):
+    """Fire a collision event on the entity behind self_sprite (if any)."""
     if DSL:
-        target_entity = DSL.sprite_to_entity(other_sprite)
         self_entity = DSL.sprite_to_entity(self_sprite)
         if self_entity:
-            DSL.process_event("OnCollision", target_entity, {"target": target_entity})
+            # Fighters aren't entities; they are passed through as the target
+            target = DSL.sprite_to_entity(other_sprite) or other_sprite
+            DSL.process_event(event, target, {"target": target}, entity=self_entity)
 
 # Initialize pygame for the BobOmbSprite class
 # import pygame  # Moved to the top of the file
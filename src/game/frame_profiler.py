@@ -0,0 +1,185 @@
+'''
+Frame Profiler for Super Smash Bros
+
+This module records frame times and input-to-photon latency: the time from
+an input edge (an intent becoming active in InputHandler.update) to the end
+of the first frame, after pg.display.flip(), in which the fighter's state
+changed because of it. Results are kept as per-intent histograms and saved
+with the match log.
+'''
+
+import time
+
+# Histogram bucket upper bounds in milliseconds (the last bucket is open-ended)
+LATENCY_BUCKETS_MS = (4, 8, 12, 16, 20, 25, 33, 50, 67, 100, 150, 250)
+
+# Edges that change nothing within this many frames are dropped
+# (e.g. jump pressed while already in the air)
+PENDING_EDGE_FRAMES = 30
+
+# Fighter state that an intent is expected to change
+INTENT_PROBES = {
+    'move_left': lambda s: (getattr(s, 'direc', None), s.acc.x if hasattr(s, 'acc') else None),
+    'move_right': lambda s: (getattr(s, 'direc', None), s.acc.x if hasattr(s, 'acc') else None),
+    'move_up': lambda s: (getattr(s, 'is_jumping', None), getattr(s, 'in_air', None)),
+    'move_down': lambda s: (getattr(s, 'is_fast_falling', None), getattr(s, 'is_dropping_through', None)),
+    'weak_attack': lambda s: getattr(s, 'move', None),
+    'heavy_attack': lambda s: getattr(s, 'move', None),
+    'shield': lambda s: getattr(s, 'shield_active', None),
+}
+
+
+class Histogram:
+    """Fixed-bucket histogram of millisecond samples"""
+
+    def __init__(self, bounds=LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, ms):
+        index = 0
+        for bound in self.bounds:
+            if ms <= bound:
+                break
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += ms
+        self.min = ms if self.min is None else min(self.min, ms)
+        self.max = ms if self.max is None else max(self.max, ms)
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples"""
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count, 2) if self.count else None,
+            'min_ms': round(self.min, 2) if self.min is not None else None,
+            'max_ms': round(self.max, 2) if self.max is not None else None,
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'buckets_ms': list(self.bounds) + ['inf'],
+            'counts': list(self.counts),
+        }
+
+
+class FrameProfiler:
+    """
+    Collects frame times and input-to-photon latency per intent.
+
+    Per frame: the match loop calls begin_frame() before handling input,
+    InputHandler.update stamps input edges (snapshotting the fighter before
+    the controllers act on them) and end_frame() runs after the flip.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.reset()
+
+    def reset(self):
+        """Clear all samples (called at the start of each match)"""
+        self.frame_times = Histogram()
+        self.latency = {}
+        self.pending = {}  # player name -> list of [intent, stamp, snapshot, frames]
+        self.players = {}  # LocalGame.players, set by begin_frame()
+        self.last_flip = None
+
+    def stamp_input(self, player_name, intents, timestamp=None):
+        """
+        Record input edges to follow until they show on screen
+
+        Args:
+            player_name: Name of the player
+            intents: Intents that were just activated
+            timestamp: time.perf_counter() when the input was sampled
+        """
+        if not self.enabled:
+            return
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        # Snapshot now, before the controllers apply the input this frame
+        sprite = self.players.get(player_name, {}).get('sprite')
+        edges = self.pending.setdefault(player_name, [])
+        for intent in intents:
+            probe = INTENT_PROBES.get(intent)
+            if probe is not None:
+                snapshot = (probe(sprite),) if sprite is not None else None
+                edges.append([intent, timestamp, snapshot, 0])
+
+    def begin_frame(self, players):
+        """
+        Call before the frame's input is handled; remembers the fighters for
+        stamp_input() and snapshots pending edges that have no snapshot yet
+
+        Args:
+            players: LocalGame.players (player name -> data with a 'sprite')
+        """
+        self.players = players
+        if not self.pending:
+            return
+        for player_name, edges in self.pending.items():
+            sprite = players.get(player_name, {}).get('sprite')
+            if sprite is None:
+                continue
+            for edge in edges:
+                if edge[2] is None:
+                    edge[2] = (INTENT_PROBES[edge[0]](sprite),)
+
+    def end_frame(self, players):
+        """
+        Call right after pg.display.flip(); resolves edges whose fighter
+        state changed this frame and records the frame time
+
+        Args:
+            players: LocalGame.players (player name -> data with a 'sprite')
+        """
+        now = time.perf_counter()
+        if self.last_flip is not None:
+            self.frame_times.add((now - self.last_flip) * 1000.0)
+        self.last_flip = now
+
+        if not self.pending:
+            return
+        for player_name in list(self.pending):
+            sprite = players.get(player_name, {}).get('sprite')
+            remaining = []
+            for edge in self.pending[player_name]:
+                intent, stamp, snapshot, frames = edge
+                if sprite is not None and snapshot is not None \
+                        and (INTENT_PROBES[intent](sprite),) != snapshot:
+                    histogram = self.latency.get(intent)
+                    if histogram is None:
+                        histogram = self.latency[intent] = Histogram()
+                    histogram.add((now - stamp) * 1000.0)
+                elif frames + 1 < PENDING_EDGE_FRAMES:
+                    edge[3] = frames + 1
+                    remaining.append(edge)
+            if remaining:
+                self.pending[player_name] = remaining
+            else:
+                del self.pending[player_name]
+
+    def summary(self):
+        """Frame time and per-intent latency histograms as plain dicts"""
+        return {
+            'frame_time': self.frame_times.to_dict(),
+            'input_latency': {intent: histogram.to_dict()
+                              for intent, histogram in sorted(self.latency.items())},
+        }
+
+# Create a global instance
+frame_profiler = FrameProfiler()
@@ -1,8 +1,149 @@
 '''
 GameState class to manage different game states
+
+GameState is also the scene manager: LocalGame.run() hands control to
+GameState.run(), which calls the current scene's run() in a loop and the
+exit()/enter() hooks whenever game.status changes. Scenes can queue work
+for the scene that is likely to come next on a background preloader
+(e.g. fighter frames while the players are still on the character screen).
 '''
 
-from settings import INTRO, START, GUIDE, ABOUT, GAME
+import queue
+import threading
+import traceback
+from settings import INTRO, START, GUIDE, ABOUT, GAME, FPS
+from characters.LocalCharacter import preload_character_frames
+from characters.registry import character_registry
+from input_handler import input_handler, input_sampler
+from frame_profiler import frame_profiler
+from sound_manager import sound_manager
+
+class ScenePreloader(threading.Thread):
+    """
+    Daemon worker that runs preload jobs off the main thread.
+    
+    Jobs are keyed so the same asset is only prepared once; they must not
+    touch the display (no convert()) since SDL video belongs to the main thread.
+    """
+    def __init__(self):
+        super().__init__(name='scene-preloader', daemon=True)
+        self.jobs = queue.SimpleQueue()
+        self.events = {}  # key -> threading.Event set once the job has run
+        self.lock = threading.Lock()
+        self.start()
+    
+    def submit(self, key, job):
+        """
+        Queue a job unless one with the same key was already submitted
+        
+        Args:
+            key: Hashable name of the asset being prepared
+            job: Callable with no arguments
+        """
+        with self.lock:
+            if key in self.events:
+                return
+            self.events[key] = threading.Event()
+        self.jobs.put((key, job))
+    
+    def wait(self, key, timeout=None):
+        """Block until a submitted job is done; True if it finished (or was never submitted)"""
+        event = self.events.get(key)
+        return event is None or event.wait(timeout)
+    
+    def run(self):
+        while True:
+            key, job = self.jobs.get()
+            try:
+                job()
+            except Exception as e:
+                print(f"Error preloading {key}: {e}")
+                traceback.print_exc()
+            finally:
+                self.events[key].set()
+
+class Scene:
+    """
+    One screen of the game
+    
+    GameState calls enter() when the scene becomes current, then run() until
+    game.status changes, then exit(). preload_next() is where a scene queues
+    background work for the scene that usually follows it.
+    """
+    def __init__(self, game, state):
+        self.game = game
+        self.state = state
+    
+    def enter(self, previous_state):
+        """Called when the scene becomes current"""
+        self.preload_next()
+    
+    def exit(self, next_state):
+        """Called when the scene is left"""
+        pass
+    
+    def preload_next(self):
+        """Queue background loading for the next scene (see GameState.preloader)"""
+        pass
+    
+    def run(self):
+        """Run the scene; returns when it wants the main loop to check for a transition"""
+        raise NotImplementedError
+
+class MenuScene(Scene):
+    """A menu screen; its class (menus/) runs its own MenuLoop until the status changes"""
+    def __init__(self, game, state, menu, *menu_args):
+        super().__init__(game, state)
+        self.menu = menu
+        self.menu_args = menu_args
+    
+    def run(self):
+        self.menu(self.game, *self.menu_args)
+
+class CharacterSelectScene(MenuScene):
+    """Name entry and character select; prepares the picked fighters in the background"""
+    def preload_next(self):
+        # The automatic Player 2 is picked with Player 1's character, before it joins
+        characters = list(self.game.player_characters)
+        if self.game.auto_player2 and self.game.auto_player2_character is not None:
+            characters.append(self.game.auto_player2_character)
+        
+        # Decode the match sounds and the stage music (sound manager worker threads)
+        sound_manager.warm_up_sound_bank(characters)
+        if any(character in character_registry for character in characters):
+            sound_manager.preload_battle_music()
+        
+        # Load, flip and scale the picked fighters' frames
+        for character in characters:
+            definition = character_registry.get(character)
+            if definition is not None:
+                self.game.game_state.preloader.submit(
+                    ('fighter', character), lambda d=definition: preload_character_frames(d))
+
+class MatchScene(Scene):
+    """The arena; each run() is one simulation step and frame"""
+    def enter(self, previous_state):
+        # Menu loops consumed the joystick events; re-read controllers once
+        input_handler.resync_controllers()
+        super().enter(previous_state)
+    
+    def run(self):
+        game = self.game
+        game.winner = ''
+
+        if game.initialized and game.playing:
+            game.checkWinner()
+            
+        # Sample input between frames instead of sleeping in clock.tick(FPS)
+        input_sampler.wait_for_frame(FPS)
+        game.clock.tick()
+        game.current_frame += 1
+        # Before events(): the controllers apply attacks while handling input
+        frame_profiler.begin_frame(game.players)
+        game.events()
+        game.update()
+        game.draw()
+        frame_profiler.end_frame(game.players)
 
 class GameState:
     """
@@ -12,6 +153,34 @@ class GameState:
     def __init__(self, game):
         self.game = game
         self.current_state = INTRO
+        self.scenes = {}  # Maps game statuses to scenes
+        self.scene = None
+        self.preloader = ScenePreloader()
+    
+    def add_scene(self, scene):
+        """Register the scene for its game status"""
+        self.scenes[scene.state] = scene
+    
+    def run(self):
+        """Main loop: run the current scene, switching scenes when game.status changes"""
+        while True:
+            if self.scene is None or self.game.status != self.current_state:
+                self._switch_scene(self.game.status)
+            self.scene.run()
+    
+    def _switch_scene(self, new_state):
+        """Exit the current scene and enter the one for new_state"""
+        previous_state = self.current_state
+        if self.scene is not None:
+            self.scene.exit(new_state)
+        self.current_state = new_state
+        self.scene = self.scenes[new_state]
+        self.scene.enter(previous_state)
+    
+    def preload_next(self):
+        """Let the current scene queue more background work (e.g. after a character pick)"""
+        if self.scene is not None:
+            self.scene.preload_next()
     
     def change_state(self, new_state):
         """Change to a new game state"""
@@ -65,4 +234,4 @@ class GameState:
                 return False  # Game loop should stop
         
         # Default - continue game loop
-        return True 
\ No newline at end of file
+        return True 
@@ -5,8 +5,15 @@ This module implements a unified input handling system that processes inputs
 from both keyboard and controllers, mapping them to player intents regardless of input source.
 '''
 
+import time
 import pygame as pg
-from config import PRO_CONTROLLER, DEFAULT_SETTINGS
+from array import array
+from collections import deque
+from functools import reduce
+from itertools import compress
+from operator import itemgetter, or_
+from config import PRO_CONTROLLER, DEFAULT_SETTINGS, GAME_CONTROLS, KEYBOARD_LAYOUTS, RESERVED_KEYS
+from frame_profiler import frame_profiler
 
 # Define player intents (actions)
 INTENTS = {
@@ -29,6 +36,119 @@ INTENTS = {
     'QUIT': 'quit',
 }
 
+# Each intent is one bit of a player's per-frame intent mask
+INTENT_BITS = {intent: 1 << i for i, intent in enumerate(INTENTS.values())}
+
+# Input is pumped at up to this rate while the game loop waits for the next frame
+INPUT_SAMPLE_HZ = 1000
+
+# Hold times are measured in seconds and expressed in frames of this rate,
+# so the short-hop window means the same thing at any frame rate
+REFERENCE_FPS = 60
+SHORT_HOP_FRAMES = 7  # Melee-accurate timing (typically 3-7 frames)
+
+# Analog axes stored per player in a flat array (player slot * len + axis)
+ANALOG_AXES = {'horizontal': 0, 'vertical': 1}
+
+# Keyboard layout action names (see config.KEYBOARD_LAYOUTS) -> intents
+KEY_ACTIONS = {
+    'left': INTENTS['MOVE_LEFT'],
+    'right': INTENTS['MOVE_RIGHT'],
+    'up': INTENTS['MOVE_UP'],
+    'down': INTENTS['MOVE_DOWN'],
+    'weak_attack': INTENTS['WEAK_ATTACK'],
+    'heavy_attack': INTENTS['HEAVY_ATTACK'],
+    'shield': INTENTS['SHIELD'],
+    'menu': INTENTS['MENU'],
+    'restart': INTENTS['RESTART'],
+    'quit': INTENTS['QUIT'],
+}
+
+def compile_layout(controls):
+    """
+    Compile a keyboard layout (action name -> key) plus the shared
+    GAME_CONTROLS into a (gather, bits, key_bits) triple: gather(keys_pressed)
+    reads every bound key in one call, bits holds the matching intent bits
+    and key_bits maps each key to its bits for KEYDOWN/KEYUP events.
+    
+    Raises ValueError if the layout binds one of config.RESERVED_KEYS.
+    """
+    bindings = dict(GAME_CONTROLS)
+    bindings.update(controls)
+    reserved = {key: name for name, key in RESERVED_KEYS.items()}
+    for action, key in bindings.items():
+        if key in reserved:
+            raise ValueError(f"Key {pg.key.name(key)!r} for '{action}' is reserved for {reserved[key]}")
+    keys = []
+    bits = []
+    key_bits = {}
+    for action, key in bindings.items():
+        if action in KEY_ACTIONS and key is not None:
+            keys.append(key)
+            bits.append(INTENT_BITS[KEY_ACTIONS[action]])
+            key_bits[key] = key_bits.get(key, ()) + (bits[-1],)
+    if len(keys) == 1:
+        key = keys[0]
+        return (lambda keys_pressed: (keys_pressed[key],)), tuple(bits), key_bits
+    return itemgetter(*keys), tuple(bits), key_bits
+
+# Events that update controller state between frames
+CONTROLLER_EVENTS = (pg.JOYBUTTONDOWN, pg.JOYBUTTONUP, pg.JOYAXISMOTION, pg.JOYHATMOTION)
+
+class InputSampler:
+    """
+    Pumps pygame events at up to INPUT_SAMPLE_HZ while the game loop waits
+    for its next frame and stamps each one with time.perf_counter().
+    
+    SDL only lets the thread that created the window pump events, so instead
+    of a separate thread this takes over the frame limiter's sleep: the
+    loop calls wait_for_frame(FPS) in place of clock.tick(FPS) and drains
+    the buffer once per simulation step.
+    """
+    def __init__(self, rate_hz=INPUT_SAMPLE_HZ):
+        self.interval = 1.0 / rate_hz
+        self.buffer = deque()  # (perf_counter time, event) in arrival order
+        self.next_frame = None
+    
+    def sample(self):
+        """Move every queued pygame event into the buffer with the current time"""
+        events = pg.event.get()
+        if events:
+            now = time.perf_counter()
+            self.buffer.extend((now, event) for event in events)
+    
+    def wait_for_frame(self, fps):
+        """
+        Keep sampling input until the next frame is due
+        
+        Args:
+            fps: Target frame rate
+        """
+        frame_time = 1.0 / fps
+        now = time.perf_counter()
+        if self.next_frame is None or now - self.next_frame > frame_time:
+            # First frame, or we fell more than a frame behind: don't try to catch up
+            self.next_frame = now
+        while True:
+            self.sample()
+            remaining = self.next_frame - time.perf_counter()
+            if remaining <= 0:
+                break
+            time.sleep(min(self.interval, remaining))
+        self.next_frame += frame_time
+    
+    def drain(self):
+        """
+        Take everything sampled since the last drain
+        
+        Returns:
+            list: (perf_counter time, event) pairs, oldest first
+        """
+        self.sample()
+        stamped_events = list(self.buffer)
+        self.buffer.clear()
+        return stamped_events
+
 class InputHandler:
     """
     Central input handler that processes inputs from all sources
@@ -41,21 +161,34 @@ class InputHandler:
         self.controller_priority = True  # When True, controller input takes precedence over keyboard
         self.controllers = {}  # Maps player names to controller objects
         
-        # Player intent state
-        self.player_intents = {}  # Maps player names to their current intents
-        self.prev_player_intents = {}  # Previous frame intents for edge detection
+        # Player intent state as INTENT_BITS masks
+        self.intent_masks = {}  # Maps player names to this frame's intent mask
+        self.prev_intent_masks = {}  # Previous frame's masks
+        self.changed_masks = {}  # Bits that flipped since the previous frame
         
         # Analog input values (for analog stick values)
-        self.analog_values = {}  # Maps player_name+axis to values
+        self.player_slots = {}  # Maps player names to their analog slot
+        self.analog_values = array('d')  # len(ANALOG_AXES) values per slot
+        
+        # Sub-frame edge times (time.perf_counter()) per player and intent bit
+        self.press_times = {}  # Maps player names to {bit: time the intent last became active}
+        self.release_times = {}  # Maps player names to {bit: time the intent last became inactive}
+        self.pending_releases = {}  # Key releases of taps latched last frame, reported this frame
+        self.deferred_events = []  # Button releases held back a frame so taps register
+        self.sample_time = 0.0  # When the current frame's input was sampled
         
         # Jump button tracking for short hop detection
-        self.jump_press_frame = {}  # Tracks when jump button was pressed for each player
-        self.jump_release_frame = {}  # Tracks when jump button was released
+        self.jump_press_time = {}  # Tracks when jump button was pressed for each player
+        self.jump_release_time = {}  # Tracks when jump button was released
         self.current_frame = 0  # Current frame count for timing
         
         # Controller settings
         self.deadzone = DEFAULT_SETTINGS['controller_deadzone']
         
+        # Keyboard layouts by player index, compiled once (see rebind_key)
+        self.keyboard_controls = [dict(controls) for controls in KEYBOARD_LAYOUTS]
+        self.keyboard_layouts = [compile_layout(controls) for controls in self.keyboard_controls]
+        
         # Debug mode
         self.debug = False
     
@@ -67,13 +200,18 @@ class InputHandler:
             player_name: Name of the player
             is_player_one: True if this is player one (using controller)
         """
-        # Initialize intent state dictionaries for this player
-        self.player_intents[player_name] = {intent: False for intent in INTENTS.values()}
-        self.prev_player_intents[player_name] = {intent: False for intent in INTENTS.values()}
+        # Initialize intent masks for this player
+        self.intent_masks[player_name] = 0
+        self.prev_intent_masks[player_name] = 0
+        self.changed_masks[player_name] = 0
+        self.press_times[player_name] = {}
+        self.release_times[player_name] = {}
+        self.pending_releases[player_name] = {}
         
         # Initialize analog values for this player
-        self.analog_values[f"{player_name}_horizontal"] = 0.0
-        self.analog_values[f"{player_name}_vertical"] = 0.0
+        if player_name not in self.player_slots:
+            self.player_slots[player_name] = len(self.player_slots)
+            self.analog_values.extend([0.0] * len(ANALOG_AXES))
         
         # If this is player one and controllers are available, try to use controller
         if is_player_one and self.controller_enabled and pg.joystick.get_count() > 0:
@@ -102,10 +240,14 @@ class InputHandler:
                     'joystick': joystick,
                     'name': controller_name,
                     'id': controller_id,
+                    'instance_id': joystick.get_instance_id(),
                     'mapping': self._get_mapping_for_controller(controller_name),
                     'connected': True
                 }
                 
+                # Seed the event-driven state with one full poll
+                self._poll_controller_state(controller)
+                
                 # Print the button mapping that was selected
                 print(f"Using button mapping: {controller['mapping']}")
                 
@@ -125,6 +267,49 @@ class InputHandler:
             print(f"No controller found for {player_name}: {pg.joystick.get_count()} controllers available")
             return False
     
+    def _poll_controller_state(self, controller):
+        """
+        Read every button, axis and hat of a controller into controller['state']
+        
+        Only used to seed or resync the state; afterwards it is kept up to
+        date from JOYBUTTON/JOYAXIS/JOYHAT events in update().
+        """
+        joystick = controller['joystick']
+        controller['state'] = {
+            'buttons': [joystick.get_button(i) for i in range(joystick.get_numbuttons())],
+            'axes': [joystick.get_axis(i) for i in range(joystick.get_numaxes())],
+            'hats': [joystick.get_hat(i) for i in range(joystick.get_numhats())]
+        }
+    
+    def resync_controllers(self):
+        """
+        Re-poll all connected controllers, e.g. after a menu loop consumed
+        the joystick events this handler would otherwise have seen
+        """
+        for player_name, controller in self.controllers.items():
+            if controller['connected']:
+                try:
+                    self._poll_controller_state(controller)
+                except Exception as e:
+                    print(f"Error reading controller state for {player_name}: {e}")
+    
+    def _apply_controller_event(self, event):
+        """Update the state of the controller a JOY* event came from; returns its player name"""
+        for player_name, controller in self.controllers.items():
+            if controller['connected'] and controller.get('instance_id') == event.instance_id:
+                state = controller['state']
+                if event.type == pg.JOYBUTTONDOWN or event.type == pg.JOYBUTTONUP:
+                    if event.button < len(state['buttons']):
+                        state['buttons'][event.button] = 1 if event.type == pg.JOYBUTTONDOWN else 0
+                elif event.type == pg.JOYAXISMOTION:
+                    if event.axis < len(state['axes']):
+                        state['axes'][event.axis] = event.value
+                elif event.type == pg.JOYHATMOTION:
+                    if event.hat < len(state['hats']):
+                        state['hats'][event.hat] = event.value
+                return player_name
+        return None
+    
     def _get_mapping_for_controller(self, controller_name):
         """Determine button mapping based on controller type"""
         controller_name_lower = controller_name.lower()
@@ -175,65 +360,90 @@ class InputHandler:
                 INTENTS['QUIT']: 10,          # Home button
             }
     
-    def update(self, events):
+    def update(self, events, stamped_events=None):
         """
         Process all inputs and update player intent states
         
         Args:
             events: List of pygame events
+            stamped_events: Optional (perf_counter time, event) pairs for the
+                same events (see InputSampler); edges then carry the time of
+                the event that caused them instead of the frame's sample time
         """
         # Increment the current frame
         self.current_frame += 1
         
-        # Store previous frame's intents first for jump tracking
-        prev_intents = {}
-        for player_name in self.player_intents:
-            prev_intents[player_name] = self.player_intents[player_name].copy()
+        # This frame's masks start empty; every source ORs its bits in
+        masks = dict.fromkeys(self.intent_masks, 0)
         
         # Collect ALL input states at the same time to ensure consistent timing
         keys_pressed = pg.key.get_pressed()
+        sample_time = time.perf_counter()
+        self.sample_time = sample_time
+        if stamped_events is None:
+            stamped_events = [(sample_time, event) for event in events]
+        
+        # Button releases held back from the last batch are applied first
+        device_times = {}  # Maps player names to their first controller event time
+        deferred, self.deferred_events = self.deferred_events, []
+        for stamp, event in deferred:
+            player_name = self._apply_controller_event(event)
+            if player_name is not None:
+                device_times.setdefault(player_name, stamp)
+        
+        # Process connection/disconnection events, then fold button, axis
+        # and hat events into the controller states (no per-frame polling)
+        pressed_buttons = set()
+        for stamp, event in stamped_events:
+            if event.type in CONTROLLER_EVENTS:
+                if event.type == pg.JOYBUTTONUP and (event.instance_id, event.button) in pressed_buttons:
+                    # Pressed and released between two frames: keep it down for this one
+                    self.deferred_events.append((stamp, event))
+                    continue
+                if event.type == pg.JOYBUTTONDOWN:
+                    pressed_buttons.add((event.instance_id, event.button))
+                player_name = self._apply_controller_event(event)
+                if player_name is not None:
+                    device_times.setdefault(player_name, stamp)
+            
+            elif event.type == pg.JOYDEVICEADDED:
+                print(f"Controller connected: {event.device_index}")
+                self._reinitialize_controllers()
+                # Polling fallback: a new device starts from a full read
+                self.resync_controllers()
+            
+            elif event.type == pg.JOYDEVICEREMOVED:
+                print(f"Controller disconnected: {event.instance_id}")
+                for player_name, controller in self.controllers.items():
+                    if controller.get('instance_id') == event.instance_id:
+                        controller['connected'] = False
+                        print(f"Controller for {player_name} disconnected")
+                self._reinitialize_controllers()
         
-        # Collect controller state information upfront for all connected controllers
+        # Controller states for this frame, as maintained from events
         controller_states = {}
         if self.controller_enabled:
             for player_name, controller in self.controllers.items():
-                if controller['connected']:
-                    try:
-                        joystick = controller['joystick']
-                        
-                        # Create a snapshot of all controller data
-                        state = {
-                            'buttons': [joystick.get_button(i) for i in range(joystick.get_numbuttons())],
-                            'axes': [joystick.get_axis(i) for i in range(joystick.get_numaxes())],
-                            'hats': [joystick.get_hat(i) for i in range(joystick.get_numhats())]
-                        }
-                        controller_states[player_name] = state
-                        
-                        # Store axes values directly in analog_values
-                        if joystick.get_numaxes() > 0:
-                            x_axis = state['axes'][min(PRO_CONTROLLER['l_stick_x'], joystick.get_numaxes()-1)]
-                            self.analog_values[f"{player_name}_horizontal"] = x_axis
-                        
-                        if joystick.get_numaxes() > 1:
-                            y_axis = state['axes'][min(PRO_CONTROLLER['l_stick_y'], joystick.get_numaxes()-1)]
-                            self.analog_values[f"{player_name}_vertical"] = y_axis
-                            
-                    except Exception as e:
-                        print(f"Error reading controller state for {player_name}: {e}")
-        
-        # Store previous intent states for edge detection
-        for player_name in self.player_intents:
-            self.prev_player_intents[player_name] = prev_intents[player_name]
-            # Reset all intents to False
-            for intent in INTENTS.values():
-                self.player_intents[player_name][intent] = False
+                if controller['connected'] and 'state' in controller:
+                    state = controller['state']
+                    controller_states[player_name] = state
+                    
+                    # Store axes values directly in analog_values
+                    slot = self.player_slots.get(player_name)
+                    axes = state['axes']
+                    if slot is not None:
+                        base = slot * len(ANALOG_AXES)
+                        if len(axes) > 0:
+                            self.analog_values[base + ANALOG_AXES['horizontal']] = axes[min(PRO_CONTROLLER['l_stick_x'], len(axes)-1)]
+                        if len(axes) > 1:
+                            self.analog_values[base + ANALOG_AXES['vertical']] = axes[min(PRO_CONTROLLER['l_stick_y'], len(axes)-1)]
         
         # Process controller inputs FIRST (they have priority)
         if self.controller_enabled:
             for player_name, controller in self.controllers.items():
-                if controller['connected'] and player_name in controller_states:
+                if controller['connected'] and player_name in controller_states and player_name in masks:
                     # Process controller input using the snapshot we already took
-                    self._process_controller_state(player_name, controller, controller_states[player_name])
+                    masks[player_name] |= self._process_controller_state(player_name, controller, controller_states[player_name])
                     
                     # Debug output for controller state
                     if self.debug and hasattr(self, 'debug_frame_counter') and self.debug_frame_counter % 60 == 0:
@@ -266,9 +476,9 @@ class InputHandler:
         
         # Process keyboard inputs AFTER controllers (they only apply if no controller for that player)
         # Only use keyboard for players that don't have a controller connected
+        keyboard_players = []
         if self.keyboard_enabled:
-            player_names = list(self.player_intents.keys())
-            for i, player_name in enumerate(player_names):
+            for i, player_name in enumerate(masks):
                 # Skip if this player already has controller input
                 if player_name in self.controllers and self.controllers[player_name]['connected']:
                     # Log that we're skipping keyboard for this player
@@ -276,22 +486,35 @@ class InputHandler:
                         print(f"Skipping keyboard input for {player_name} - controller is primary input")
                     continue
                 
-                # Process keyboard for this player based on index (player 1 = arrows, player 2 = WASD)
-                self._process_keyboard_for_player(player_name, keys_pressed, i)
-        
-        # Process connection/disconnection events
-        for event in events:
-            if event.type == pg.JOYDEVICEADDED:
-                print(f"Controller connected: {event.device_index}")
-                self._reinitialize_controllers()
+                # Process keyboard for this player based on index (see config.KEYBOARD_LAYOUTS)
+                masks[player_name] = self._process_keyboard_for_player(player_name, keys_pressed, i)
+                if i < len(self.keyboard_layouts):
+                    keyboard_players.append((player_name, i))
+        
+        # Taps shorter than a frame never show up in get_pressed()
+        key_times = self._latch_key_events(stamped_events, masks, keyboard_players)
+        
+        # Commit the new masks; XOR with last frame gives every edge at once
+        for player_name, mask in masks.items():
+            prev = self.intent_masks[player_name]
+            changed = mask ^ prev
+            self.prev_intent_masks[player_name] = prev
+            self.intent_masks[player_name] = mask
+            self.changed_masks[player_name] = changed
             
-            elif event.type == pg.JOYDEVICEREMOVED:
-                print(f"Controller disconnected: {event.device_index}")
-                for player_name, controller in self.controllers.items():
-                    if controller['id'] == event.device_index:
-                        controller['connected'] = False
-                        print(f"Controller for {player_name} disconnected")
-                self._reinitialize_controllers()
+            down_times, up_times, latched = key_times.get(player_name, ({}, {}, {}))
+            if changed:
+                self._record_edge_times(player_name, mask & changed, prev & changed,
+                                        down_times, up_times, device_times.get(player_name, sample_time))
+            self.pending_releases[player_name] = latched
+            
+            # Stamp rising edges for input-to-photon latency measurement
+            activated = mask & changed
+            if activated:
+                presses = self.press_times[player_name]
+                for intent, bit in INTENT_BITS.items():
+                    if activated & bit:
+                        frame_profiler.stamp_input(player_name, (intent,), presses[bit])
         
         # Update debug counter
         if not hasattr(self, 'debug_frame_counter'):
@@ -303,78 +526,114 @@ class InputHandler:
         
         # Log current jump tracking state occasionally for debugging
         if self.debug_frame_counter % 60 == 0:
-            for player_name in self.player_intents:
-                press_frame = self.jump_press_frame.get(player_name, 0)
-                release_frame = self.jump_release_frame.get(player_name, 0)
-                if press_frame > 0:
-                    print(f"DEBUG: {player_name} jump tracking state - press_frame: {press_frame}, held for {self.current_frame - press_frame} frames")
+            for player_name in self.intent_masks:
+                press_time = self.jump_press_time.get(player_name, 0.0)
+                if press_time:
+                    print(f"DEBUG: {player_name} jump tracking state - held for {(sample_time - press_time) * REFERENCE_FPS:.1f} frames")
         
         # Debug output
         if self.debug and self.debug_frame_counter % 60 == 0:
-            for player_name, intents in self.player_intents.items():
-                active_intents = [intent for intent, active in intents.items() if active]
+            for player_name, mask in self.intent_masks.items():
+                active_intents = [intent for intent, bit in INTENT_BITS.items() if mask & bit]
                 if active_intents:
                     print(f"{player_name} intents: {', '.join(active_intents)}")
     
     def _process_keyboard_for_player(self, player_name, keys_pressed, player_index):
-        """Process keyboard inputs for a specific player"""
-        # Get player intents
-        intents = self.player_intents[player_name]
-        
-        # Default key assignments
-        # Player 1 uses arrow keys + Left Alt/Shift/Ctrl
-        # Player 2 uses WASD + E/Q/R keys
-        
-        # Create a list of keys to check based on player index
-        keys_to_check = [
-            # Player 1 keys (arrows + alt/shift/ctrl)
-            {
-                'left': pg.K_LEFT,
-                'right': pg.K_RIGHT,
-                'up': pg.K_UP,              # Jump
-                'down': pg.K_DOWN,
-                'weak_attack': pg.K_z,
-                'heavy_attack': pg.K_x,
-                'shield': pg.K_LSHIFT,
-                'menu': pg.K_ESCAPE,
-                'restart': pg.K_r,
-                'quit': pg.K_q
-            },
-            # Player 2 keys (WASD + E/Q/R)
-            {
-                'left': pg.K_a,
-                'right': pg.K_d,
-                'up': pg.K_w,               # Jump
-                'down': pg.K_s,
-                'weak_attack': pg.K_g,
-                'heavy_attack': pg.K_h,
-                'shield': pg.K_e,
-                'menu': pg.K_ESCAPE,
-                'restart': pg.K_r,
-                'quit': pg.K_q
-            }
-        ]
+        """Process keyboard inputs for a specific player; returns its intent mask"""
+        if player_index >= len(self.keyboard_layouts):
+            # No keyboard layout for this player (they need a controller)
+            return 0
+        gather, bits, _ = self.keyboard_layouts[player_index]
+        return reduce(or_, compress(bits, gather(keys_pressed)), 0)
+    
+    def _latch_key_events(self, stamped_events, masks, keyboard_players):
+        """
+        Fold this batch's KEYDOWN/KEYUP events into the keyboard players' masks
         
-        # Get key assignments for this player
-        keys = keys_to_check[min(player_index, len(keys_to_check) - 1)]
+        A key pressed and released between two frames is already up in
+        pg.key.get_pressed(), so its bits are latched on for this frame and
+        the release is reported on the next one with the KEYUP time.
         
-        # Process movement intents
-        intents[INTENTS['MOVE_LEFT']] = keys_pressed[keys['left']]
-        intents[INTENTS['MOVE_RIGHT']] = keys_pressed[keys['right']]
-        intents[INTENTS['MOVE_UP']] = keys_pressed[keys['up']]
-        intents[INTENTS['MOVE_DOWN']] = keys_pressed[keys['down']]
+        Args:
+            stamped_events: (perf_counter time, event) pairs for this frame
+            masks: This frame's intent masks (updated in place)
+            keyboard_players: (player name, layout index) of keyboard players
+            
+        Returns:
+            dict: Player name -> ({bit: KEYDOWN time}, {bit: KEYUP time}, {bit: latched release time})
+        """
+        key_times = {}
+        if not keyboard_players:
+            return key_times
+        for stamp, event in stamped_events:
+            if event.type != pg.KEYDOWN and event.type != pg.KEYUP:
+                continue
+            for player_name, player_index in keyboard_players:
+                bits = self.keyboard_layouts[player_index][2].get(event.key)
+                if not bits:
+                    continue
+                down_times, up_times, _ = key_times.setdefault(player_name, ({}, {}, {}))
+                for bit in bits:
+                    if event.type == pg.KEYDOWN:
+                        down_times.setdefault(bit, stamp)
+                    else:
+                        up_times[bit] = stamp
+        for player_name, (down_times, up_times, latched) in key_times.items():
+            for bit, stamp in down_times.items():
+                if not masks[player_name] & bit:
+                    masks[player_name] |= bit
+                    latched[bit] = up_times.get(bit, stamp)
+        return key_times
+    
+    def _record_edge_times(self, player_name, activated, deactivated, down_times, up_times, fallback):
+        """
+        Store when each changed intent bit went down or up
         
-        # Process attack intents
-        intents[INTENTS['WEAK_ATTACK']] = keys_pressed[keys['weak_attack']]
-        intents[INTENTS['HEAVY_ATTACK']] = keys_pressed[keys['heavy_attack']]
+        Key edges use their KEYDOWN/KEYUP time, controller edges the time of
+        the controller's first event this frame, anything else the fallback.
+        """
+        presses = self.press_times[player_name]
+        releases = self.release_times[player_name]
+        pending = self.pending_releases.get(player_name, {})
+        for bit in INTENT_BITS.values():
+            if activated & bit:
+                presses[bit] = down_times.get(bit, fallback)
+            elif deactivated & bit:
+                releases[bit] = pending.get(bit) or up_times.get(bit, fallback)
+    
+    def set_keyboard_layout(self, player_index, controls):
+        """
+        Replace a player's keyboard layout at runtime
         
-        # Process shield intent
-        intents[INTENTS['SHIELD']] = keys_pressed[keys['shield']]
+        Args:
+            player_index: Keyboard player index (0 = first player added)
+            controls: Dict of action name ('left', 'weak_attack', ...) to key
+        """
+        while len(self.keyboard_controls) <= player_index:
+            self.keyboard_controls.append({})
+            self.keyboard_layouts.append(compile_layout({}))
+        # Compile first so a rejected layout leaves the current one in place
+        layout = compile_layout(controls)
+        self.keyboard_controls[player_index] = dict(controls)
+        self.keyboard_layouts[player_index] = layout
+    
+    def rebind_key(self, player_index, action, key):
+        """
+        Bind one action of a player's keyboard layout to a new key
         
-        # Process game control intents
-        intents[INTENTS['MENU']] = keys_pressed[keys['menu']]
-        intents[INTENTS['RESTART']] = keys_pressed[keys['restart']]
-        intents[INTENTS['QUIT']] = keys_pressed[keys['quit']]
+        Args:
+            player_index: Keyboard player index (0 = first player added)
+            action: Action name from KEY_ACTIONS (e.g., 'shield')
+            key: Pygame key constant
+            
+        Raises:
+            ValueError: If key is one of config.RESERVED_KEYS
+        """
+        if action not in KEY_ACTIONS:
+            raise KeyError(f"Unknown keyboard action: {action}")
+        controls = dict(self.keyboard_controls[player_index]) if player_index < len(self.keyboard_controls) else {}
+        controls[action] = key
+        self.set_keyboard_layout(player_index, controls)
     
     def _process_keyboard(self, keys_pressed):
         """
@@ -387,11 +646,10 @@ class InputHandler:
             keys_pressed: Pygame key state dictionary
         """
         # Map keyboard inputs to each player in order
-        player_names = list(self.player_intents.keys())
-        for i, player_name in enumerate(player_names):
+        for i, player_name in enumerate(list(self.intent_masks)):
             # Only process keyboard for players without connected controllers
             if player_name not in self.controllers or not self.controllers[player_name]['connected']:
-                self._process_keyboard_for_player(player_name, keys_pressed, i)
+                self.intent_masks[player_name] = self._process_keyboard_for_player(player_name, keys_pressed, i)
     
     def _process_controller_state(self, player_name, controller, state):
         """
@@ -401,43 +659,46 @@ class InputHandler:
             player_name: Name of the player
             controller: Controller object
             state: Snapshot of controller state with buttons, axes, and hats
+            
+        Returns:
+            int: Intent mask for the buttons, stick and D-pad in the snapshot
         """
+        mask = 0
         try:
             mapping = controller['mapping']
-            intents = self.player_intents[player_name]
             
             # Process button inputs based on mapping
             for intent, button in mapping.items():
                 if button is not None and button < len(state['buttons']) and state['buttons'][button]:
-                    intents[intent] = True
+                    mask |= INTENT_BITS[intent]
                     if self.debug and self.debug_frame_counter % 30 == 0:
                         print(f"{player_name} button {button} -> {intent}")
             
             # Check for B button to work as jump (Switch Pro Controller)
             b_button = min(PRO_CONTROLLER['b_button'], len(state['buttons'])-1)
             if b_button >= 0 and state['buttons'][b_button]:
-                intents[INTENTS['MOVE_UP']] = True
+                mask |= INTENT_BITS[INTENTS['MOVE_UP']]
                 if self.debug and self.debug_frame_counter % 30 == 0:
                     print(f"{player_name} B button ({b_button}) -> MOVE_UP (jump)")
             
             # A button as jump (Switch Pro Controller)
             a_button = min(PRO_CONTROLLER['a_button'], len(state['buttons'])-1)
             if a_button >= 0 and state['buttons'][a_button]:
-                intents[INTENTS['MOVE_UP']] = True
+                mask |= INTENT_BITS[INTENTS['MOVE_UP']]
                 if self.debug and self.debug_frame_counter % 30 == 0:
                     print(f"{player_name} A button ({a_button}) -> MOVE_UP (jump)")
             
             # Y button as weak attack
             y_button = min(PRO_CONTROLLER['y_button'], len(state['buttons'])-1)
             if y_button >= 0 and state['buttons'][y_button]:
-                intents[INTENTS['WEAK_ATTACK']] = True
+                mask |= INTENT_BITS[INTENTS['WEAK_ATTACK']]
                 if self.debug and self.debug_frame_counter % 30 == 0:
                     print(f"{player_name} Y button ({y_button}) -> WEAK_ATTACK")
                     
             # X button as strong attack
             x_button = min(PRO_CONTROLLER['x_button'], len(state['buttons'])-1)
             if x_button >= 0 and state['buttons'][x_button]:
-                intents[INTENTS['HEAVY_ATTACK']] = True
+                mask |= INTENT_BITS[INTENTS['HEAVY_ATTACK']]
                 if self.debug and self.debug_frame_counter % 30 == 0:
                     print(f"{player_name} X button ({x_button}) -> HEAVY_ATTACK")
             
@@ -481,7 +742,7 @@ class InputHandler:
             
             # Set the shield intent if any shield button is active
             if shield_active:
-                intents[INTENTS['SHIELD']] = True
+                mask |= INTENT_BITS[INTENTS['SHIELD']]
                 # Always print shield activation in debug mode (regardless of frame)
                 if self.debug:
                     print(f"DEBUG: {player_name} SHIELD intent activated - shield button pressed")
@@ -522,22 +783,22 @@ class InputHandler:
             # Map analog and hat inputs to movement intents
             # Note: For stick, up is negative Y, down is positive Y
             if hat_input[1] == 1 or y_axis < -0.5:  # Up
-                intents[INTENTS['MOVE_UP']] = True
+                mask |= INTENT_BITS[INTENTS['MOVE_UP']]
                 if self.debug and self.debug_frame_counter % 30 == 0:
                     print(f"{player_name} MOVE_UP intent: hat={hat_input[1]}, y_axis={y_axis:.2f}")
             
             if hat_input[1] == -1 or y_axis > 0.5:  # Down
-                intents[INTENTS['MOVE_DOWN']] = True
+                mask |= INTENT_BITS[INTENTS['MOVE_DOWN']]
                 if self.debug and self.debug_frame_counter % 30 == 0:
                     print(f"{player_name} MOVE_DOWN intent: hat={hat_input[1]}, y_axis={y_axis:.2f}")
             
             if hat_input[0] == -1 or x_axis < -0.5:  # Left
-                intents[INTENTS['MOVE_LEFT']] = True
+                mask |= INTENT_BITS[INTENTS['MOVE_LEFT']]
                 if self.debug and self.debug_frame_counter % 30 == 0:
                     print(f"{player_name} MOVE_LEFT intent: hat={hat_input[0]}, x_axis={x_axis:.2f}")
             
             if hat_input[0] == 1 or x_axis > 0.5:  # Right
-                intents[INTENTS['MOVE_RIGHT']] = True
+                mask |= INTENT_BITS[INTENTS['MOVE_RIGHT']]
                 if self.debug and self.debug_frame_counter % 30 == 0:
                     print(f"{player_name} MOVE_RIGHT intent: hat={hat_input[0]}, x_axis={x_axis:.2f}")
                 
@@ -545,6 +806,7 @@ class InputHandler:
             print(f"Error processing controller state for {player_name}: {e}")
             import traceback
             traceback.print_exc()
+        return mask
     
     def _reinitialize_controllers(self):
         """Reinitialize all controllers"""
@@ -567,9 +829,7 @@ class InputHandler:
         Returns:
             bool: True if the intent is active, False otherwise
         """
-        if player_name in self.player_intents:
-            return self.player_intents[player_name].get(intent, False)
-        return False
+        return bool(self.intent_masks.get(player_name, 0) & INTENT_BITS.get(intent, 0))
     
     def is_intent_just_activated(self, player_name, intent):
         """
@@ -582,11 +842,8 @@ class InputHandler:
         Returns:
             bool: True if the intent was just activated, False otherwise
         """
-        if player_name in self.player_intents and player_name in self.prev_player_intents:
-            current = self.player_intents[player_name].get(intent, False)
-            previous = self.prev_player_intents[player_name].get(intent, False)
-            return current and not previous
-        return False
+        bit = INTENT_BITS.get(intent, 0)
+        return bool(self.changed_masks.get(player_name, 0) & self.intent_masks.get(player_name, 0) & bit)
     
     def is_intent_just_deactivated(self, player_name, intent):
         """
@@ -599,11 +856,68 @@ class InputHandler:
         Returns:
             bool: True if the intent was just deactivated, False otherwise
         """
-        if player_name in self.player_intents and player_name in self.prev_player_intents:
-            current = self.player_intents[player_name].get(intent, False)
-            previous = self.prev_player_intents[player_name].get(intent, False)
-            return not current and previous
-        return False
+        bit = INTENT_BITS.get(intent, 0)
+        return bool(self.changed_masks.get(player_name, 0) & self.prev_intent_masks.get(player_name, 0) & bit)
+    
+    def get_intent_mask(self, player_name):
+        """
+        Get a player's intents for this frame as one INTENT_BITS word
+        (compact enough to record for replays or send over the network)
+        
+        Args:
+            player_name: Name of the player
+            
+        Returns:
+            int: The intent mask, 0 for unknown players
+        """
+        return self.intent_masks.get(player_name, 0)
+    
+    def get_press_time(self, player_name, intent):
+        """
+        Get when a player's intent last became active
+        
+        Args:
+            player_name: Name of the player
+            intent: The intent to check
+            
+        Returns:
+            float: time.perf_counter() of the key/button event, or None if never pressed
+        """
+        return self.press_times.get(player_name, {}).get(INTENT_BITS.get(intent, 0))
+    
+    def get_release_time(self, player_name, intent):
+        """
+        Get when a player's intent last became inactive
+        
+        Args:
+            player_name: Name of the player
+            intent: The intent to check
+            
+        Returns:
+            float: time.perf_counter() of the key/button event, or None if never released
+        """
+        return self.release_times.get(player_name, {}).get(INTENT_BITS.get(intent, 0))
+    
+    def get_hold_frames(self, player_name, intent, since=None):
+        """
+        Get how long an intent has been held (or was held, once released)
+        
+        Args:
+            player_name: Name of the player
+            intent: The intent to check
+            since: Optional time.perf_counter() to measure from instead of the press
+            
+        Returns:
+            float: Hold time in REFERENCE_FPS frames (fractional, sub-frame accurate)
+        """
+        start = since if since is not None else self.get_press_time(player_name, intent)
+        if start is None:
+            return 0.0
+        if self.get_intent(player_name, intent):
+            end = self.sample_time
+        else:
+            end = self.get_release_time(player_name, intent) or self.sample_time
+        return max(0.0, end - start) * REFERENCE_FPS
     
     def get_analog_value(self, player_name, axis):
         """
@@ -616,8 +930,10 @@ class InputHandler:
         Returns:
             float: Analog value between -1.0 and 1.0
         """
-        key = f"{player_name}_{axis}"
-        return self.analog_values.get(key, 0.0)
+        slot = self.player_slots.get(player_name)
+        if slot is None or axis not in ANALOG_AXES:
+            return 0.0
+        return self.analog_values[slot * len(ANALOG_AXES) + ANALOG_AXES[axis]]
     
     def set_debug(self, debug):
         """
@@ -648,7 +964,8 @@ class InputHandler:
             }
             
             # Process using the snapshot method
-            self._process_controller_state(player_name, controller, state)
+            if player_name in self.intent_masks:
+                self.intent_masks[player_name] |= self._process_controller_state(player_name, controller, state)
                 
         except Exception as e:
             print(f"Error reading controller for {player_name}: {e}")
@@ -658,65 +975,68 @@ class InputHandler:
 
     def _update_jump_tracking(self):
         """Update jump button press and release tracking for short hop detection"""
-        for player_name in self.player_intents:
+        jump_bit = INTENT_BITS[INTENTS['MOVE_UP']]
+        for player_name, mask in self.intent_masks.items():
             # Get the current and previous jump button state
-            current_jump_pressed = self.get_intent(player_name, INTENTS['MOVE_UP'])
-            previous_jump_pressed = self.prev_player_intents[player_name].get(INTENTS['MOVE_UP'], False)
+            current_jump_pressed = mask & jump_bit
+            previous_jump_pressed = self.prev_intent_masks[player_name] & jump_bit
             
             # Check for button press (rising edge)
             if current_jump_pressed and not previous_jump_pressed:
-                # Reset any previous release frame
-                self.jump_release_frame[player_name] = 0
+                # Reset any previous release time
+                self.jump_release_time[player_name] = 0.0
                 
-                # Record the press frame if not already set
-                if self.jump_press_frame.get(player_name, 0) == 0:
-                    self.jump_press_frame[player_name] = self.current_frame
+                # Record the press time if not already set
+                if not self.jump_press_time.get(player_name, 0.0):
+                    self.jump_press_time[player_name] = self.press_times[player_name][jump_bit]
                     print(f"DEBUG: {player_name} jump button PRESSED at frame {self.current_frame}")
             
             # Check for button release (falling edge)
             elif not current_jump_pressed and previous_jump_pressed:
-                press_frame = self.jump_press_frame.get(player_name, 0)
+                press_time = self.jump_press_time.get(player_name, 0.0)
                 
                 # Only record release if we have a valid press
-                if press_frame > 0:
-                    self.jump_release_frame[player_name] = self.current_frame
-                    frames_held = self.current_frame - press_frame
-                    print(f"DEBUG: {player_name} jump button RELEASED at frame {self.current_frame} (held for {frames_held} frames)")
+                if press_time:
+                    release_time = self.release_times[player_name][jump_bit]
+                    self.jump_release_time[player_name] = release_time
+                    frames_held = (release_time - press_time) * REFERENCE_FPS
+                    print(f"DEBUG: {player_name} jump button RELEASED at frame {self.current_frame} (held for {frames_held:.1f} frames)")
             
             # Reset stale jump presses
-            press_frame = self.jump_press_frame.get(player_name, 0)
-            if press_frame > 0 and self.current_frame - press_frame > 20:  # Reduced from 60 to 20 frames
+            press_time = self.jump_press_time.get(player_name, 0.0)
+            if press_time and (self.sample_time - press_time) * REFERENCE_FPS > 20:  # Reduced from 60 to 20 frames
                 print(f"DEBUG: Clearing stale jump press for {player_name} (held for too long without release)")
-                self.jump_press_frame[player_name] = 0
-                self.jump_release_frame[player_name] = 0
+                self.jump_press_time[player_name] = 0.0
+                self.jump_release_time[player_name] = 0.0
     
     def is_short_hop(self, player_name):
         """Check if player performed a short hop (quick press and release of jump button)"""
-        # Get the frame numbers for this player
-        press_frame = self.jump_press_frame.get(player_name, 0)
-        release_frame = self.jump_release_frame.get(player_name, 0)
+        # Get the press and release times for this player
+        press_time = self.jump_press_time.get(player_name, 0.0)
+        release_time = self.jump_release_time.get(player_name, 0.0)
         
         # Check if we have valid press and release data
-        if press_frame > 0 and release_frame > press_frame:
+        if press_time and release_time >= press_time:
             # Check if button was released quickly enough for short hop
-            frames_held = release_frame - press_frame
-            is_short_hop = frames_held <= 7  # Melee-accurate timing (typically 3-7 frames)
+            frames_held = (release_time - press_time) * REFERENCE_FPS
+            is_short_hop = frames_held <= SHORT_HOP_FRAMES
             
             if is_short_hop:
-                print(f"DEBUG: {player_name} performed short hop (held for {frames_held} frames)")
+                print(f"DEBUG: {player_name} performed short hop (held for {frames_held:.1f} frames)")
             else:
-                print(f"DEBUG: {player_name} pressed jump too long for short hop (held for {frames_held} frames)")
+                print(f"DEBUG: {player_name} pressed jump too long for short hop (held for {frames_held:.1f} frames)")
             
             # Reset tracking after checking
-            self.jump_press_frame[player_name] = 0
-            self.jump_release_frame[player_name] = 0
+            self.jump_press_time[player_name] = 0.0
+            self.jump_release_time[player_name] = 0.0
             
             return is_short_hop
         
         return False
 
 # Create a global instance
-input_handler = InputHandler() 
+input_handler = InputHandler()
+input_sampler = InputSampler()
 
 # Test function for when this file is run directly
 if __name__ == "__main__":
@@ -202,4 +202,86 @@ def calculate_hitstun(knockback):
         Number of frames the character will be in hitstun
     """
     import math
-    return math.floor(LAUNCH_AND_STUN['hitstun_frames_factor'] * knockback) 
\ No newline at end of file
+    return math.floor(LAUNCH_AND_STUN['hitstun_frames_factor'] * knockback)
+
+
+class PhysicsProfile:
+    """
+    One character's physics constants, compiled from the tables above into
+    plain attributes so per-frame code doesn't walk nested dicts. Values a
+    character's table leaves out come from 'generic'. Profiles are frozen
+    and shared, so get them from physics_profile() rather than building them.
+    """
+    __slots__ = (
+        'character_type',
+        # Ground movement
+        'walk_speed', 'dash_speed', 'run_speed', 'ground_accel', 'traction',
+        'dash_to_run_transition_frames', 'traction_multiplier_if_speed_gt_walk',
+        # Air movement
+        'air_speed', 'air_accel', 'gravity', 'fall_speed', 'fast_fall_multiplier',
+        # Knockback and landing
+        'weight', 'tumble_threshold', 'normal_landing_lag_frames',
+        'aerial_lag_min_frames', 'aerial_lag_max_frames',
+        'l_cancel_window_frames', 'l_cancel_factor',
+    )
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"PhysicsProfile is frozen (tried to set {name})")
+
+    def as_row(self):
+        """Values in __slots__ order, e.g. as one row of a parameter table"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f"PhysicsProfile({self.character_type}, weight={self.weight})"
+
+# Compiled profiles by (character type, weight)
+_physics_profiles = {}
+
+def physics_profile(character_type='generic', weight=None):
+    """
+    Get the compiled physics profile of a character type (cached)
+
+    Args:
+        character_type: Table key ('mario', 'luigi', 'generic'); unknown types use 'generic'
+        weight: Knockback weight override (None uses KNOCKBACK['weight'])
+
+    Returns:
+        PhysicsProfile: The shared, frozen profile
+    """
+    character_type = character_type.lower()
+    if weight is None:
+        weight = KNOCKBACK['weight'].get(character_type, KNOCKBACK['weight']['generic'])
+    key = (character_type, weight)
+    profile = _physics_profiles.get(key)
+    if profile is None:
+        ground = dict(GROUND_MOVEMENT['generic'], **GROUND_MOVEMENT.get(character_type, {}))
+        air = dict(AIR_MOVEMENT['generic'], **AIR_MOVEMENT.get(character_type, {}))
+        aerial_lag_min, aerial_lag_max = LANDING_LAG['aerial_lag_frames_range']
+        profile = _physics_profiles[key] = PhysicsProfile(
+            character_type=character_type,
+            walk_speed=ground['walk_speed'],
+            dash_speed=ground['dash_speed'],
+            run_speed=ground['run_speed'],
+            ground_accel=ground['ground_accel_base'] + ground['ground_accel_additional'],
+            traction=ground['traction'],
+            dash_to_run_transition_frames=ground['dash_to_run_transition_frames'],
+            traction_multiplier_if_speed_gt_walk=ground['traction_multiplier_if_speed_gt_walk'],
+            air_speed=air['air_speed'],
+            air_accel=air['air_accel_base'] + air['air_accel_additional'],
+            gravity=air['gravity'],
+            fall_speed=air['fall_speed'],
+            fast_fall_multiplier=air['fast_fall_multiplier'],
+            weight=weight,
+            tumble_threshold=LAUNCH_AND_STUN['tumble_threshold'],
+            normal_landing_lag_frames=LANDING_LAG['normal_landing_lag_frames'],
+            aerial_lag_min_frames=aerial_lag_min,
+            aerial_lag_max_frames=aerial_lag_max,
+            l_cancel_window_frames=LANDING_LAG['l_cancel_window_frames'],
+            l_cancel_factor=LANDING_LAG['l_cancel_factor'],
+        )
+    return profile
@@ -4,9 +4,11 @@ import pygame as pg
 # move up one directory to be able to import the settings and images
 sys.path.append("..")
 from objects.Button import Button
+from menus.MenuLoop import MenuLoop
 from settings import *
 from images import *
 from sound_manager import sound_manager
+from assets import assets
 
 class Intro:
     def __init__(self, game):
@@ -16,10 +18,11 @@ class Intro:
         guide = Button('guide', 400, 400, 300, 100)
         about = Button('about', 400, 525, 300, 100)
 
-        while self.game.status == INTRO:
-            self.game.screen.blit(INTRO_BG, ORIGIN)
+        menu = MenuLoop(self.game)
+        background = assets.converted(INTRO_BG)
 
-            for event in pg.event.get():
+        while self.game.status == INTRO:
+            for event in menu.events():
                 pos = pg.mouse.get_pos()
 
                 if event.type == pg.QUIT:
@@ -52,8 +55,4 @@ class Intro:
                     if about.isOver(pos) and not about.is_highlighted:
                         sound_manager.play_ui_sound('select')
 
-            self.game.screen.blit(start.image, (start.x, start.y))
-            self.game.screen.blit(guide.image, (guide.x, guide.y))
-            self.game.screen.blit(about.image, (about.x, about.y))
-
-            pg.display.flip()
\ No newline at end of file
+            menu.draw(background, (start, guide, about))
\ No newline at end of file
@@ -0,0 +1,77 @@
+'''
+
+Shared loop for the menu screens (Intro, Start, Other).
+
+Menus are capped at MENU_FPS, and once a screen is fully drawn the loop
+blocks on pg.event.wait until the mouse or keyboard does something (or
+MENU_IDLE_TIMEOUT passes), so an idle title screen doesn't spin a core.
+Only buttons whose hover image changed are redrawn between full redraws.
+
+'''
+
+import sys
+import pygame as pg
+
+# move up one directory to be able to import the settings
+sys.path.append("..")
+from settings import *
+
+class MenuLoop:
+    def __init__(self, game, fps=MENU_FPS, idle_timeout=MENU_IDLE_TIMEOUT):
+        self.screen = game.screen
+        self.clock = pg.time.Clock()
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self.background = None
+        self.buttons = ()
+        self.drawn = {}  # button -> image it was last drawn with
+        self.full_redraw = True
+
+    # force a full redraw next frame (text or other non-button content changed)
+    def invalidate(self):
+        self.full_redraw = True
+
+    # returns the events for this frame; blocks while nothing needs drawing
+    def events(self):
+        self.clock.tick(self.fps)
+        if self.full_redraw:
+            return pg.event.get()
+        event = pg.event.wait(self.idle_timeout)
+        if event.type == pg.NOEVENT:
+            return []
+        return [event] + pg.event.get()
+
+    # draw the background, any extra content and the buttons
+    # draw_extra(screen) is only called on full redraws
+    def draw(self, background, buttons, draw_extra=None):
+        buttons = tuple(buttons)
+        if background is not self.background or buttons != self.buttons:
+            self.background = background
+            self.buttons = buttons
+            self.full_redraw = True
+
+        if self.full_redraw:
+            self.screen.blit(background, ORIGIN)
+            if draw_extra is not None:
+                draw_extra(self.screen)
+            self.drawn = {}
+            for button in buttons:
+                self.screen.blit(button.image, (button.x, button.y))
+                self.drawn[button] = button.image
+            pg.display.flip()
+            self.full_redraw = False
+            return
+
+        dirty = []
+        for button in buttons:
+            old_image = self.drawn.get(button)
+            if old_image is not button.image:
+                rect = button.image.get_rect(topleft=(button.x, button.y))
+                if old_image is not None:
+                    rect.union_ip(old_image.get_rect(topleft=(button.x, button.y)))
+                self.screen.blit(background, rect, rect)
+                self.screen.blit(button.image, rect)
+                self.drawn[button] = button.image
+                dirty.append(rect)
+        if dirty:
+            pg.display.update(dirty)
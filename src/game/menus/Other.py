@@ -4,8 +4,10 @@ import pygame as pg
 # move up one directory to be able to import the settings and images
 sys.path.append("..")
 from objects.Button import Button
+from menus.MenuLoop import MenuLoop
 from settings import *
 from images import *
+from assets import assets
 
 # this can either be the guide or about menu
 class Other:
@@ -14,10 +16,11 @@ class Other:
         
         back = Button('back', 20, 20, 100, 100)
 
-        while self.game.status == flag:
-            self.game.screen.blit(bg, ORIGIN)
+        menu = MenuLoop(self.game)
+        bg = assets.converted(bg)
 
-            for event in pg.event.get():
+        while self.game.status == flag:
+            for event in menu.events():
                 pos = pg.mouse.get_pos()
 
                 if event.type == pg.QUIT:
@@ -34,6 +37,4 @@ class Other:
                 if event.type == pg.MOUSEMOTION:
                     back.isOver(pos)
 
-            self.game.screen.blit(back.image, (back.x, back.y))
-
-            pg.display.flip()
\ No newline at end of file
+            menu.draw(bg, (back,))
\ No newline at end of file
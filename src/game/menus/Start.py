@@ -6,10 +6,17 @@ sys.path.append("..")
 from objects.Button import Button
 from objects.CharButton import CharButton
 from objects.ReadyButton import ReadyButton
+from menus.MenuLoop import MenuLoop
 from settings import *
 from images import *
 from Chat import Chat
 from sound_manager import sound_manager
+from assets import assets
+from characters.registry import character_registry
+
+# stat text positions under each character button
+STAT_COLUMNS = (106, 295, 470, 648, 824, 1001)
+STAT_ROWS = (581, 606, 631)
 
 class Start:
     def __init__(self, game):
@@ -43,44 +50,25 @@ class Start:
 
         font = pg.font.Font(None, 100)
 
-        self.start_name_bg = START_NAME_BG.convert()
-        self.start_no_name_bg = START_NO_NAME_BG.convert()
-        self.start_character_bg = START_CHARACTER_BG.convert()
-        self.start_waiting_bg = START_WAITING_BG.convert()
-        self.start_name_exists_bg = START_NAME_EXISTS_BG.convert()
+        self.start_name_bg = assets.converted(START_NAME_BG)
+        self.start_no_name_bg = assets.converted(START_NO_NAME_BG)
+        self.start_character_bg = assets.converted(START_CHARACTER_BG)
+        self.start_waiting_bg = assets.converted(START_WAITING_BG)
+        self.start_name_exists_bg = assets.converted(START_NAME_EXISTS_BG)
+
+        menu = MenuLoop(self.g)
 
         # note - self.g.curr_player = current text of the input player name
 
         while self.g.status == START:
 
-            if screen == 'name' or screen == 'no_name':
-                self.g.checkName(self.g.curr_player)
-
-            if screen == 'name':
-                self.g.screen.blit(self.start_name_bg, ORIGIN)
-            elif screen == 'no_name':
-                self.g.screen.blit(self.start_no_name_bg, ORIGIN)
-            elif screen == 'character':
-                self.g.screen.blit(self.start_character_bg, ORIGIN)
-                self.drawStats()
-            elif screen == 'waiting':
-                self.g.screen.blit(self.start_waiting_bg, ORIGIN)
-                text_surface = font.render(str(self.g.player_count), True, WHITE)
-                self.g.screen.blit(text_surface,(700,450))
-                
-            if screen == 'name' or screen == 'no_name':
-                if not self.g.name_available:
-                    # allow changing the name to player's own name
-                    # even though technically - that name is taken
-                    if self.g.curr_player != old_name: 
-                        self.g.screen.blit(self.start_name_exists_bg, ORIGIN)
-
-                text_surface = font.render(self.g.curr_player, True, WHITE)
-                self.g.screen.blit(text_surface, (355,355))
-            
-            for event in pg.event.get():
+            for event in menu.events():
                 pos = pg.mouse.get_pos()
 
+                # clicks and typing can change the text on screen
+                if event.type == pg.MOUSEBUTTONDOWN or event.type == pg.KEYDOWN:
+                    menu.invalidate()
+
                 if event.type == pg.QUIT:
                     print("You quit in the middle of the game!")
                     if enteredName:
@@ -222,60 +210,56 @@ class Start:
                     if len(self.g.curr_player) > 0:
                         # Play backspace sound
                         sound_manager.play_ui_sound('select')
+                        # keep deleting every frame while backspace is held
+                        menu.invalidate()
                     self.g.curr_player = self.g.curr_player[:-1]
 
-            if screen == 'character':
-                self.g.screen.blit(mario.image, (mario.x, mario.y))
-                self.g.screen.blit(luigi.image, (luigi.x, luigi.y))
-                self.g.screen.blit(yoshi.image, (yoshi.x, yoshi.y))
-                self.g.screen.blit(popo.image, (popo.x, popo.y))
-                self.g.screen.blit(nana.image, (nana.x, nana.y))
-                self.g.screen.blit(link.image, (link.x, link.y))
+            if screen == 'name' or screen == 'no_name':
+                self.g.checkName(self.g.curr_player)
 
+            buttons = []
+            if screen == 'name':
+                background = self.start_name_bg
+            elif screen == 'no_name':
+                background = self.start_no_name_bg
+            elif screen == 'character':
+                background = self.start_character_bg
+                buttons = [mario, luigi, yoshi, popo, nana, link]
             elif screen == 'waiting':
-                self.g.screen.blit(ready.image, (ready.x, ready.y))
+                background = self.start_waiting_bg
+                buttons = [ready]
 
             if not player_ready:
-                self.g.screen.blit(back.image, (back.x, back.y))
+                buttons.append(back)
+
+            menu.draw(background, buttons, lambda surface: self.drawText(screen, font, old_name))
+
+    # text drawn over the background - only on full redraws
+    def drawText(self, screen, font, old_name):
+        if screen == 'character':
+            self.drawStats()
+        elif screen == 'waiting':
+            text_surface = font.render(str(self.g.player_count), True, WHITE)
+            self.g.screen.blit(text_surface,(700,450))
+
+        if screen == 'name' or screen == 'no_name':
+            if not self.g.name_available:
+                # allow changing the name to player's own name
+                # even though technically - that name is taken
+                if self.g.curr_player != old_name: 
+                    self.g.screen.blit(self.start_name_exists_bg, ORIGIN)
 
-            pg.display.flip()
+            text_surface = font.render(self.g.curr_player, True, WHITE)
+            self.g.screen.blit(text_surface, (355,355))
 
     def drawStats(self):
-        # see notes.txt in root folder
-        mario = ['3', '6', '50']
-        luigi = ['4', '8', '40']
-        yoshi = ['5', '10', '30']
-        popo = ['5.5', '11', '25']
-        nana = ['5.7', '11', '22']
-        link = ['6', '12', '20']        
-        
+        # weak damage, heavy damage and speed from characters.json
         font = pg.font.Font(None, 30)
 
-        for i in range(0, 6):
-            if i == 0:
-                x = 106
-                char = mario
-            elif i == 1:
-                x = 295
-                char = luigi
-            elif i == 2:
-                x = 470
-                char = yoshi
-            elif i == 3:
-                x = 648
-                char = popo
-            elif i == 4:
-                x = 824
-                char = nana
-            elif i == 5:
-                x = 1001
-                char = link
-            for j in range(0,3):
-                if j == 0:
-                    y = 581
-                elif j == 1:
-                    y = 606
-                elif j == 2:
-                    y = 631
-                text = font.render(char[j], True, WHITE)
+        for char, x in zip((MARIO, LUIGI, YOSHI, POPO, NANA, LINK), STAT_COLUMNS):
+            definition = character_registry.get(char)
+            if definition is None:
+                continue
+            for value, y in zip(definition.stats(), STAT_ROWS):
+                text = font.render(value, True, WHITE)
                 self.g.screen.blit(text, (x, y))
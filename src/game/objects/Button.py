@@ -1,5 +1,5 @@
 import os
-import pygame as pg
+from assets import assets
 
 # add the path to the folder with the button images
 img_path = os.path.abspath(os.curdir) + '/images/buttons/'
@@ -11,7 +11,10 @@ class Button:
         self.y = y
         self.w = w
         self.h = h
-        self.image = pg.image.load(img_path+label+'a.png')
+        # load both images once - isOver only swaps between them
+        self.image_a = assets.load(img_path+label+'a.png')
+        self.image_b = assets.load(img_path+label+'b.png')
+        self.image = self.image_a
         self.is_highlighted = False
 
     # returns True and changes image if mouse is inside button
@@ -20,11 +23,11 @@ class Button:
         # pos is the mouse position or a tuple of (x,y) coordinates
         if pos[0] > self.x and pos[0] < self.x + self.w:
             if pos[1] > self.y and pos[1] < self.y + self.h:
-                self.image = pg.image.load(img_path+self.label+'b.png')
+                self.image = self.image_b
                 was_highlighted = self.is_highlighted
                 self.is_highlighted = True
                 return True
 
-        self.image = pg.image.load(img_path+self.label+'a.png')
+        self.image = self.image_a
         self.is_highlighted = False
-        return False
\ No newline at end of file
+        return False
@@ -6,24 +6,34 @@ A similar class has been made for optimization of the character selection screen
 '''
 
 import os
-import pygame as pg
+from assets import assets
 
 # add the path to the folder with the button images
 img_path = os.path.abspath(os.curdir) + '/images/buttons/'
 
 # preloaded images
-marioa = pg.image.load(img_path+'marioa.png') 
-mariob = pg.image.load(img_path+'mariob.png')
-luigia = pg.image.load(img_path+'luigia.png')
-luigib = pg.image.load(img_path+'luigib.png')
-yoshia = pg.image.load(img_path+'yoshia.png')
-yoshib = pg.image.load(img_path+'yoshib.png')
-popoa = pg.image.load(img_path+'popoa.png')
-popob = pg.image.load(img_path+'popob.png')
-nanaa = pg.image.load(img_path+'nanaa.png')
-nanab = pg.image.load(img_path+'nanab.png')
-linka = pg.image.load(img_path+'linka.png')
-linkb = pg.image.load(img_path+'linkb.png')
+marioa = assets.load(img_path+'marioa.png') 
+mariob = assets.load(img_path+'mariob.png')
+luigia = assets.load(img_path+'luigia.png')
+luigib = assets.load(img_path+'luigib.png')
+yoshia = assets.load(img_path+'yoshia.png')
+yoshib = assets.load(img_path+'yoshib.png')
+popoa = assets.load(img_path+'popoa.png')
+popob = assets.load(img_path+'popob.png')
+nanaa = assets.load(img_path+'nanaa.png')
+nanab = assets.load(img_path+'nanab.png')
+linka = assets.load(img_path+'linka.png')
+linkb = assets.load(img_path+'linkb.png')
+
+# (normal, highlighted) images by label
+images = {
+    'mario': (marioa, mariob),
+    'luigi': (luigia, luigib),
+    'yoshi': (yoshia, yoshib),
+    'popo': (popoa, popob),
+    'nana': (nanaa, nanab),
+    'link': (linka, linkb),
+}
 
 class CharButton:
     def __init__(self, label, x, y, w, h):
@@ -33,18 +43,10 @@ class CharButton:
         self.w = w
         self.h = h
         self.is_highlighted = False
-        if label == 'mario':
-            self.image = marioa
-        elif label == 'luigi':
-            self.image = luigia
-        elif label == 'yoshi':
-            self.image = yoshia
-        elif label == 'popo':
-            self.image = popoa
-        elif label == 'nana':
-            self.image = nanaa
-        elif label == 'link':
-            self.image = linka
+        # the preloaded images were loaded before the display was set
+        self.image_a = assets.converted(images[label][0])
+        self.image_b = assets.converted(images[label][1])
+        self.image = self.image_a
 
     # returns True and changes image if mouse is inside button
     # else returns False and retains original image
@@ -54,31 +56,9 @@ class CharButton:
             if pos[1] > self.y and pos[1] < self.y + self.h:
                 was_highlighted = self.is_highlighted
                 self.is_highlighted = True
-                if label == 'mario':
-                    self.image = mariob
-                elif label == 'luigi':
-                    self.image = luigib
-                elif label == 'yoshi':
-                    self.image = yoshib
-                elif label == 'popo':
-                    self.image = popob
-                elif label == 'nana':
-                    self.image = nanab
-                elif label == 'link':
-                    self.image = linkb
+                self.image = self.image_b
                 return True
 
         self.is_highlighted = False
-        if label == 'mario':
-            self.image = marioa
-        elif label == 'luigi':
-            self.image = luigia
-        elif label == 'yoshi':
-            self.image = yoshia
-        elif label == 'popo':
-            self.image = popoa
-        elif label == 'nana':
-            self.image = nanaa
-        elif label == 'link':
-            self.image = linka
-        return False
\ No newline at end of file
+        self.image = self.image_a
+        return False
@@ -1,5 +1,6 @@
 import os
 import pygame as pg
+from assets import assets
 
 # add the path to the folder with the other images
 img_path = os.path.abspath(os.curdir) + '/images/others/'
@@ -8,7 +9,7 @@ img_path = os.path.abspath(os.curdir) + '/images/others/'
 class Platform(pg.sprite.Sprite):
     def __init__(self, label, x, y, w, h):
         pg.sprite.Sprite.__init__(self)
-        self.image = pg.image.load(img_path+label+'.png').convert()
+        self.image = assets.load(img_path+label+'.png', alpha=False)
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
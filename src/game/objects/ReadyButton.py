@@ -5,7 +5,7 @@ This is similar to Button.py but when clicked - the old image stays.
 '''
 
 import os
-import pygame as pg
+from assets import assets
 
 # add the path to the folder with the button images
 img_path = os.path.abspath(os.curdir) + '/images/buttons/'
@@ -17,7 +17,10 @@ class ReadyButton:
         self.y = y
         self.w = w
         self.h = h
-        self.image = pg.image.load(img_path+label+'a.png')
+        # load both images once - isOver only swaps between them
+        self.image_a = assets.load(img_path+label+'a.png')
+        self.image_b = assets.load(img_path+label+'b.png')
+        self.image = self.image_a
         self.clicked = False
         self.is_highlighted = False
 
@@ -30,16 +33,16 @@ class ReadyButton:
                 was_highlighted = self.is_highlighted
                 self.is_highlighted = True
                 if self.clicked:
-                    self.image = pg.image.load(img_path+self.label+'a.png')
+                    self.image = self.image_a
                 else:
-                    self.image = pg.image.load(img_path+self.label+'b.png')
+                    self.image = self.image_b
                 return True
 
         self.is_highlighted = False
         if self.clicked:
-            self.image = pg.image.load(img_path+self.label+'b.png')
+            self.image = self.image_b
         else:
-            self.image = pg.image.load(img_path+self.label+'a.png')
+            self.image = self.image_a
         return False
 
     # toggle clicked attribute
@@ -7,7 +7,7 @@ to convert player intents into character actions.
 
 import pygame as pg
 from settings import LEFT, RIGHT, WALK, STAND, GAME_WIDTH
-from input_handler import input_handler, INTENTS
+from input_handler import input_handler, INTENTS, REFERENCE_FPS, SHORT_HOP_FRAMES
 
 class PlayerController:
     """
@@ -146,51 +146,55 @@ class PlayerController:
         # Handle jump intent states - core tracking variables
         self.jump_requested = getattr(self, 'jump_requested', False)  # If jump was requested but not executed yet
         self.jump_executed = getattr(self, 'jump_executed', False)  # If jump was already executed
-        self.jump_request_frame = getattr(self, 'jump_request_frame', 0)  # Frame when jump was requested
+        self.jump_request_time = getattr(self, 'jump_request_time', 0.0)  # Input time when jump was requested
         
         # Safety check - if jump was requested too long ago without execution, reset the state
-        if self.jump_requested and game.current_frame - self.jump_request_frame > 20:  # Reduced from 60 to 20 frames
+        if self.jump_requested and (input_handler.sample_time - self.jump_request_time) * REFERENCE_FPS > 20:  # Reduced from 60 to 20 frames
             print(f"DEBUG: {self.player_name} jump request timed out (no execution for 20 frames)")
             self._reset_jump_state(game)
         
         # Process jump button release (for short hop detection)
         if not sprite.is_jumping and not sprite.in_air and not sprite.animation_locked:
             # Check for jump button press - note this is different from just_activated
-            # We want to track the exact frame when the button was pressed
+            # We want to track the exact time when the button was pressed (sub-frame
+            # for a fresh press, otherwise this frame's input sample, e.g. on landing)
             if not self.jump_requested and input_handler.get_intent(self.player_name, INTENTS['MOVE_UP']):
                 self.jump_requested = True
-                self.jump_request_frame = game.current_frame
+                if input_handler.is_intent_just_activated(self.player_name, INTENTS['MOVE_UP']):
+                    self.jump_request_time = input_handler.get_press_time(self.player_name, INTENTS['MOVE_UP'])
+                else:
+                    self.jump_request_time = input_handler.sample_time
                 print(f"DEBUG: {self.player_name} jump requested at frame {game.current_frame}")
             
             # Check for jump button release while requested but not executed
             if self.jump_requested and not self.jump_executed and not input_handler.get_intent(self.player_name, INTENTS['MOVE_UP']):
-                frames_held = game.current_frame - self.jump_request_frame
+                frames_held = input_handler.get_hold_frames(self.player_name, INTENTS['MOVE_UP'], since=self.jump_request_time)
                 
                 # Perform short hop if button was released quickly enough
-                if frames_held <= 7:  # Melee-accurate timing (characters typically have 3-7 frame windows)
-                    print(f"DEBUG: {self.player_name} performing SHORT HOP after releasing at frame {game.current_frame} (held for {frames_held} frames)")
+                if frames_held <= SHORT_HOP_FRAMES:  # Melee-accurate timing (characters typically have 3-7 frame windows)
+                    print(f"DEBUG: {self.player_name} performing SHORT HOP after releasing at frame {game.current_frame} (held for {frames_held:.1f} frames)")
                     sprite.jump(is_short_hop=True)
                 else:
-                    print(f"DEBUG: {self.player_name} performing full jump after releasing at frame {game.current_frame} (held for {frames_held} frames)")
+                    print(f"DEBUG: {self.player_name} performing full jump after releasing at frame {game.current_frame} (held for {frames_held:.1f} frames)")
                     sprite.jump(is_short_hop=False)
                 
                 # Reset jump tracking after executing jump
                 self.jump_executed = True
                 self.jump_requested = False
-                self.jump_request_frame = 0
+                self.jump_request_time = 0.0
             
             # If jump has been requested but not executed, and held long enough, perform full jump
             if self.jump_requested and not self.jump_executed and input_handler.get_intent(self.player_name, INTENTS['MOVE_UP']):
-                frames_held = game.current_frame - self.jump_request_frame
+                frames_held = input_handler.get_hold_frames(self.player_name, INTENTS['MOVE_UP'], since=self.jump_request_time)
                 
                 if frames_held >= 10:  # Execute full jump a bit after short hop window
-                    print(f"DEBUG: {self.player_name} performing FULL JUMP after holding for {frames_held} frames")
+                    print(f"DEBUG: {self.player_name} performing FULL JUMP after holding for {frames_held:.1f} frames")
                     sprite.jump(is_short_hop=False)
                     
                     # Reset jump tracking after executing jump
                     self.jump_executed = True
                     self.jump_requested = False
-                    self.jump_request_frame = 0
+                    self.jump_request_time = 0.0
         else:
             # Reset jump tracking when landing or when in-air state changes
             self._reset_jump_state(game)
@@ -363,7 +367,7 @@ class PlayerController:
         
         self.jump_requested = False
         self.jump_executed = False
-        self.jump_request_frame = 0
+        self.jump_request_time = 0.0
 
 # Add test code that runs when this file is executed directly
 if __name__ == "__main__":
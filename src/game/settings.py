@@ -15,6 +15,8 @@ HEIGHT = 700
 BG_SIZE = (FULL_WIDTH, HEIGHT) 
 ORIGIN = (0,0)
 FPS = 60  # Melee runs at exactly 60 FPS
+MENU_FPS = 30  # Frame cap for the menu screens
+MENU_IDLE_TIMEOUT = 250  # ms a menu blocks waiting for events when nothing changes
 
 # Character scaling
 CHARACTER_SCALE = 2.0  # Base character scale (default is 2x)
@@ -23,6 +25,9 @@ CHARACTER_SCALE = 2.0  # Base character scale (default is 2x)
 GIANT_MODE_ENABLED = False  # Set to True to enable GIANT MODE by default
 GIANT_MODE_SCALE_FACTOR = 1.75  # Makes characters 1.75x larger than normal
 
+# Attack collision
+PIXEL_PERFECT_HITS = True  # Confirm hitbox/hurtbox overlaps with cached per-frame pixel masks
+
 # game statuses
 INTRO = 0
 GUIDE = 1
@@ -8,7 +8,8 @@ providing specific sound effects for different game events.
 import os
 import random
 import time
-from sound_player import SoundPlayer
+from collections import deque
+from sound_player import SoundPlayer, SoundBankLoader, AudioQueue, SOUND_BANK_BUDGET
 
 class SoundManager:
     """
@@ -178,15 +179,183 @@ class SoundManager:
         'final': '23. Final Destination'
     }
     
+    # Most sounds kept in the recent-sound history
+    RECENT_SOUNDS_CAPACITY = 32
+    
     def __init__(self):
         """Initialize the Sound Manager"""
         self.current_bg_music = None
         self.mute = False
         
-        # Track recent sound effects for display
-        self.recent_sounds = []  # List of (timestamp, sound_type, sound_name, description)
+        # Track recent sound effects for display: a time-ordered ring buffer
+        # of (timestamp, sound_type, sound_name, description), oldest first
+        self.recent_sounds = deque(maxlen=self.RECENT_SOUNDS_CAPACITY)
         self.recent_sounds_max_age = 4.0  # How many seconds to keep sounds in history
+        # Bumped whenever the history changes, so the HUD can skip redraws
+        self.recent_sounds_version = 0
+        
+        # Index the audio directory once so lookups never hit the filesystem
+        SoundPlayer.build_catalog()
+        
+        # Background decoder for the selected characters' sounds
+        self.bank_loader = None
+        
+        # Mixer channels (and music decks) are reserved before the audio
+        # thread starts using them
+        SoundPlayer.channel_pool()
+        
+        # Effects are played on the audio thread (dropped when headless)
+        self.audio_queue = AudioQueue()
+        
+        # Stage picked (and its music preloaded) before the match starts
+        self.next_stage = None
+        
+        # (character, action) -> candidate sound names, resolved once here
+        # instead of substring-matching the tables on every trigger
+        self._character_names = {}
+        self.jump_table = {}
+        self.voice_table = {}
+        self.character_table = {}
+        self._build_sound_tables()
+        
+    def _play_effect(self, sound_name, volume=1.0, group=None):
+        """Post a sound effect to the audio thread"""
+        self.audio_queue.post(sound_name, volume=volume, group=group)
+    
+    def resolve_character(self, character):
+        """
+        Map a character name or class name (e.g., 'LocalMario') to the key
+        used in the sound tables, or None for characters without sounds
+        
+        Results are cached, so fighters can call this once and keep the name.
+        """
+        if not character:
+            return None
+        if character in self._character_names:
+            return self._character_names[character]
+        
+        known = list(self.CHARACTER_SOUNDS) + [
+            name for name, sounds in self.VOICE_SOUNDS.items()
+            if isinstance(sounds, dict) and name not in self.CHARACTER_SOUNDS]
+        lowered = character.lower()
+        # Exact match first, then partial match (e.g., 'mario' in 'LocalMario')
+        match = next((name for name in known if name.lower() == lowered), None)
+        if match is None:
+            match = next((name for name in known if name.lower() in lowered), None)
+        self._character_names[character] = match
+        return match
+    
+    @staticmethod
+    def _as_list(sounds):
+        return list(sounds) if isinstance(sounds, (list, tuple)) else [sounds]
+    
+    def _playable(self, *candidates):
+        """
+        First candidate list that has a sound in the audio catalog; if none
+        does, the first non-empty list (playing it just logs the missing file)
+        """
+        candidates = [names for names in candidates if names]
+        for names in candidates:
+            available = [name for name in names if SoundPlayer.has_sound(name)]
+            if available:
+                return available
+        return candidates[0] if candidates else None
+    
+    def _build_sound_tables(self):
+        """Precompute the jump, voice and character sound tables"""
+        characters = [None] + list(self.CHARACTER_SOUNDS) + [
+            name for name, sounds in self.VOICE_SOUNDS.items()
+            if isinstance(sounds, dict) and name not in self.CHARACTER_SOUNDS]
+        voice_actions = {name for name, sounds in self.VOICE_SOUNDS.items() if not isinstance(sounds, dict)}
+        for sounds in self.VOICE_SOUNDS.values():
+            if isinstance(sounds, dict):
+                voice_actions.update(sounds)
+        
+        for character in characters:
+            for jump_type in self.JUMP_SOUNDS:
+                self.jump_table[(character, jump_type)] = self._jump_entry(character, jump_type)
+            for action_type in voice_actions:
+                self.voice_table[(character, action_type)] = self._voice_entry(character, action_type)
+            for sound_type, sounds in self.CHARACTER_SOUNDS.get(character, {}).items():
+                self.character_table[(character, sound_type)] = self._playable(self._as_list(sounds))
+    
+    def _jump_entry(self, character, jump_type):
+        char_sounds = self.CHARACTER_SOUNDS.get(character, {})
+        return self._playable(
+            self._as_list(char_sounds['jump']) if 'jump' in char_sounds else None,
+            self.JUMP_SOUNDS.get(jump_type),
+            ['Whoosh', 'Swiff', 'Small Whoosh'])
+    
+    def _voice_entry(self, character, action_type):
+        """(sound names, description) for a voice line, or None"""
+        char_voices = self.VOICE_SOUNDS.get(character)
+        if isinstance(char_voices, dict):
+            if action_type in char_voices:
+                return self._playable(self._as_list(char_voices[action_type])), f"{character} voice: {action_type}"
+            # General damage actions fall back to the character's 'damage' line
+            if action_type.startswith('damage') and 'damage' in char_voices:
+                return self._playable(self._as_list(char_voices['damage'])), f"{character} voice: {action_type}"
+        generic = self.VOICE_SOUNDS.get(action_type)
+        if generic is not None and not isinstance(generic, dict):
+            return self._playable(self._as_list(generic)), f"Voice: {action_type}"
+        return None
+    
+    def bank_sounds_for(self, characters):
+        """
+        Collect every sound effect a match with these characters can trigger
+        
+        Args:
+            characters (iterable): Character names (e.g., 'Mario', 'Link')
+            
+        Returns:
+            list: Sorted sound names (victory music is left to the music player)
+        """
+        names = set()
+        
+        def collect(value):
+            if isinstance(value, str):
+                names.add(value)
+            elif isinstance(value, list):
+                names.update(value)
+            elif isinstance(value, dict):
+                for key, item in value.items():
+                    if key != 'victory':
+                        collect(item)
+        
+        for table in (self.HIT_SOUNDS, self.ATTACK_SOUNDS, self.SHIELD_SOUNDS, self.JUMP_SOUNDS):
+            collect(table)
+        # General voices only; character voices are added below
+        collect({k: v for k, v in self.VOICE_SOUNDS.items() if not isinstance(v, dict)})
+        for character in characters:
+            if not character:
+                continue
+            collect(self.VOICE_SOUNDS.get(character, {}))
+            collect(self.CHARACTER_SOUNDS.get(character, {}))
+        return sorted(names)
+    
+    def warm_up_sound_bank(self, characters, budget_bytes=SOUND_BANK_BUDGET):
+        """
+        Start decoding the sounds for the selected characters in the background
         
+        Safe to call again when a selection changes: new sounds are queued
+        onto the loader that is still running, and sounds already in the
+        cache are skipped.
+        
+        Args:
+            characters (iterable): Character names (e.g., 'Mario', 'Link')
+            budget_bytes (int): Memory budget for the decoded sound bank
+            
+        Returns:
+            SoundBankLoader: The running loader (poll progress/bytes_loaded)
+        """
+        sound_names = self.bank_sounds_for(characters)
+        loader = self.bank_loader
+        if loader is not None and loader.budget_bytes == budget_bytes and loader.add(sound_names):
+            return loader
+        self.bank_loader = SoundBankLoader(sound_names, budget_bytes)
+        self.bank_loader.start()
+        return self.bank_loader
+    
     def _add_recent_sound(self, sound_type, sound_name, description=None):
         """
         Add a sound to the recent sounds list
@@ -203,26 +372,28 @@ class SoundManager:
         if description is None:
             description = f"{sound_type.capitalize()}: {sound_name}"
         
-        # Add to recent sounds
+        # Add to recent sounds (a full buffer drops its oldest entry)
         self.recent_sounds.append((timestamp, sound_type, sound_name, description))
+        self.recent_sounds_version += 1
         
         # Clean up old sounds
         self._clean_recent_sounds()
         
     def _clean_recent_sounds(self):
-        """Remove sounds older than the max age"""
-        current_time = time.time()
-        self.recent_sounds = [
-            sound for sound in self.recent_sounds 
-            if current_time - sound[0] <= self.recent_sounds_max_age
-        ]
+        """Evict sounds older than the max age from the head of the buffer"""
+        cutoff = time.time() - self.recent_sounds_max_age
+        recent = self.recent_sounds
+        if recent and recent[0][0] < cutoff:
+            while recent and recent[0][0] < cutoff:
+                recent.popleft()
+            self.recent_sounds_version += 1
         
     def get_recent_sounds(self):
         """
-        Get list of recent sounds (cleaned of expired sounds)
+        Get recent sounds (cleaned of expired sounds), oldest first
         
         Returns:
-            list: List of (timestamp, sound_type, sound_name, description) tuples
+            deque: (timestamp, sound_type, sound_name, description) tuples
         """
         self._clean_recent_sounds()
         return self.recent_sounds
@@ -236,7 +407,7 @@ class SoundManager:
             sound_name = self.UI_SOUNDS[sound_type]
             # Add to recent sounds
             self._add_recent_sound('ui', sound_name, f"UI: {sound_type}")
-            return SoundPlayer.play_sound(sound_name)
+            return self._play_effect(sound_name, group='ui')
         return None
         
     def play_jump_sound(self, character=None, jump_type='standard'):
@@ -246,43 +417,16 @@ class SoundManager:
         Args:
             character (str): Character name or character type
             jump_type (str): Type of jump ('standard', 'short_hop', 'high_jump')
-            
-        Returns:
-            pygame.mixer.Sound or None: The sound object if played successfully
         """
         if self.mute:
             return None
             
-        # Play both the jump sound effect and the character voice
-        jump_sound = None
-        sound_name = None
-        
-        # First try to play character-specific jump sound if available
-        if character:
-            # Check for exact character name match
-            for char_name, sounds in self.CHARACTER_SOUNDS.items():
-                if char_name.lower() == character.lower() and 'jump' in sounds:
-                    sound_name = random.choice(sounds['jump']) if isinstance(sounds['jump'], list) else sounds['jump']
-                    jump_sound = SoundPlayer.play_sound(sound_name)
-                    break
-                
-            # If no exact match, check for partial character name match (e.g., 'mario' in 'LocalMario')
-            if not jump_sound:
-                for char_name, sounds in self.CHARACTER_SOUNDS.items():
-                    if char_name.lower() in character.lower() and 'jump' in sounds:
-                        sound_name = random.choice(sounds['jump']) if isinstance(sounds['jump'], list) else sounds['jump']
-                        jump_sound = SoundPlayer.play_sound(sound_name)
-                        break
-                    
-        # Fall back to generic jump sound based on jump type
-        if not jump_sound and jump_type in self.JUMP_SOUNDS:
-            sound_name = random.choice(self.JUMP_SOUNDS[jump_type])
-            jump_sound = SoundPlayer.play_sound(sound_name)
-            
-        # Ultimate fallback
-        if not jump_sound:
-            sound_name = random.choice(['Whoosh', 'Swiff', 'Small Whoosh'])
-            jump_sound = SoundPlayer.play_sound(sound_name)
+        char_name = self.resolve_character(character)
+        sound_names = self.jump_table.get((char_name, jump_type))
+        if sound_names is None:
+            sound_names = self.jump_table[(char_name, jump_type)] = self._jump_entry(char_name, jump_type)
+        sound_name = random.choice(sound_names)
+        self._play_effect(sound_name, group='effects')
         
         # Add to recent sounds with character info if available
         char_str = character if character else "Character"
@@ -292,8 +436,6 @@ class SoundManager:
         if character:
             self.play_voice_sound(character, 'jump')
         
-        return jump_sound
-        
     def play_voice_sound(self, character=None, action_type='jump', volume=0.7):
         """
         Play a character voice sound for a specific action
@@ -302,76 +444,25 @@ class SoundManager:
             character (str): Character name or character type
             action_type (str): Type of action ('jump', 'attack_weak', 'attack_heavy', 'damage', etc.)
             volume (float): Volume level from 0.0 to 1.0
-            
-        Returns:
-            pygame.mixer.Sound or None: The sound object if played successfully
         """
         if self.mute:
             return None
             
-        # First try character-specific voice
-        if character:
-            # Get normalized character name
-            char_name = None
-            
-            # Check for exact character match
-            for name in self.VOICE_SOUNDS:
-                if isinstance(self.VOICE_SOUNDS[name], dict) and name.lower() == character.lower():
-                    char_name = name
-                    break
-                    
-            # If no exact match, check for partial character name match
-            if not char_name:
-                for name in self.VOICE_SOUNDS:
-                    if isinstance(self.VOICE_SOUNDS[name], dict) and name.lower() in character.lower():
-                        char_name = name
-                        break
-            
-            # If we found a character match
-            if char_name:
-                # Check if the specific action type exists for this character
-                if action_type in self.VOICE_SOUNDS[char_name]:
-                    sound_options = self.VOICE_SOUNDS[char_name][action_type]
-                    if isinstance(sound_options, list):
-                        sound_name = random.choice(sound_options)
-                    else:
-                        sound_name = sound_options
-                    
-                    # Add to recent sounds
-                    self._add_recent_sound('voice', sound_name, f"{char_name} voice: {action_type}")
-                    
-                    # Use a slightly lower volume for the voice
-                    return SoundPlayer.play_sound(sound_name, volume=volume)
-                    
-                # If the specific action doesn't exist but 'damage' is available for general damage actions
-                elif action_type.startswith('damage') and 'damage' in self.VOICE_SOUNDS[char_name]:
-                    sound_options = self.VOICE_SOUNDS[char_name]['damage']
-                    if isinstance(sound_options, list):
-                        sound_name = random.choice(sound_options)
-                    else:
-                        sound_name = sound_options
-                    
-                    # Add to recent sounds
-                    self._add_recent_sound('voice', sound_name, f"{char_name} voice: {action_type}")
-                    
-                    # Use a slightly lower volume for the voice
-                    return SoundPlayer.play_sound(sound_name, volume=volume)
-        
-        # Fallback to generic voice sounds
-        if action_type in self.VOICE_SOUNDS:
-            sound_options = self.VOICE_SOUNDS[action_type]
-            if isinstance(sound_options, list):
-                sound_name = random.choice(sound_options)
-            else:
-                sound_name = sound_options
-                
-            # Add to recent sounds
-            self._add_recent_sound('voice', sound_name, f"Voice: {action_type}")
-                
-            # Use a slightly lower volume for the voice
-            return SoundPlayer.play_sound(sound_name, volume=volume)
-            
-        return None
+        char_name = self.resolve_character(character)
+        key = (char_name, action_type)
+        if key not in self.voice_table:
+            self.voice_table[key] = self._voice_entry(char_name, action_type)
+        entry = self.voice_table[key]
+        if entry is None:
+            return None
+        sound_names, description = entry
+        sound_name = random.choice(sound_names)
+        
+        # Add to recent sounds
+        self._add_recent_sound('voice', sound_name, description)
+        
+        # Use a slightly lower volume for the voice
+        return self._play_effect(sound_name, volume=volume, group='voices')
         
     def play_hit_sound(self, intensity='medium'):
         """Play a hit sound based on intensity (weak, medium, strong)"""
@@ -382,7 +473,7 @@ class SoundManager:
             sound_name = random.choice(self.HIT_SOUNDS[intensity])
             # Add to recent sounds
             self._add_recent_sound('hit', sound_name, f"Hit: {intensity}")
-            return SoundPlayer.play_sound(sound_name)
+            return self._play_effect(sound_name, group='hits')
         return None
         
     def play_attack_sound(self, attack_type='weak', character=None):
@@ -392,18 +483,14 @@ class SoundManager:
         Args:
             attack_type (str): Type of attack ('weak' or 'heavy')
             character (str): Character making the attack (for voice sound)
-            
-        Returns:
-            pygame.mixer.Sound: The attack sound object
         """
         if self.mute:
             return None
             
         # Play the attack sound effect
-        attack_sound = None
         if attack_type in self.ATTACK_SOUNDS:
             sound_name = random.choice(self.ATTACK_SOUNDS[attack_type])
-            attack_sound = SoundPlayer.play_sound(sound_name)
+            self._play_effect(sound_name, group='effects')
             
             # Add to recent sounds with character info if available
             char_str = character if character else "Character"
@@ -413,8 +500,6 @@ class SoundManager:
         if character:
             voice_action = 'attack_weak' if attack_type == 'weak' else 'attack_heavy'
             self.play_voice_sound(character, voice_action)
-            
-        return attack_sound
         
     def play_shield_sound(self, shield_action):
         """Play a shield sound (on, off, break, hit)"""
@@ -429,23 +514,32 @@ class SoundManager:
             # Add to recent sounds
             self._add_recent_sound('shield', sound, f"Shield: {shield_action}")
             
-            return SoundPlayer.play_sound(sound)
+            return self._play_effect(sound, group='effects')
         return None
     
+    def play_hazard_sound(self, sound_name):
+        """Play a stage hazard or item sound (e.g., a Bob-omb's PlaySound cue)"""
+        if self.mute:
+            return None
+            
+        self._add_recent_sound('hazard', sound_name, f"Hazard: {sound_name}")
+        return self._play_effect(sound_name, group='hazards')
+    
     def play_character_sound(self, character, sound_type):
         """Play a character-specific sound"""
         if self.mute:
             return None
             
-        if character in self.CHARACTER_SOUNDS:
-            if sound_type in self.CHARACTER_SOUNDS[character]:
-                sound_name = random.choice(self.CHARACTER_SOUNDS[character][sound_type]) if isinstance(self.CHARACTER_SOUNDS[character][sound_type], list) else self.CHARACTER_SOUNDS[character][sound_type]
-                
-                # Add to recent sounds
-                self._add_recent_sound('character', sound_name, f"{character}: {sound_type}")
-                
-                return SoundPlayer.play_sound(sound_name)
-        return None
+        char_name = self.resolve_character(character)
+        sound_names = self.character_table.get((char_name, sound_type))
+        if not sound_names:
+            return None
+        sound_name = random.choice(sound_names)
+        
+        # Add to recent sounds
+        self._add_recent_sound('character', sound_name, f"{char_name}: {sound_type}")
+        
+        return self._play_effect(sound_name, group='effects')
         
     def play_damage_sound(self, damage_amount, character=None):
         """
@@ -454,38 +548,32 @@ class SoundManager:
         Args:
             damage_amount (float): Amount of damage taken
             character (str): Character taking damage (for voice sound)
-            
-        Returns:
-            pygame.mixer.Sound: The damage sound object
         """
         if self.mute:
             return None
             
         # Play appropriate hit sound based on damage amount
-        hit_sound = None
         intensity = "weak"
         
         if damage_amount >= 20:
-            hit_sound = self.play_hit_sound('strong')
+            self.play_hit_sound('strong')
             intensity = "strong"
             # Play character voice for heavy damage
             if character:
                 self.play_voice_sound(character, 'damage_heavy')
         elif damage_amount >= 10:
-            hit_sound = self.play_hit_sound('medium')
+            self.play_hit_sound('medium')
             intensity = "medium"
             # Play character voice for medium damage
             if character:
                 self.play_voice_sound(character, 'damage_light')
         else:
-            hit_sound = self.play_hit_sound('weak')
+            self.play_hit_sound('weak')
             # Don't play voice for very light damage
         
         # Add to recent sounds with damage details
         char_str = character if character else "Character"
         self._add_recent_sound('damage', f"{intensity} hit", f"{char_str} took {damage_amount:.1f}% damage")
-            
-        return hit_sound
     
     def play_background_music(self, music_type='menu', stage=None, fade_in_ms=500):
         """
@@ -499,10 +587,7 @@ class SoundManager:
         if self.mute:
             return None
             
-        # Stop current background music if any
-        if self.current_bg_music:
-            SoundPlayer.stop_music()
-            
+        # play_music crossfades from (or stops) the current track
         # Play stage-specific music if specified
         if music_type == 'battle' and stage and stage in self.STAGE_MUSIC:
             music_name = self.STAGE_MUSIC[stage]
@@ -524,15 +609,52 @@ class SoundManager:
             return self.current_bg_music
         return None
         
+    def preload_battle_music(self, stage=None):
+        """
+        Pick the next stage and decode its music in the background, so the
+        match can start without a music load stall
+        
+        Args:
+            stage (str): Stage to preload; a random one is picked if None
+            
+        Returns:
+            str: The stage that take_next_stage() will return
+        """
+        if stage is None:
+            stage = self.next_stage or random.choice(list(self.STAGE_MUSIC.keys()))
+        self.next_stage = stage
+        SoundPlayer.preload_music(self.STAGE_MUSIC[stage])
+        return stage
+    
+    def take_next_stage(self):
+        """Stage chosen by preload_battle_music(), or a random one"""
+        stage = self.next_stage or random.choice(list(self.STAGE_MUSIC.keys()))
+        self.next_stage = None
+        return stage
+    
+    def preload_victory_music(self, characters):
+        """
+        Decode the victory themes these characters can trigger, dropping
+        other preloaded tracks (the playing stage music is kept)
+        
+        Args:
+            characters (iterable): Character names (e.g., 'Mario', 'Link')
+        """
+        themes = list(self.BACKGROUND_MUSIC['victory'])
+        for character in characters:
+            theme = self.CHARACTER_SOUNDS.get(character, {}).get('victory')
+            if theme:
+                themes.append(theme)
+        SoundPlayer.release_music(keep=themes)
+        for theme in themes:
+            SoundPlayer.preload_music(theme)
+    
     def play_victory_music(self, character=None):
         """Play victory music for a specific character"""
         if self.mute:
             return None
             
-        # Stop current background music if any
-        if self.current_bg_music:
-            SoundPlayer.stop_music()
-            
+        # play_music crossfades from (or stops) the current track
         # Try to play character-specific victory theme
         if character and character in self.CHARACTER_SOUNDS:
             if 'victory' in self.CHARACTER_SOUNDS[character]:
@@ -542,6 +664,9 @@ class SoundManager:
                 # Add to recent sounds
                 self._add_recent_sound('victory', victory_theme, f"{character} victory theme")
                 
+                # Get the rematch stage ready while the victory theme plays
+                self.preload_battle_music()
+                
                 return self.current_bg_music
                 
         # Fall back to default victory music
@@ -551,6 +676,9 @@ class SoundManager:
         # Add to recent sounds
         self._add_recent_sound('victory', victory_music, "Victory theme")
         
+        # Get the rematch stage ready while the victory theme plays
+        self.preload_battle_music()
+        
         return self.current_bg_music
         
     def stop_background_music(self, fade_out_ms=500):
@@ -559,6 +687,11 @@ class SoundManager:
             SoundPlayer.stop_music(fade_out_ms)
             self.current_bg_music = None
             
+    def mixer_stats(self):
+        """Played/coalesced/stolen/dropped counters from the channel pool"""
+        pool = SoundPlayer.channel_pool()
+        return pool.stats() if pool else {}
+            
     def toggle_mute(self):
         """Toggle mute state"""
         self.mute = not self.mute
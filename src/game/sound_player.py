@@ -1,12 +1,18 @@
 """
 Sound Effect Player for Super Smash Bros - Local Edition
 
-This module provides a simple interface for playing sound effects (.wav files)
-and music (.mp3 files) from the src/audio directory. It handles file existence checks 
-and provides options for playing sounds once or repeatedly.
+This module provides a simple interface for playing sound effects (.wav or .mp3
+files, decoded to PCM in memory) and streamed music (.mp3 files) from the
+src/audio directory. Files are resolved through a catalog built once at startup,
+sounds can be decoded ahead of time on a worker thread, and it provides options
+for playing sounds once or repeatedly.
 """
 
 import os
+import json
+import time
+import queue
+import threading
 import pygame as pg
 import logging
 
@@ -15,6 +21,32 @@ logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('sound_player')
 
+# Playable formats, in lookup priority for names given without an extension
+AUDIO_EXTENSIONS = ('.wav', '.ogg', '.mp3')
+
+# Default memory budget for the decoded sound bank (bytes of PCM)
+SOUND_BANK_BUDGET = 64 * 1024 * 1024
+
+# Managed channel groups: name -> (channels, default priority)
+# Higher priority wins when a group is full; voices are the first to go.
+CHANNEL_GROUPS = {
+    'ui': (2, 3),
+    'hits': (4, 4),
+    'voices': (3, 1),
+    'hazards': (3, 2),
+    'effects': (4, 2),
+}
+
+# Extra channels left to pygame for unmanaged Sound.play() calls
+UNMANAGED_CHANNELS = 8
+
+# Identical triggers closer together than this are played once (~1 frame)
+COALESCE_WINDOW = 0.016
+
+# Reserved channels used as music decks, and the fixed crossfade length
+MUSIC_DECKS = 2
+CROSSFADE_MS = 500
+
 # Initialize pygame mixer if not already initialized
 if not pg.mixer.get_init():
     try:
@@ -38,8 +70,123 @@ class SoundPlayer:
     # Currently playing music file path
     _current_music = None
     
+    # Logical sound name -> (path, format), built once by build_catalog()
+    _catalog = None
+    
+    # Names already reported missing (warn once, not on every trigger)
+    _missing = set()
+    
+    # Decoded PCM bytes currently held in _sound_cache
+    _cache_bytes = 0
+    # Guards cache inserts and accounting (the bank loader decodes off-thread)
+    _decode_lock = threading.Lock()
+    
+    # ChannelPool for grouped playback, created on first use
+    _channel_pool = None
+    
+    @staticmethod
+    def channel_pool():
+        """Get the shared ChannelPool, or None if the mixer isn't available"""
+        if SoundPlayer._channel_pool is None and pg.mixer.get_init():
+            SoundPlayer._channel_pool = ChannelPool()
+        return SoundPlayer._channel_pool
+    
+    @staticmethod
+    def music_decks():
+        """Get the shared MusicDecks, or None if the mixer isn't available"""
+        pool = SoundPlayer.channel_pool()
+        return pool.music if pool else None
+    
+    @staticmethod
+    def build_catalog(audio_dir=None, index_path=None):
+        """
+        Scan the audio directory once and index every playable file.
+        
+        Each file is reachable by its path relative to the audio directory,
+        with or without extension ("Small Hit.wav" and "Small Hit"). When a
+        name exists in several formats the AUDIO_EXTENSIONS order decides.
+        
+        Args:
+            audio_dir (str): Directory to scan (defaults to src/audio)
+            index_path (str): Optional JSON file to persist the catalog to;
+                it is reused while the scanned directories are unchanged
+            
+        Returns:
+            int: Number of audio files in the catalog
+        """
+        audio_dir = audio_dir or SoundPlayer._get_audio_dir()
+        
+        if index_path:
+            catalog = SoundPlayer._load_catalog_index(index_path)
+            if catalog is not None:
+                SoundPlayer._catalog = catalog
+                return len({path for path, _ in catalog.values()})
+        
+        catalog = {}
+        dir_mtimes = {}
+        files = 0
+        for root, _, filenames in os.walk(audio_dir):
+            dir_mtimes[root] = os.stat(root).st_mtime
+            for filename in filenames:
+                stem, ext = os.path.splitext(filename)
+                fmt = ext.lower()
+                if fmt not in AUDIO_EXTENSIONS:
+                    continue
+                files += 1
+                path = os.path.join(root, filename)
+                rel_stem = os.path.relpath(os.path.join(root, stem), audio_dir).replace(os.sep, '/')
+                entry = (path, fmt[1:])
+                catalog[rel_stem + ext] = entry
+                # Extensionless name goes to the highest-priority format
+                current = catalog.get(rel_stem)
+                if current is None or AUDIO_EXTENSIONS.index(fmt) < AUDIO_EXTENSIONS.index('.' + current[1]):
+                    catalog[rel_stem] = entry
+        
+        SoundPlayer._catalog = catalog
+        SoundPlayer._missing = set()
+        logger.info(f"Indexed {files} audio files from {audio_dir}")
+        
+        if index_path:
+            try:
+                with open(index_path, 'w') as f:
+                    json.dump({'dirs': dir_mtimes, 'entries': catalog}, f)
+            except OSError as e:
+                logger.warning(f"Could not write audio index {index_path}: {e}")
+        return files
+    
+    @staticmethod
+    def _load_catalog_index(index_path):
+        """Load a persisted catalog if none of its directories changed since"""
+        try:
+            with open(index_path, 'r') as f:
+                data = json.load(f)
+            for directory, mtime in data['dirs'].items():
+                if os.stat(directory).st_mtime != mtime:
+                    return None
+            return {name: tuple(entry) for name, entry in data['entries'].items()}
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    @staticmethod
+    def has_sound(sound_name):
+        """Whether a sound name is in the catalog (no warning if it isn't)"""
+        if SoundPlayer._catalog is None:
+            SoundPlayer.build_catalog()
+        return sound_name in SoundPlayer._catalog
+    
     @staticmethod
-    def play_sound(sound_name, repeat=False, volume=1.0):
+    def _resolve(sound_name):
+        """Look up (path, format) for a logical sound name, or None"""
+        if SoundPlayer._catalog is None:
+            SoundPlayer.build_catalog()
+        entry = SoundPlayer._catalog.get(sound_name)
+        if entry is None and sound_name not in SoundPlayer._missing:
+            SoundPlayer._missing.add(sound_name)
+            logger.warning(f"Sound not found in the audio directory: {sound_name}")
+        return entry
+    
+    @staticmethod
+    def play_sound(sound_name, repeat=False, volume=1.0, group=None, priority=None):
         """
         Play a sound effect if it exists
         
@@ -47,63 +194,97 @@ class SoundPlayer:
             sound_name (str): The name of the sound file (with or without extension)
             repeat (bool): Whether to play the sound on repeat (loops indefinitely if True)
             volume (float): Volume level from 0.0 to 1.0
+            group (str): Channel group from CHANNEL_GROUPS, None for an unmanaged channel
+            priority (int): Overrides the group's priority when stealing a channel
             
         Returns:
             pygame.mixer.Sound or None: The sound object if successfully played, None otherwise
         """
-        # Auto-detect file extension if not provided
-        if not (sound_name.lower().endswith('.wav') or sound_name.lower().endswith('.mp3')):
-            # Try with .wav extension first
-            wav_name = sound_name + '.wav'
-            wav_path = SoundPlayer._get_audio_path(wav_name)
-            
-            if os.path.exists(wav_path):
-                sound_name = wav_name
-            else:
-                # Try with .mp3 extension
-                mp3_name = sound_name + '.mp3'
-                mp3_path = SoundPlayer._get_audio_path(mp3_name)
-                
-                if os.path.exists(mp3_path):
-                    sound_name = mp3_name
-                else:
-                    logger.warning(f"Neither {wav_name} nor {mp3_name} found in the audio directory")
-                    return None
-            
-        # Build path to audio file
-        sound_path = SoundPlayer._get_audio_path(sound_name)
-        
-        # Check if sound exists
-        if not os.path.exists(sound_path):
-            logger.warning(f"Sound file not found: {sound_path}")
+        # Resolve through the catalog (no filesystem checks on the game thread)
+        entry = SoundPlayer._resolve(sound_name)
+        if entry is None:
             return None
+        sound_path = entry[0]
             
         try:
-            # For MP3 files, use the music player (better for longer sounds)
-            if sound_name.lower().endswith('.mp3'):
-                return SoundPlayer.play_music(sound_name, repeat, volume)
-            
-            # For WAV files, use the standard Sound objects
+            # Every format (MP3 effects included) is decoded to PCM once and
+            # played as a Sound, so effects never interrupt the music stream
             # Check if sound is in cache
             if sound_path in SoundPlayer._sound_cache:
                 sound = SoundPlayer._sound_cache[sound_path]
             else:
                 # Load and cache the sound
-                sound = pg.mixer.Sound(sound_path)
-                SoundPlayer._sound_cache[sound_path] = sound
+                sound = SoundPlayer._decode(sound_path)[0]
                 
             # Set volume
             sound.set_volume(max(0.0, min(1.0, volume)))
             
             # Play the sound
             loops = -1 if repeat else 0
-            sound.play(loops=loops)
+            pool = SoundPlayer.channel_pool() if group else None
+            if pool is not None:
+                if pool.play(sound, group, priority, loops) is None:
+                    return None
+            else:
+                sound.play(loops=loops)
             return sound
             
         except Exception as e:
             logger.error(f"Error playing sound {sound_name}: {str(e)}")
             return None
     
+    @staticmethod
+    def _decode(sound_path):
+        """
+        Decode a file (WAV, OGG or MP3) into a cached Sound holding raw PCM
+        and account for its size
+        
+        Returns:
+            tuple: (sound, bytes decoded) - 0 bytes if it was already cached
+        """
+        cached = SoundPlayer._sound_cache.get(sound_path)
+        if cached is not None:
+            return cached, 0
+        # Decode outside the lock so the audio thread never waits on the bank loader
+        sound = pg.mixer.Sound(sound_path)
+        size = SoundPlayer.sound_size(sound)
+        with SoundPlayer._decode_lock:
+            cached = SoundPlayer._sound_cache.get(sound_path)
+            if cached is not None:
+                # Another thread got there first; keep its copy
+                return cached, 0
+            SoundPlayer._sound_cache[sound_path] = sound
+            SoundPlayer._cache_bytes += size
+        return sound, size
+    
+    @staticmethod
+    def sound_size(sound):
+        """Approximate decoded size of a Sound in bytes"""
+        frequency, size, channels = pg.mixer.get_init() or (44100, -16, 2)
+        return int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+    
+    @staticmethod
+    def preload_sound(sound_name):
+        """
+        Decode a sound effect into the cache without playing it
+        
+        Args:
+            sound_name (str): The name of the sound file (with or without extension)
+            
+        Returns:
+            int: Bytes decoded, 0 if it was already cached or can't be preloaded
+        """
+        if not pg.mixer.get_init():
+            return 0
+        entry = SoundPlayer._resolve(sound_name)
+        if entry is None or entry[0] in SoundPlayer._sound_cache:
+            return 0
+        try:
+            return SoundPlayer._decode(entry[0])[1]
+        except Exception as e:
+            logger.error(f"Error preloading sound {sound_name}: {str(e)}")
+            return 0
+    
     @staticmethod
     def play_music(music_name, repeat=True, volume=1.0, fade_in_ms=500):
         """
@@ -118,21 +299,25 @@ class SoundPlayer:
         Returns:
             str: The path to the music file if successfully loaded, None otherwise
         """
-        # Auto-detect file extension if not provided
-        if not (music_name.lower().endswith('.mp3') or music_name.lower().endswith('.wav')):
-            music_name += '.mp3'  # Default to .mp3 for music
-            
-        # Build path to audio file
-        music_path = SoundPlayer._get_audio_path(music_name)
-        
-        # Check if music exists
-        if not os.path.exists(music_path):
-            logger.warning(f"Music file not found: {music_path}")
+        entry = SoundPlayer._resolve_music(music_name)
+        if entry is None:
             return None
+        music_path = entry[0]
+        
+        # A track decoded ahead of time crossfades in on the music decks
+        decks = SoundPlayer.music_decks()
+        if decks is not None and decks.play(music_path, repeat, volume):
+            if pg.mixer.music.get_busy():
+                pg.mixer.music.fadeout(CROSSFADE_MS)
+            SoundPlayer._current_music = music_path
+            logger.info(f"Playing music: {music_name} (preloaded)")
+            return music_path
             
         try:
             # Stop any currently playing music
             pg.mixer.music.stop()
+            if decks is not None:
+                decks.stop(fade_in_ms)
             
             # Load the music
             pg.mixer.music.load(music_path)
@@ -154,6 +339,47 @@ class SoundPlayer:
             logger.error(f"Error playing music {music_name}: {str(e)}")
             return None
     
+    @staticmethod
+    def preload_music(music_name):
+        """
+        Decode a music track on a worker thread so play_music can start it
+        without a load stall
+        
+        Args:
+            music_name (str): The name of the music file (with or without extension)
+            
+        Returns:
+            bool: True if the track is decoded or being decoded
+        """
+        entry = SoundPlayer._resolve_music(music_name)
+        decks = SoundPlayer.music_decks()
+        if entry is None or decks is None:
+            return False
+        decks.preload(entry[0])
+        return True
+    
+    @staticmethod
+    def release_music(keep=()):
+        """
+        Free preloaded music tracks that are no longer needed
+        
+        Args:
+            keep (iterable): Music names to keep (tracks playing are always kept)
+        """
+        decks = SoundPlayer.music_decks()
+        if decks is None:
+            return
+        entries = (SoundPlayer._resolve_music(name) for name in keep)
+        decks.release(entry[0] for entry in entries if entry)
+    
+    @staticmethod
+    def _resolve_music(music_name):
+        """Catalog entry for a music track; .mp3 is preferred without an extension"""
+        entry = None
+        if not os.path.splitext(music_name)[1].lower() in AUDIO_EXTENSIONS:
+            entry = (SoundPlayer._catalog or {}).get(music_name + '.mp3')
+        return entry or SoundPlayer._resolve(music_name)
+    
     @staticmethod
     def stop_music(fade_out_ms=500):
         """
@@ -163,6 +389,9 @@ class SoundPlayer:
             fade_out_ms (int): Time in milliseconds to fade out the music
         """
         try:
+            decks = SoundPlayer.music_decks()
+            if decks is not None:
+                decks.stop(fade_out_ms)
             pg.mixer.music.fadeout(fade_out_ms)
             SoundPlayer._current_music = None
         except Exception as e:
@@ -200,7 +429,316 @@ class SoundPlayer:
         except Exception as e:
             logger.error(f"Error stopping all sounds: {str(e)}")
     
+    @staticmethod
+    def _get_audio_dir():
+        """Get the absolute path to the audio directory"""
+        return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'audio')
+    
     @staticmethod
     def _get_audio_path(sound_name):
         """Get the absolute path to a sound file"""
-        return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'audio', sound_name) 
\ No newline at end of file
+        return os.path.join(SoundPlayer._get_audio_dir(), sound_name) 
+
+
+class ChannelPool:
+    """
+    Reserved mixer channels split into groups (ui, hits, voices, ...).
+    
+    Each group can only use its own channels, which caps how many voices
+    of one kind overlap. When a group is full the lowest-priority, oldest
+    sound in it is stolen if the new one is at least as important,
+    otherwise the new one is dropped. The same sound triggered twice
+    within COALESCE_WINDOW is played once.
+    """
+    
+    def __init__(self, groups=CHANNEL_GROUPS):
+        total = sum(count for count, _ in groups.values())
+        pg.mixer.set_num_channels(max(pg.mixer.get_num_channels(),
+                                      total + MUSIC_DECKS + UNMANAGED_CHANNELS))
+        # Reserved channels are never picked by a plain Sound.play()
+        pg.mixer.set_reserved(total + MUSIC_DECKS)
+        self.music = MusicDecks([pg.mixer.Channel(total + i) for i in range(MUSIC_DECKS)])
+        
+        self.groups = {}
+        self.priorities = {}
+        index = 0
+        for name, (count, priority) in groups.items():
+            self.groups[name] = [pg.mixer.Channel(i) for i in range(index, index + count)]
+            self.priorities[name] = priority
+            index += count
+        
+        # Channel -> (priority, start time) of what it's playing
+        self.playing = {}
+        # Sound -> (time, channel) of its last trigger, for coalescing
+        self.last_trigger = {}
+        
+        self.played = 0
+        self.coalesced = 0
+        self.stolen = 0
+        self.dropped = 0
+    
+    def play(self, sound, group, priority=None, loops=0):
+        """
+        Play a sound on one of the group's channels
+        
+        Args:
+            sound (pygame.mixer.Sound): The decoded sound
+            group (str): Channel group name
+            priority (int): Overrides the group's default priority
+            loops (int): Passed to Channel.play
+            
+        Returns:
+            pygame.mixer.Channel or None: The channel used, None if dropped
+        """
+        channels = self.groups.get(group)
+        if channels is None:
+            raise KeyError(f"Unknown channel group: {group}")
+        if priority is None:
+            priority = self.priorities[group]
+        now = time.perf_counter()
+        
+        last = self.last_trigger.get(sound)
+        if last is not None and now - last[0] < COALESCE_WINDOW and last[1].get_sound() is sound:
+            self.coalesced += 1
+            return last[1]
+        
+        channel = None
+        for candidate in channels:
+            if not candidate.get_busy():
+                channel = candidate
+                break
+        
+        if channel is None:
+            # Steal the least important, longest-playing sound in the group
+            victim = min(channels, key=lambda c: self.playing.get(c, (0, 0.0)))
+            if self.playing.get(victim, (0, 0.0))[0] > priority:
+                self.dropped += 1
+                return None
+            victim.stop()
+            channel = victim
+            self.stolen += 1
+        
+        channel.play(sound, loops=loops)
+        self.playing[channel] = (priority, now)
+        self.last_trigger[sound] = (now, channel)
+        self.played += 1
+        return channel
+    
+    def stats(self):
+        """Counters since the pool was created"""
+        return {
+            'played': self.played,
+            'coalesced': self.coalesced,
+            'stolen': self.stolen,
+            'dropped': self.dropped,
+            'busy': {name: sum(c.get_busy() for c in channels)
+                     for name, channels in self.groups.items()},
+        }
+
+
+class MusicDecks:
+    """
+    Two reserved channels that play fully decoded music tracks.
+    
+    Tracks are decoded ahead of time with preload(); play() then starts
+    the new track on the idle deck while the other fades out, so a
+    transition costs no load and always lasts CROSSFADE_MS. Tracks that
+    weren't preloaded are left to the streaming music player.
+    """
+    
+    def __init__(self, channels):
+        self.channels = channels
+        self.active = 0
+        # Music path -> decoded Sound (None while its worker is decoding)
+        self.tracks = {}
+        self.lock = threading.Lock()
+    
+    def preload(self, music_path):
+        """Start decoding a track on a worker thread (no-op if already known)"""
+        with self.lock:
+            if music_path in self.tracks:
+                return
+            self.tracks[music_path] = None
+        threading.Thread(target=self._decode, args=(music_path,),
+                         name='music-preload', daemon=True).start()
+    
+    def _decode(self, music_path):
+        try:
+            sound = pg.mixer.Sound(music_path)
+        except Exception as e:
+            logger.error(f"Error preloading music {music_path}: {str(e)}")
+            with self.lock:
+                self.tracks.pop(music_path, None)
+            return
+        with self.lock:
+            # release() may have dropped the request while it was decoding
+            if music_path in self.tracks:
+                self.tracks[music_path] = sound
+    
+    def is_ready(self, music_path):
+        return self.tracks.get(music_path) is not None
+    
+    def play(self, music_path, repeat=True, volume=1.0, fade_ms=CROSSFADE_MS):
+        """
+        Crossfade to a preloaded track
+        
+        Returns:
+            bool: False if the track isn't decoded yet
+        """
+        sound = self.tracks.get(music_path)
+        if sound is None:
+            return False
+        outgoing = self.channels[self.active]
+        self.active = (self.active + 1) % len(self.channels)
+        incoming = self.channels[self.active]
+        incoming.set_volume(max(0.0, min(1.0, volume)))
+        incoming.play(sound, loops=-1 if repeat else 0, fade_ms=fade_ms)
+        if outgoing.get_busy():
+            outgoing.fadeout(fade_ms)
+        return True
+    
+    def stop(self, fade_ms=CROSSFADE_MS):
+        for channel in self.channels:
+            if channel.get_busy():
+                channel.fadeout(fade_ms)
+    
+    def release(self, keep=()):
+        """Free decoded tracks other than those in keep and the ones playing"""
+        keep = set(keep)
+        for channel in self.channels:
+            if channel.get_busy():
+                keep.update(path for path, sound in self.tracks.items()
+                            if sound is not None and sound is channel.get_sound())
+        with self.lock:
+            for path in [path for path in self.tracks if path not in keep]:
+                del self.tracks[path]
+
+
+class AudioQueue:
+    """
+    Sound effect commands posted by the game thread and played by a
+    dedicated audio thread, so jumps, attacks and hits never wait on the
+    mixer. Each wake-up drains everything queued, drops duplicates
+    (same sound on the same group) and plays the rest.
+    
+    Without a mixer (headless runs) there is no thread and posted
+    commands are simply dropped.
+    """
+    
+    def __init__(self):
+        self.commands = queue.SimpleQueue()
+        self.posted = 0
+        self.deduped = 0
+        self.thread = None
+        if pg.mixer.get_init():
+            self.thread = threading.Thread(target=self._run, name='audio-commands', daemon=True)
+            self.thread.start()
+    
+    @property
+    def headless(self):
+        return self.thread is None
+    
+    def post(self, sound_name, volume=1.0, group=None, priority=None, repeat=False):
+        """Queue a SoundPlayer.play_sound call; returns immediately"""
+        if self.thread is None:
+            return
+        self.posted += 1
+        self.commands.put((sound_name, volume, group, priority, repeat))
+    
+    def close(self):
+        """Stop the audio thread once it has played what's queued"""
+        if self.thread is not None:
+            self.commands.put(None)
+            self.thread.join(timeout=1.0)
+            self.thread = None
+    
+    def _run(self):
+        while True:
+            batch = [self.commands.get()]
+            while True:
+                try:
+                    batch.append(self.commands.get_nowait())
+                except queue.Empty:
+                    break
+            
+            seen = set()
+            for command in batch:
+                if command is None:
+                    return
+                sound_name, volume, group, priority, repeat = command
+                if (sound_name, group) in seen:
+                    self.deduped += 1
+                    continue
+                seen.add((sound_name, group))
+                SoundPlayer.play_sound(sound_name, repeat, volume, group, priority)
+
+
+class SoundBankLoader(threading.Thread):
+    """
+    Worker thread that decodes a list of sounds into SoundPlayer's cache,
+    so the first hit or jump of a match doesn't decode inside a frame.
+    
+    Progress can be polled from the game thread while it runs, and more
+    sounds can be queued onto a running loader with add().
+    """
+    
+    def __init__(self, sound_names, budget_bytes=SOUND_BANK_BUDGET):
+        """
+        Args:
+            sound_names (iterable): Logical sound names to decode
+            budget_bytes (int): Stop decoding once the cache holds this many bytes
+        """
+        super().__init__(name='sound-bank-loader', daemon=True)
+        self.sound_names = []
+        self.budget_bytes = budget_bytes
+        self.completed = 0
+        self.bytes_loaded = 0
+        self.over_budget = False
+        self.finished = False
+        self.lock = threading.Lock()
+        self.add(sound_names)
+    
+    def add(self, sound_names):
+        """
+        Queue more sounds onto this loader, skipping names already queued
+        
+        Returns:
+            bool: False if the loader has already finished (start a new one)
+        """
+        with self.lock:
+            if self.finished:
+                return False
+            queued = set(self.sound_names)
+            self.sound_names.extend(name for name in sound_names if name not in queued)
+            return True
+    
+    @property
+    def progress(self):
+        """Fraction of the sound list processed, from 0.0 to 1.0"""
+        if not self.sound_names:
+            return 1.0
+        return self.completed / len(self.sound_names)
+    
+    @property
+    def done(self):
+        return self.completed == len(self.sound_names) or self.over_budget
+    
+    def run(self):
+        while True:
+            with self.lock:
+                if self.completed >= len(self.sound_names):
+                    self.finished = True
+                    break
+                sound_name = self.sound_names[self.completed]
+            if SoundPlayer._cache_bytes >= self.budget_bytes:
+                self.over_budget = True
+                logger.warning(f"Sound bank budget of {self.budget_bytes // 1024} KB reached, "
+                               f"{len(self.sound_names) - self.completed} sounds left to load on demand")
+                with self.lock:
+                    self.finished = True
+                break
+            self.bytes_loaded += SoundPlayer.preload_sound(sound_name)
+            self.completed += 1
+        logger.info(f"Sound bank warm-up: {self.completed}/{len(self.sound_names)} sounds, "
+                    f"{self.bytes_loaded // 1024} KB decoded, "
+                    f"{SoundPlayer._cache_bytes // 1024}/{self.budget_bytes // 1024} KB in cache")